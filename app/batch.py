@@ -0,0 +1,164 @@
+"""
+Batch resume ingestion.
+
+Fans text extraction, section splitting and skill extraction for many PDF/DOCX
+files out over a process pool and streams one JSON record per file back in
+completion order.
+
+Usage:
+    python -m app.batch resumes/ more/cv.pdf --workers 8 --chunk-size 16 --output results.jsonl
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from functools import partial
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .nlp.skill_extractor import extract_skills
+from .utils.parse_resume import extract_resume_text, index_resume_sections
+
+SUPPORTED_EXTENSIONS = (".pdf", ".docx")
+
+
+def collect_resume_paths(inputs: Iterable[str]) -> List[str]:
+    """
+    Expand files and directories into a sorted list of resume paths.
+
+    Directories are walked recursively; only PDF and DOCX files are kept.
+    """
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            for root, _, files in os.walk(item):
+                for name in files:
+                    if name.lower().endswith(SUPPORTED_EXTENSIONS):
+                        paths.append(os.path.join(root, name))
+        else:
+            paths.append(item)
+    return sorted(paths)
+
+
+def process_resume_file(
+    path: str,
+    include_text: bool = False,
+    max_pages: Optional[int] = None,
+    max_chars: Optional[int] = None,
+    skill_details: bool = False
+) -> Dict[str, Any]:
+    """
+    Extract text, sections and skills from one resume file.
+
+    Errors are captured in the returned record instead of raised, so one corrupt
+    file never stops a batch.
+
+    Returns:
+        Dictionary with path, sections, skills, elapsed seconds, error and optionally text
+    """
+    started = time.perf_counter()
+    record: Dict[str, Any] = {"path": path}
+    try:
+        # Paths are memory-mapped, so workers never hold a second copy of the file
+        text = extract_resume_text(path, path, max_pages, max_chars)
+        if include_text:
+            record["text"] = text
+        sections = index_resume_sections(text)
+        record["sections"] = sections.to_dict()
+        record["skills"] = extract_skills(text, detailed=skill_details, sections=sections)
+        record["error"] = None
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {str(e)}"
+    record["elapsed"] = round(time.perf_counter() - started, 4)
+    return record
+
+
+def iter_batch_results(
+    inputs: Iterable[str],
+    workers: Optional[int] = None,
+    chunk_size: int = 8,
+    include_text: bool = False,
+    max_pages: Optional[int] = None,
+    max_chars: Optional[int] = None,
+    skill_details: bool = False
+) -> Iterator[Dict[str, Any]]:
+    """
+    Process many resumes in parallel, yielding records as they complete.
+
+    Args:
+        inputs: Files and/or directories to process
+        workers: Number of worker processes (defaults to the CPU count; 1 runs in-process)
+        chunk_size: Paths handed to a worker at a time
+        include_text: Include the extracted text in each record
+        max_pages: Optional PDF page limit per file
+        max_chars: Optional PDF character limit per file
+        skill_details: Include each skill's count, offsets and sections
+
+    Returns:
+        Iterator of per-file records in completion order
+    """
+    paths = collect_resume_paths(inputs)
+    worker = partial(
+        process_resume_file,
+        include_text=include_text,
+        max_pages=max_pages,
+        max_chars=max_chars,
+        skill_details=skill_details
+    )
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(paths) <= 1:
+        for path in paths:
+            yield worker(path)
+        return
+
+    with multiprocessing.Pool(processes=min(workers, len(paths))) as pool:
+        yield from pool.imap_unordered(worker, paths, chunksize=max(1, chunk_size))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point writing JSONL results; exits with 1 if any file failed."""
+    parser = argparse.ArgumentParser(description="Extract text, sections and skills from many resumes in parallel.")
+    parser.add_argument("inputs", nargs="+", help="Resume files or directories containing PDF/DOCX files")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=8, help="Files handed to a worker at a time")
+    parser.add_argument("--output", default="-", help="JSONL output file (default: stdout)")
+    parser.add_argument("--include-text", action="store_true", help="Include the extracted text in each record")
+    parser.add_argument("--max-pages", type=int, default=None, help="Stop reading PDFs after this many pages")
+    parser.add_argument("--max-chars", type=int, default=None, help="Stop reading PDFs after this many characters")
+    parser.add_argument("--skill-details", action="store_true",
+                        help="Include each skill's count, character offsets and sections")
+    args = parser.parse_args(argv)
+
+    output = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    started = time.perf_counter()
+    processed = failed = 0
+    try:
+        for record in iter_batch_results(
+            args.inputs,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            include_text=args.include_text,
+            max_pages=args.max_pages,
+            max_chars=args.max_chars,
+            skill_details=args.skill_details
+        ):
+            output.write(json.dumps(record) + "\n")
+            output.flush()
+            processed += 1
+            if record["error"]:
+                failed += 1
+                print(f"Error processing {record['path']}: {record['error']}", file=sys.stderr)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    elapsed = time.perf_counter() - started
+    rate = processed / elapsed if elapsed else 0.0
+    print(f"Processed {processed} files ({failed} failed) in {elapsed:.1f}s - {rate:.1f} files/s", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,10 +2,11 @@ import streamlit as st
 import io
 import os
 import base64
-from utils.parse_resume import extract_resume_text, extract_resume_sections
+from utils.parse_resume import extract_resume_cached, index_resume_sections
+from utils.upload_guard import UploadRejectedError
 # Now we can directly import the extract_skills function
 from nlp.skill_extractor import extract_skills
-from utils.ai_services import AIProvider, analyze_resume_with_ai, get_job_match_analysis, AIServiceError, get_available_models
+from utils.ai_services import AIProvider, analyze_resume_with_ai_stream, get_job_match_analysis_stream, AIServiceError, get_available_models
 from utils.report_generator import generate_analysis_report
 
 # Initialize session state variables if they don't exist
@@ -84,6 +85,28 @@ if "system_prompt" not in st.session_state:
     )
 if "selected_model" not in st.session_state:
     st.session_state.selected_model = None
+# Upper bounds for PDF extraction; pages past these limits are never parsed
+MAX_RESUME_PAGES = 50
+MAX_RESUME_CHARS = 200000
+
+if "processed_file_id" not in st.session_state:
+    st.session_state.processed_file_id = None
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def extract_skills_cached(text):
+    """Extract skills once per distinct resume text, shared across sessions."""
+    return extract_skills(text)
+
+def render_stream(stream):
+    """Render analysis chunks as they arrive and return the final result dict."""
+    placeholder = st.empty()
+    streamed_parts = []
+    for chunk in stream:
+        streamed_parts.append(chunk)
+        placeholder.markdown("".join(streamed_parts) + "▌")
+    # The formatted result card below replaces the raw streamed text
+    placeholder.empty()
+    return stream.result
 
 # Set page config
 st.set_page_config(
@@ -386,18 +409,30 @@ with tabs[0]:
     if uploaded_file:
         with st.spinner("Extracting text from your resume..."):
             try:
-                # Extract text from resume
-                resume_text = extract_resume_text(uploaded_file, uploaded_file.name)
+                # Only run the extraction pipeline when a different file is uploaded;
+                # other reruns (button clicks, typing) redraw from session state.
+                # Identical bytes under a new upload id are served by the content-hash cache.
+                if st.session_state.processed_file_id != uploaded_file.file_id:
+                    resume_text, resume_sections = extract_resume_cached(
+                        uploaded_file,
+                        uploaded_file.name,
+                        max_pages=MAX_RESUME_PAGES,
+                        max_chars=MAX_RESUME_CHARS,
+                        guarded=True
+                    )
+                    
+                    if resume_text:
+                        st.session_state.resume_text = resume_text
+                        st.session_state.extracted_sections = resume_sections
+                        
+                        # Extract skills using NLP
+                        st.session_state.extracted_skills = extract_skills_cached(resume_text)
+                        
+                        st.session_state.processed_file_id = uploaded_file.file_id
+                else:
+                    resume_text = st.session_state.resume_text
                 
                 if resume_text:
-                    st.session_state.resume_text = resume_text
-                    
-                    # Extract resume sections
-                    st.session_state.extracted_sections = extract_resume_sections(resume_text)
-                    
-                    # Extract skills using NLP
-                    st.session_state.extracted_skills = extract_skills(resume_text)
-                    
                     st.success(f"Successfully processed: {uploaded_file.name}")
                     
                     # Show extracted text and skills in expandable sections
@@ -433,6 +468,8 @@ with tabs[0]:
                     
                 else:
                     st.warning("No text could be extracted from this file. Please upload a text-based PDF or DOCX.")
+            except UploadRejectedError as e:
+                st.error(f"File rejected: {str(e)}")
             except Exception as e:
                 st.error(f"Error processing file: {str(e)}")
                 st.warning("Please make sure your file is a valid PDF or DOCX.")
@@ -491,9 +528,11 @@ with tabs[0]:
             """
             
             st.session_state.resume_text = sample_text
+            # The sample replaces any upload, so uploading that file again must re-extract it
+            st.session_state.processed_file_id = None
             
             # Extract resume sections
-            st.session_state.extracted_sections = extract_resume_sections(sample_text)
+            st.session_state.extracted_sections = index_resume_sections(sample_text)
             
             # Extract skills using NLP
             st.session_state.extracted_skills = extract_skills(sample_text)
@@ -545,10 +584,10 @@ with tabs[1]:
             st.warning(f"Please configure your {st.session_state.ai_provider} API key in the Settings tab.")
         else:
             if st.button("Analyze My Resume", type="primary"):
-                with st.spinner("Analyzing your resume with AI..."):
-                    try:
-                        # Get AI analysis
-                        analysis_result = analyze_resume_with_ai(
+                try:
+                    # Stream the AI analysis so text shows up as soon as the provider starts answering
+                    with st.spinner("Analyzing your resume with AI..."):
+                        analysis_stream = analyze_resume_with_ai_stream(
                             resume_text=st.session_state.resume_text,
                             provider=st.session_state.ai_provider,
                             api_key=st.session_state.api_key,
@@ -557,14 +596,14 @@ with tabs[1]:
                             extracted_skills=st.session_state.extracted_skills,
                             extracted_sections=st.session_state.extracted_sections
                         )
-                        
-                        # Save result to session state
-                        st.session_state.analysis_result = analysis_result
-                        
-                        st.toast("Analysis complete!", icon="✅")
-                    except AIServiceError as e:
-                        st.error(f"AI Service Error: {str(e)}")
-                        st.warning("Please check your API key and settings.")
+                    
+                    # Save result to session state
+                    st.session_state.analysis_result = render_stream(analysis_stream)
+                    
+                    st.toast("Analysis complete!", icon="✅")
+                except AIServiceError as e:
+                    st.error(f"AI Service Error: {str(e)}")
+                    st.warning("Please check your API key and settings.")
         
         # Display analysis result if available
         if st.session_state.analysis_result:
@@ -576,6 +615,8 @@ with tabs[1]:
             tokens_used = st.session_state.analysis_result.get("tokens_used")
             if tokens_used:
                 st.markdown(f'<span class="badge" style="background:#27ae60;">Tokens: {tokens_used}</span>', unsafe_allow_html=True)
+            if st.session_state.analysis_result.get("cached"):
+                st.markdown('<span class="badge" style="background:#6c757d;">Cached</span>', unsafe_allow_html=True)
             st.markdown('<hr style="margin:1rem 0;">', unsafe_allow_html=True)
             # Parse and display sections
             analysis_text = st.session_state.analysis_result.get("analysis", "No analysis available.")
@@ -648,24 +689,24 @@ with tabs[2]:
             st.info("Paste a job description above to analyze your match.")
         else:
             if st.button("Analyze Match", type="primary"):
-                with st.spinner("Analyzing how well your resume matches this job..."):
-                    try:
-                        # Get job match analysis
-                        job_match_result = get_job_match_analysis(
+                try:
+                    # Stream the job match analysis as it is generated
+                    with st.spinner("Analyzing how well your resume matches this job..."):
+                        job_match_stream = get_job_match_analysis_stream(
                             resume_text=st.session_state.resume_text,
                             job_description=job_description,
                             provider=st.session_state.ai_provider,
                             api_key=st.session_state.api_key,
                             model_id=st.session_state.selected_model
                         )
-                        
-                        # Save result to session state
-                        st.session_state.job_match_result = job_match_result
-                        
-                        st.toast("Job match analysis complete!", icon="🎯")
-                    except AIServiceError as e:
-                        st.error(f"AI Service Error: {str(e)}")
-                        st.warning("Please check your API key and settings.")
+                    
+                    # Save result to session state
+                    st.session_state.job_match_result = render_stream(job_match_stream)
+                    
+                    st.toast("Job match analysis complete!", icon="🎯")
+                except AIServiceError as e:
+                    st.error(f"AI Service Error: {str(e)}")
+                    st.warning("Please check your API key and settings.")
         
         # Display job match result if available
         if st.session_state.job_match_result:
@@ -677,6 +718,8 @@ with tabs[2]:
             tokens_used = st.session_state.job_match_result.get("tokens_used")
             if tokens_used:
                 st.markdown(f'<span class="badge" style="background:#27ae60;">Tokens: {tokens_used}</span>', unsafe_allow_html=True)
+            if st.session_state.job_match_result.get("cached"):
+                st.markdown('<span class="badge" style="background:#6c757d;">Cached</span>', unsafe_allow_html=True)
             st.markdown('<hr style="margin:1rem 0;">', unsafe_allow_html=True)
             analysis_text = st.session_state.job_match_result.get("analysis", "No analysis available.")
             import re
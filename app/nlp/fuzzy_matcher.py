@@ -0,0 +1,258 @@
+import re
+from functools import lru_cache
+from itertools import accumulate
+from operator import add
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+from .skill_matcher import TokenTrie
+
+# Runs of letters and digits; fuzzy matching compares these words. The group
+# makes split() return the words between the separators
+_WORD = re.compile(r"([^\W_]+)")
+
+# Words of multi-word keywords are corrected from this length; the rest of the
+# keyword has to follow, which keeps shorter corrections safe
+_PHRASE_WORD_MIN_LENGTH = 5
+
+# Pieces of a word split by bad PDF text need at least this many characters, so
+# prose such as "a i" or "re st" never becomes a skill; shorter pieces only join
+# when they are whole words of the keyword ("git lab ci" for "gitlab ci")
+_FRAGMENT_MIN_LENGTH = 3
+
+
+def _deletes(word: str, distance: int) -> Set[str]:
+    """Return the word and every string obtained by deleting up to distance characters."""
+    found = {word}
+    frontier = {word}
+    for _ in range(distance):
+        frontier = {candidate[:index] + candidate[index + 1:] for candidate in frontier for index in range(len(candidate))}
+        found |= frontier
+    return found
+
+
+def _positions(items: List[str], wanted: Iterable[str]) -> List[int]:
+    """Return the positions of a few wanted values in a list, letting list.index do the scanning."""
+    found = []
+    for value in wanted:
+        index = -1
+        try:
+            while True:
+                index = items.index(value, index + 1)
+                found.append(index)
+        except ValueError:
+            pass
+    return found
+
+
+def edit_distance(first: str, second: str, limit: int) -> int:
+    """
+    Optimal string alignment distance between two strings, stopping early.
+
+    Insertions, deletions, substitutions and transpositions of adjacent
+    characters each cost one edit. Returns limit + 1 as soon as the distance
+    is known to exceed limit.
+    """
+    if abs(len(first) - len(second)) > limit:
+        return limit + 1
+    # A shared prefix or suffix never needs an edit, so only the middle goes through the table
+    prefix = 0
+    while prefix < len(first) and prefix < len(second) and first[prefix] == second[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < len(first) - prefix and suffix < len(second) - prefix and first[-1 - suffix] == second[-1 - suffix]:
+        suffix += 1
+    first, second = first[prefix:len(first) - suffix], second[prefix:len(second) - suffix]
+    previous_row = None
+    row = list(range(len(second) + 1))
+    for i in range(1, len(first) + 1):
+        before_previous, previous_row = previous_row, row
+        row = [i] + [0] * len(second)
+        row_minimum = i
+        for j in range(1, len(second) + 1):
+            cost = 0 if first[i - 1] == second[j - 1] else 1
+            value = min(previous_row[j] + 1, row[j - 1] + 1, previous_row[j - 1] + cost)
+            if i > 1 and j > 1 and first[i - 1] == second[j - 2] and first[i - 2] == second[j - 1]:
+                value = min(value, before_previous[j - 2] + 1)
+            row[j] = value
+            row_minimum = min(row_minimum, value)
+        if row_minimum > limit:
+            return limit + 1
+    return min(row[-1], limit + 1)
+
+
+class FuzzySkillMatcher:
+    """
+    Approximate keyword matcher for misspelled and split words.
+
+    Two kinds of damage are recognized:
+
+    * Typos ("javscript", "machne learning"). Every word of the text is
+      corrected to the closest word of any keyword through a symmetric-delete
+      (SymSpell) index: keyword words are stored under each string obtained by
+      deleting up to their allowed number of characters, and a text word is
+      looked up under its own deletes, so a correction costs a number of
+      dictionary probes that depends on the word's length rather than on the
+      number of keywords. Corrections are memoized per word, which makes them
+      nearly free once a worker has seen a resume's everyday vocabulary. The
+      corrected words are then matched exactly with a token trie.
+    * Words split or merged by bad PDF text ("kuber netes", "datascience").
+      Consecutive words joined without spaces are compared with the keywords
+      without spaces, and a prefix set stops the walk at the first word that
+      cannot continue any keyword. Pieces shorter than three characters only
+      count when they are whole words of the keyword.
+
+    Confidence is 1 minus the number of edits (a split or merge counts as one)
+    divided by the keyword's length. Typos in single-word keywords need at
+    least min_length characters; words of longer keywords are corrected from
+    five, since the rest of the keyword has to follow. Only keywords made of
+    letters, digits and spaces take part; punctuated ones ("c++", "node.js")
+    are left to exact matching.
+
+    Args:
+        keywords: Keywords to match (lowercase)
+        max_distance: Largest number of typo edits for long words
+        min_length: Single-word keywords shorter than this only match exactly
+        cache_size: Number of distinct words whose corrections are memoized
+    """
+
+    def __init__(self, keywords: Iterable[str], max_distance: int = 2, min_length: int = 7, cache_size: int = 65536):
+        self.max_distance = max_distance
+        self.min_length = min_length
+        self._deletes: Dict[str, List[str]] = {}
+        self._compact: Dict[str, str] = {}
+        self._compact_prefixes: Set[str] = set()
+        self._merged: Set[str] = set()
+
+        phrases: List[str] = []
+        keyword_words: Set[str] = set()
+        for keyword in keywords:
+            words = keyword.split()
+            if not words or not all(word.isalnum() for word in words):
+                continue
+            phrases.append(keyword)
+            keyword_words.update(words)
+            compact = "".join(words)
+            self._compact.setdefault(compact, keyword)
+            if len(words) > 1:
+                self._merged.add(compact)
+            for end in range(1, len(compact) + 1):
+                self._compact_prefixes.add(compact[:end])
+
+        self._keyword_words = frozenset(keyword_words)
+        for word in sorted(keyword_words):
+            for deleted in _deletes(word, self.allowed_distance(len(word))):
+                self._deletes.setdefault(deleted, []).append(word)
+        self._trie = TokenTrie(phrases)
+
+        self.correct = lru_cache(maxsize=cache_size)(self._correct)
+
+    def __len__(self) -> int:
+        return len(self._trie)
+
+    def allowed_distance(self, length: int) -> int:
+        """Return how many typo edits a word of this length may differ by."""
+        if length < min(_PHRASE_WORD_MIN_LENGTH, self.min_length):
+            return 0
+        return min(self.max_distance, 1 if length < 2 * self.min_length else 2)
+
+    def _correct(self, word: str) -> Tuple[str, int]:
+        """Return the closest keyword word to a word and its distance, or the word itself."""
+        distance_limit = self.allowed_distance(len(word))
+        if not distance_limit or word in self._keyword_words:
+            return word, 0
+        best_word, best_distance = word, distance_limit + 1
+        seen = set()
+        for deleted in _deletes(word, distance_limit):
+            for candidate in self._deletes.get(deleted, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                limit = min(distance_limit, self.allowed_distance(len(candidate)))
+                distance = edit_distance(word, candidate, limit)
+                if distance <= limit and (distance, candidate) < (best_distance, best_word):
+                    best_word, best_distance = candidate, distance
+        return (best_word, best_distance) if best_distance <= distance_limit else (word, 0)
+
+    @staticmethod
+    def _fragments_allowed(keyword: str, pieces: List[str]) -> bool:
+        """Check that every piece shorter than _FRAGMENT_MIN_LENGTH is a whole word of the keyword."""
+        boundaries = {0}
+        boundaries.update(accumulate(len(word) for word in keyword.split()))
+        end = 0
+        for piece in pieces:
+            start, end = end, end + len(piece)
+            if len(piece) < _FRAGMENT_MIN_LENGTH and (start not in boundaries or end not in boundaries):
+                return False
+        return True
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, str, float]]:
+        """
+        Yield keywords that occur in the text only with typos, splits or merges.
+
+        Exact occurrences are not reported; they are left to the exact matchers.
+
+        Args:
+            text: The text to scan (callers lowercase it first)
+
+        Returns:
+            Iterator of (start, end, keyword, confidence) tuples with character offsets
+        """
+        # Splitting on words keeps the separators, so character offsets are running sums of part lengths
+        parts = _WORD.split(text)
+        words = parts[1::2]
+        offsets: List[int] = []
+
+        def span(first: int, last: int) -> Tuple[int, int]:
+            # Offsets are only needed for hits, which are rare, so they are summed on the first one
+            if not offsets:
+                offsets.extend(accumulate(map(len, parts)))
+            return offsets[2 * first], offsets[2 * last - 1]
+
+        # Typos: exact keyword matches over the corrected words. Each distinct word is
+        # corrected once; short and already known words never are.
+        distinct = set(words)
+        shortest_corrected = min(_PHRASE_WORD_MIN_LENGTH, self.min_length)
+        typo_words: Dict[str, Tuple[str, int]] = {}
+        for word in distinct - self._keyword_words:
+            if len(word) >= shortest_corrected:
+                correction = self.correct(word)
+                if correction[1]:
+                    typo_words[word] = correction
+        if typo_words:
+            typos = {index: typo_words[words[index]] for index in _positions(words, typo_words)}
+            corrected = list(words)
+            for index, (word, _) in typos.items():
+                corrected[index] = word
+            # A keyword containing a corrected word starts at most max_tokens - 1 words before it
+            reach = self._trie.max_tokens - 1
+            starts = sorted({start for index in typos for start in range(max(0, index - reach), index + 1)})
+            for first, last, keyword in self._trie.iter_matches(corrected, starts):
+                distance = sum(typos[index][1] for index in range(first, last) if index in typos)
+                if distance and (last - first > 1 or len(words[first]) >= self.min_length):
+                    yield (*span(first, last), keyword, 1 - distance / len(keyword))
+
+        # Splits and merges: consecutive words spelling a keyword once spaces are ignored.
+        # A walk can only hit from a word that merges a keyword's words or that joins
+        # the next word into a keyword prefix, so only those words start one.
+        compact, compact_prefixes = self._compact, self._compact_prefixes
+        pairs = list(map(add, words, words[1:]))
+        merges = distinct & self._merged
+        joins = compact_prefixes.intersection(pairs)
+        starts = set()
+        if merges:
+            starts.update(index for index, word in enumerate(words) if word in merges)
+        if joins:
+            starts.update(index for index, pair in enumerate(pairs) if pair in joins)
+        count = len(words)
+        for first in sorted(starts):
+            joined = words[first]
+            last = first + 1
+            while joined in compact_prefixes:
+                keyword = compact.get(joined)
+                if keyword is not None:
+                    edits = abs((last - first) - (keyword.count(" ") + 1))
+                    if edits and self._fragments_allowed(keyword, words[first:last]):
+                        yield (*span(first, last), keyword, 1 - edits / len(keyword))
+                if last == count:
+                    break
+                joined += words[last]
+                last += 1
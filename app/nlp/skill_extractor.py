@@ -1,27 +1,86 @@
 import re
-from typing import List, Dict, Set
+from bisect import bisect_right
+from typing import Any, List, Dict, Iterable, Iterator, Set, Optional, Tuple, Callable
+import importlib.util
 import os
+import threading
+from .fuzzy_matcher import FuzzySkillMatcher
+from .skill_matcher import SkillMatcher, TokenTrie
+from .skill_taxonomy import SOFT, TECHNICAL, SkillIndex, default_skill_index
 
-# Flag to track NLP libraries availability
-NLP_LIBRARIES_AVAILABLE = True
+# Flag to track NLP libraries availability. Only checks that the packages are
+# installed; they are imported lazily on first use so importing this module stays
+# fast and never touches the network.
+NLP_LIBRARIES_AVAILABLE = (
+    importlib.util.find_spec("nltk") is not None
+    and importlib.util.find_spec("spacy") is not None
+)
 
-# Try to import NLP libraries, but don't fail if they aren't available
-try:
-    import spacy
-    import nltk
-    from nltk.tokenize import word_tokenize
-    from nltk.corpus import stopwords
-    
-    # Download NLTK resources on first run
+SPACY_MODEL_NAME = "en_core_web_sm"
+
+# Model components no skill extraction uses; they are never loaded
+SPACY_EXCLUDED_PIPES = ["lemmatizer"]
+
+# Environment variable with the minimum confidence of fuzzy skill matches for the shared extractor
+FUZZY_SKILLS_ENV_VAR = "RESUME_FUZZY_SKILLS"
+
+# Fuzzy matching builds an in-memory index in every process (about 4 KB and 0.2 ms
+# per skill), so taxonomies with more skills than this are matched exactly only
+FUZZY_MAX_SKILLS = 20000
+
+_nlp_lock = threading.Lock()
+_nltk_tools = None
+_nltk_loaded = False
+_spacy_model = None
+_spacy_loaded = False
+_reported_warnings: Set[str] = set()
+
+def _warn_once(message: str) -> None:
+    """Print a warning about missing NLP resources only the first time it occurs."""
+    if message not in _reported_warnings:
+        _reported_warnings.add(message)
+        print(f"Warning: {message}")
+
+def default_fuzzy_confidence() -> float:
+    """Read RESUME_FUZZY_SKILLS, returning 0 (fuzzy matching disabled) if it is unset or invalid."""
+    value = os.environ.get(FUZZY_SKILLS_ENV_VAR, "0")
     try:
-        nltk.data.find('tokenizers/punkt')
-        nltk.data.find('corpora/stopwords')
-    except LookupError:
-        nltk.download('punkt')
-        nltk.download('stopwords')
-except ImportError:
-    NLP_LIBRARIES_AVAILABLE = False
-    print("Warning: NLP libraries (spaCy and/or NLTK) not available. Using regex-based skill extraction only.")
+        confidence = float(value)
+    except ValueError:
+        confidence = float("nan")
+    if not 0 <= confidence <= 1:
+        print(f"Warning: {FUZZY_SKILLS_ENV_VAR} must be a number from 0 to 1, not '{value}'. Fuzzy skill matching is disabled.")
+        return 0.0
+    return confidence
+
+def _get_nltk_tools() -> Optional[Tuple[Callable[[str], List[str]], Set[str]]]:
+    """
+    Import NLTK on first use and return (word_tokenize, stop_words).
+    
+    Returns None when NLTK or its punkt/stopwords data is missing. Data is never
+    downloaded here; install it ahead of time with
+    ``python -m nltk.downloader punkt punkt_tab stopwords``.
+    """
+    global _nltk_tools, _nltk_loaded
+    if _nltk_loaded:
+        return _nltk_tools
+    
+    with _nlp_lock:
+        if _nltk_loaded:
+            return _nltk_tools
+        try:
+            from nltk.tokenize import word_tokenize
+            from nltk.corpus import stopwords
+            
+            # Probe both resources so a missing download is detected up front
+            word_tokenize("probe")
+            _nltk_tools = (word_tokenize, set(stopwords.words('english')))
+        except ImportError:
+            _warn_once("NLP libraries (spaCy and/or NLTK) not available. Using regex-based skill extraction only.")
+        except LookupError:
+            _warn_once("NLTK data (punkt/stopwords) not installed. Using regex-based skill extraction only.")
+        _nltk_loaded = True
+    return _nltk_tools
 
 # Common technical skills - this is a starter list
 COMMON_TECH_SKILLS = {
@@ -73,125 +132,632 @@ BUSINESS_SKILLS = {
 
 # Load spaCy model
 def load_nlp_model():
-    """Load the spaCy NLP model if available."""
+    """
+    Load the spaCy NLP model if available.
+    
+    The model is loaded once and reused. It is never downloaded at runtime; install
+    it ahead of time with ``python -m spacy download en_core_web_sm``.
+    """
+    global _spacy_model, _spacy_loaded
     if not NLP_LIBRARIES_AVAILABLE:
         return None
-        
-    try:
-        # Try to load the model
-        nlp = spacy.load("en_core_web_sm")
-    except OSError:
-        # If model not found, download it
-        try:
-            os.system("python -m spacy download en_core_web_sm")
-            nlp = spacy.load("en_core_web_sm")
-        except:
-            print("Warning: Could not download spaCy model. Using regex-based skill extraction only.")
-            return None
-    return nlp
+    if _spacy_loaded:
+        return _spacy_model
+    
+    with _nlp_lock:
+        if not _spacy_loaded:
+            try:
+                import spacy
+                _spacy_model = spacy.load(SPACY_MODEL_NAME, exclude=SPACY_EXCLUDED_PIPES)
+            except ImportError:
+                _warn_once("spaCy is not available.")
+            except OSError:
+                _warn_once(f"spaCy model '{SPACY_MODEL_NAME}' is not installed.")
+            _spacy_loaded = True
+    return _spacy_model
 
-def extract_skills_with_nlp(text: str) -> Dict[str, List[str]]:
-    """Extract skills using NLP libraries if available."""
-    # Convert text to lowercase for matching
+# Character offsets of each skill found, collected in detailed mode
+Occurrences = Dict[str, Set[Tuple[int, int]]]
+
+def lower_text(text: str) -> str:
+    """
+    Lowercase text without changing its length, so offsets into the result index text.
+    
+    A character whose lowercase form is longer keeps only its first character:
+    "İ" becomes "i" rather than str.lower's "i" plus a combining dot. Skills
+    next to it match as they do in the rest of the text ("aİ" yields "ai"),
+    but a word spelled with it now reads as one word ("İstanbul" is
+    "istanbul", where str.lower splits it at the non-word dot).
+    """
     text_lower = text.lower()
+    if len(text_lower) == len(text):
+        return text_lower
+    return "".join(char.lower()[0] for char in text)
+
+# Phrases that introduce a list of skills; the captured list is split into candidates
+SKILL_CANDIDATE_PATTERNS = [
+    # Programming language pattern
+    r'(?:proficient in|experience with|skilled in|knowledge of|familiar with)\s+([A-Za-z0-9, \.+#]+)',
+    # Skills section pattern
+    r'(?:technical skills|skills|technical expertise|languages|programming languages)[:\s]*([A-Za-z0-9, \.+#]+)'
+]
+
+class SkillExtractor:
+    """
+    Reusable skill extractor with every index built once.
     
-    # Tokenize text
-    stop_words = set(stopwords.words('english'))
-    tokens = word_tokenize(text_lower)
+    The Aho-Corasick matcher, the token trie and the candidate patterns are
+    compiled in the constructor, and NLTK's tokenizer and stop words are loaded
+    once per process, so extracting from many resumes only pays for scanning
+    their text.
     
-    # Filter out stop words and punctuation
-    filtered_tokens = [token for token in tokens if token.isalnum() and token not in stop_words]
+    With a taxonomy, skills are looked up in its compiled index instead, which
+    needs no per-process build however large the taxonomy is, and aliases are
+    reported under their canonical names.
     
-    # Extract n-grams (1, 2, and 3-grams)
-    unigrams = filtered_tokens
-    bigrams = [unigrams[i] + " " + unigrams[i+1] for i in range(len(unigrams)-1)]
-    trigrams = [unigrams[i] + " " + unigrams[i+1] + " " + unigrams[i+2] for i in range(len(unigrams)-2)]
+    A fuzzy_confidence above 0 adds a fuzzy matching stage for skills that
+    bad PDF text garbles ("Kuber netes", "javscript"). Its in-memory index
+    covers the skill names (not taxonomy aliases) and is built in every
+    process, so it is skipped, with a warning, for taxonomies of more than
+    FUZZY_MAX_SKILLS skills.
     
-    all_ngrams = unigrams + bigrams + trigrams
+    Args:
+        tech_skills: Known technical skills (lowercase)
+        soft_skills: Known soft and business skills (lowercase)
+        use_nlp: Tokenize with NLTK as well; None uses it whenever it is installed
+        taxonomy: Compiled skill taxonomy to use instead of tech_skills and soft_skills
+        fuzzy_confidence: Minimum confidence of fuzzy matches (0 disables fuzzy matching)
+    """
     
-    # Match against skill lists
-    tech_skills = set()
-    soft_skills = set()
+    def __init__(
+        self,
+        tech_skills: Iterable[str] = COMMON_TECH_SKILLS,
+        soft_skills: Iterable[str] = BUSINESS_SKILLS,
+        use_nlp: Optional[bool] = None,
+        taxonomy: Optional[SkillIndex] = None,
+        fuzzy_confidence: float = 0.0
+    ):
+        self.use_nlp = use_nlp
+        self.taxonomy = taxonomy
+        self.fuzzy_confidence = fuzzy_confidence
+        self.tech_skills = frozenset(tech_skills) if taxonomy is None else frozenset()
+        self.soft_skills = frozenset(soft_skills) if taxonomy is None else frozenset()
+        
+        self.matcher: Optional[SkillMatcher] = None
+        self.token_trie: Optional[TokenTrie] = None
+        if taxonomy is None:
+            all_skills = sorted(self.tech_skills | self.soft_skills)
+            # Single automaton over both dictionaries for whole-word matches in the text
+            self.matcher = SkillMatcher(all_skills)
+            # Token trie over the same skills for the NLP path, which matches whole tokens
+            self.token_trie = TokenTrie(all_skills)
+        self._candidate_patterns = [re.compile(pattern) for pattern in SKILL_CANDIDATE_PATTERNS]
+        self._candidate_separator = re.compile(r'[,;/]')
+        
+        self.fuzzy_matcher: Optional[FuzzySkillMatcher] = None
+        if fuzzy_confidence > 0 and taxonomy is not None and len(taxonomy) > FUZZY_MAX_SKILLS:
+            _warn_once(f"Fuzzy skill matching is disabled for taxonomies of more than {FUZZY_MAX_SKILLS} skills.")
+        elif fuzzy_confidence > 0:
+            skill_names = self.taxonomy.skill_names() if taxonomy is not None else all_skills
+            self.fuzzy_matcher = FuzzySkillMatcher(skill_names)
     
-    for term in all_ngrams:
-        if term in COMMON_TECH_SKILLS:
-            tech_skills.add(term)
-        if term in BUSINESS_SKILLS:
-            soft_skills.add(term)
+    def _nltk_tools(self) -> Optional[Tuple[Callable[[str], List[str]], Set[str]]]:
+        """Return NLTK's (word_tokenize, stop_words) if this extractor tokenizes with it."""
+        if self.use_nlp is False or (self.use_nlp is None and not NLP_LIBRARIES_AVAILABLE):
+            return None
+        return _get_nltk_tools()
     
-    return tech_skills, soft_skills
-
-def extract_skills_with_regex(text: str) -> Dict[str, List[str]]:
-    """Extract skills using regex patterns when NLP libraries aren't available."""
-    # Convert text to lowercase for matching
-    text_lower = text.lower()
+    def is_known(self, name: str) -> bool:
+        """Return whether a lowercase name is a known skill (or, with a taxonomy, a skill or alias)."""
+        if self.taxonomy is None:
+            return name in self.tech_skills or name in self.soft_skills
+        return self.taxonomy.lookup(name) is not None
+    
+    def _split_skills(self, found_skills: Set[str], tech_skills: Set[str], soft_skills: Set[str]) -> None:
+        """Add known skills to the technical and soft skill sets they belong to."""
+        tech_skills.update(found_skills & self.tech_skills)
+        soft_skills.update(found_skills & self.soft_skills)
+    
+    def _add_matches(
+        self,
+        matches: Iterable[Tuple[int, int, str]],
+        tech_skills: Set[str],
+        soft_skills: Set[str],
+        occurrences: Optional[Occurrences]
+    ) -> None:
+        """Add matched built-in skills to their sets, recording their offsets if asked to."""
+        if occurrences is None:
+            self._split_skills({name for _, _, name in matches}, tech_skills, soft_skills)
+            return
+        found_skills = set()
+        for start, end, name in matches:
+            found_skills.add(name)
+            occurrences.setdefault(name, set()).add((start, end))
+        self._split_skills(found_skills, tech_skills, soft_skills)
+    
+    def _add_taxonomy_matches(
+        self,
+        matches: Iterable[Tuple[int, int, int]],
+        tech_skills: Set[str],
+        soft_skills: Set[str],
+        occurrences: Optional[Occurrences]
+    ) -> None:
+        """Add the canonical names of matched taxonomy skills to their sets, recording offsets if asked to."""
+        spans_by_skill: Dict[int, List[Tuple[int, int]]] = {}
+        for start, end, skill_id in matches:
+            spans_by_skill.setdefault(skill_id, []).append((start, end))
+        for skill_id, spans in spans_by_skill.items():
+            name = self.taxonomy.skill_name(skill_id)
+            flags = self.taxonomy.skill_flags(skill_id)
+            if flags & TECHNICAL:
+                tech_skills.add(name)
+            if flags & SOFT:
+                soft_skills.add(name)
+            if occurrences is not None:
+                occurrences.setdefault(name, set()).update(spans)
+    
+    def add_candidate(
+        self,
+        candidate: str,
+        start: int,
+        tech_skills: Set[str],
+        soft_skills: Set[str],
+        occurrences: Optional[Occurrences]
+    ) -> None:
+        """
+        Add a candidate phrase found at start in the text if it names a known skill.
+        
+        Unknown candidates were once kept when capitalized, which the lowercased
+        text never is, so they are ignored.
+        """
+        if self.taxonomy is None:
+            name = candidate
+            # Check if it's a known tech skill
+            if candidate in self.tech_skills:
+                tech_skills.add(candidate)
+            elif candidate in self.soft_skills:
+                soft_skills.add(candidate)
+            else:
+                return
+        else:
+            skill_id = self.taxonomy.lookup(candidate)
+            if skill_id is None:
+                return
+            name = self.taxonomy.skill_name(skill_id)
+            flags = self.taxonomy.skill_flags(skill_id)
+            if flags & TECHNICAL:
+                tech_skills.add(name)
+            elif flags & SOFT:
+                soft_skills.add(name)
+        
+        if occurrences is not None:
+            occurrences.setdefault(name, set()).add((start, start + len(candidate)))
     
-    tech_skills = set()
-    soft_skills = set()
+    def match_tokens(
+        self,
+        text_lower: str,
+        tech_skills: Set[str],
+        soft_skills: Set[str],
+        occurrences: Optional[Occurrences] = None
+    ) -> bool:
+        """
+        Add skills found in NLTK's tokens of the lowercased text.
+        
+        Stop words and punctuation tokens are dropped first, so multi-word skills
+        also match across them. Returns False without matching when NLTK is unavailable.
+        """
+        nltk_tools = self._nltk_tools()
+        if nltk_tools is None:
+            return False
+        word_tokenize, stop_words = nltk_tools
+        tokens = word_tokenize(text_lower)
+        
+        # Filter out stop words and punctuation
+        token_spans = None
+        if occurrences is None:
+            filtered_tokens = [token for token in tokens if token.isalnum() and token not in stop_words]
+        else:
+            # Locate each token while tokens are filtered. Words are kept verbatim by the
+            # tokenizer; rewritten punctuation such as quotes is not found and is skipped.
+            filtered_tokens = []
+            token_spans = []
+            position = 0
+            for token in tokens:
+                start = text_lower.find(token, position)
+                if start == -1:
+                    continue
+                position = start + len(token)
+                if token.isalnum() and token not in stop_words:
+                    filtered_tokens.append(token)
+                    token_spans.append((start, position))
+        
+        self.match_token_list(filtered_tokens, tech_skills, soft_skills, occurrences, token_spans)
+        return True
     
-    # Look for exact matches in the original text
-    for skill in COMMON_TECH_SKILLS:
-        if re.search(r'\b' + re.escape(skill) + r'\b', text_lower):
-            tech_skills.add(skill)
+    def match_token_list(
+        self,
+        tokens: List[str],
+        tech_skills: Set[str],
+        soft_skills: Set[str],
+        occurrences: Optional[Occurrences] = None,
+        token_spans: Optional[List[Tuple[int, int]]] = None
+    ) -> None:
+        """
+        Add skills found in already filtered, lowercased tokens.
+        
+        In detailed mode, token_spans gives the character offsets of each token.
+        """
+        # Match skills of any number of words in one walk over the tokens
+        if self.taxonomy is None:
+            matches = self.token_trie.iter_matches(tokens)
+        else:
+            matches = self.taxonomy.iter_token_matches(tokens)
+        if occurrences is not None:
+            # Token indexes become character offsets
+            matches = ((token_spans[first][0], token_spans[last - 1][1], skill) for first, last, skill in matches)
+        
+        if self.taxonomy is None:
+            self._add_matches(matches, tech_skills, soft_skills, occurrences)
+        else:
+            self._add_taxonomy_matches(matches, tech_skills, soft_skills, occurrences)
+    
+    def match_text(
+        self,
+        text_lower: str,
+        tech_skills: Set[str],
+        soft_skills: Set[str],
+        occurrences: Optional[Occurrences] = None
+    ) -> None:
+        """Add whole-word skill matches and skill list candidates from the lowercased text."""
+        # Look for exact whole-word matches of every known skill in one pass
+        if self.taxonomy is None:
+            self._add_matches(self.matcher.iter_matches(text_lower), tech_skills, soft_skills, occurrences)
+        else:
+            self._add_taxonomy_matches(self.taxonomy.iter_text_matches(text_lower), tech_skills, soft_skills, occurrences)
+        
+        # Try to extract programming languages, frameworks, and tools using patterns
+        for pattern in self._candidate_patterns:
+            for match in pattern.finditer(text_lower):
+                # Separators are single characters, so each piece starts one past the previous
+                start = match.start(1)
+                for piece in self._candidate_separator.split(match.group(1)):
+                    candidate = piece.strip()
+                    if len(candidate) > 2:  # Avoid very short terms
+                        candidate_start = start + len(piece) - len(piece.lstrip())
+                        self.add_candidate(candidate, candidate_start, tech_skills, soft_skills, occurrences)
+                    start += len(piece) + 1
+    
+    def match_fuzzy(
+        self,
+        text_lower: str,
+        tech_skills: Set[str],
+        soft_skills: Set[str],
+        occurrences: Optional[Occurrences] = None
+    ) -> Dict[str, float]:
+        """
+        Add skills that only occur misspelled or split in the lowercased text.
+        
+        Skills already found exactly are skipped. Returns the best confidence
+        of each skill added.
+        """
+        fuzzy_matches: Dict[str, float] = {}
+        spans: List[Tuple[int, int, str]] = []
+        for start, end, name, confidence in self.fuzzy_matcher.iter_matches(text_lower):
+            if confidence < self.fuzzy_confidence or name in tech_skills or name in soft_skills:
+                continue
+            spans.append((start, end, name))
+            if confidence > fuzzy_matches.get(name, 0.0):
+                fuzzy_matches[name] = confidence
+        
+        if self.taxonomy is None:
+            self._add_matches(spans, tech_skills, soft_skills, occurrences)
+        else:
+            matches = [(start, end, self.taxonomy.lookup(name)) for start, end, name in spans]
+            self._add_taxonomy_matches(matches, tech_skills, soft_skills, occurrences)
+        return fuzzy_matches
+    
+    @staticmethod
+    def merge_token_occurrences(token_occurrences: Occurrences, occurrences: Occurrences) -> None:
+        """
+        Add the token-path spans that no span of the same skill from the text already overlaps.
+        
+        The token path also matches across stop words and punctuation, so it can
+        report one occurrence with a different span than the text matcher; only
+        the occurrences the text matcher missed are counted.
+        """
+        for name, token_spans in token_occurrences.items():
+            text_spans = occurrences.setdefault(name, set())
+            text_spans.update([
+                (start, end) for start, end in token_spans
+                if not any(other_start < end and start < other_end for other_start, other_end in text_spans)
+            ])
+    
+    @staticmethod
+    def _skill_details(occurrences: Occurrences, sections: Any) -> Dict[str, Dict[str, Any]]:
+        """Sort each skill's offsets and place them in the sections whose spans contain them."""
+        spans = getattr(sections, "spans", sections) or []
+        span_starts = [span[1] for span in spans]
+        details = {}
+        for name in sorted(occurrences):
+            offsets = sorted(occurrences[name])
+            section_names = []
+            for start, _ in offsets:
+                index = bisect_right(span_starts, start) - 1
+                section_names.append(spans[index][0] if index >= 0 and start < spans[index][2] else None)
+            details[name] = {"count": len(offsets), "offsets": offsets, "sections": section_names}
+        return details
+    
+    def extract(self, text: str, detailed: bool = False, sections: Any = None) -> Dict[str, Any]:
+        """
+        Extract technical and soft skills from resume text.
+        
+        Args:
+            text: The resume text
+            detailed: Also report where each skill occurs
+            sections: Sections of the text from index_resume_sections (or their
+                spans), used to place detailed occurrences
             
-    for skill in BUSINESS_SKILLS:
-        if re.search(r'\b' + re.escape(skill) + r'\b', text_lower):
-            soft_skills.add(skill)
-    
-    # Try to extract programming languages, frameworks, and tools using patterns
-    patterns = [
-        # Programming language pattern
-        r'(?:proficient in|experience with|skilled in|knowledge of|familiar with)\s+([A-Za-z0-9, \.+#]+)',
-        # Skills section pattern
-        r'(?:technical skills|skills|technical expertise|languages|programming languages)[:\s]*([A-Za-z0-9, \.+#]+)'
-    ]
-    
-    for pattern in patterns:
-        matches = re.finditer(pattern, text_lower)
-        for match in matches:
-            skill_text = match.group(1)
-            skill_candidates = re.split(r'[,;/]', skill_text)
-            for candidate in skill_candidates:
-                candidate = candidate.strip()
-                if candidate and len(candidate) > 2:  # Avoid very short terms
-                    # Check if it's a known tech skill
-                    if candidate in COMMON_TECH_SKILLS:
-                        tech_skills.add(candidate)
-                    elif candidate in BUSINESS_SKILLS:
-                        soft_skills.add(candidate)
-                    # Else add any capitalized terms as potential skills
-                    elif any(c.isupper() for c in candidate):
-                        tech_skills.add(candidate)
+        Returns:
+            Dictionary with technical_skills and soft_skills lists. With fuzzy
+            matching, fuzzy_matches maps each skill found only approximately
+            to its confidence. In detailed mode, skill_details maps each skill
+            to its count, its (start, end) character offsets and the section of
+            each offset (None outside any section's content). Offsets index text.
+        """
+        text_lower = lower_text(text)
+        tech_skills: Set[str] = set()
+        soft_skills: Set[str] = set()
+        # Offsets are collected by the matchers themselves, so detail costs no second scan
+        occurrences: Optional[Occurrences] = {} if detailed else None
+        token_occurrences: Optional[Occurrences] = {} if detailed else None
+        
+        self.match_tokens(text_lower, tech_skills, soft_skills, token_occurrences)
+        self.match_text(text_lower, tech_skills, soft_skills, occurrences)
+        if detailed:
+            self.merge_token_occurrences(token_occurrences, occurrences)
+        return self.build_result(text_lower, tech_skills, soft_skills, occurrences, sections)
+    
+    def build_result(
+        self,
+        text_lower: str,
+        tech_skills: Set[str],
+        soft_skills: Set[str],
+        occurrences: Optional[Occurrences] = None,
+        sections: Any = None
+    ) -> Dict[str, Any]:
+        """Run the fuzzy stage over the exact matches and assemble the result of extract."""
+        fuzzy_matches = None
+        if self.fuzzy_matcher is not None:
+            fuzzy_matches = self.match_fuzzy(text_lower, tech_skills, soft_skills, occurrences)
+        
+        # Sort skills alphabetically
+        result: Dict[str, Any] = {
+            "technical_skills": sorted(tech_skills),
+            "soft_skills": sorted(soft_skills)
+        }
+        if fuzzy_matches is not None:
+            result["fuzzy_matches"] = {name: round(fuzzy_matches[name], 3) for name in sorted(fuzzy_matches)}
+        if occurrences is not None:
+            result["skill_details"] = self._skill_details(occurrences, sections)
+        return result
+    
+    def count_skills(self, text: str) -> Dict[str, int]:
+        """Count the occurrences of each skill in resume text, as detailed mode does."""
+        text_lower = lower_text(text)
+        tech_skills: Set[str] = set()
+        soft_skills: Set[str] = set()
+        occurrences: Occurrences = {}
+        token_occurrences: Occurrences = {}
+        
+        self.match_tokens(text_lower, tech_skills, soft_skills, token_occurrences)
+        self.match_text(text_lower, tech_skills, soft_skills, occurrences)
+        self.merge_token_occurrences(token_occurrences, occurrences)
+        if self.fuzzy_matcher is not None:
+            self.match_fuzzy(text_lower, tech_skills, soft_skills, occurrences)
+        return {name: len(spans) for name, spans in occurrences.items()}
+    
+    def skill_vocabulary(self) -> List[str]:
+        """
+        Return every skill this extractor can report, in a fixed order.
+        
+        A skill's position is a stable integer id for as long as the skill
+        dictionary (or the compiled taxonomy) is unchanged.
+        """
+        if self.taxonomy is None:
+            return sorted(self.tech_skills | self.soft_skills)
+        return list(self.taxonomy.skill_names())
+    
+    def extract_many(
+        self,
+        texts: Iterable[str],
+        detailed: bool = False,
+        sections: Optional[Iterable[Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Extract skills from several resume texts, in order, with optional sections for each."""
+        if sections is None:
+            return [self.extract(text, detailed) for text in texts]
+        return [self.extract(text, detailed, text_sections) for text, text_sections in zip(texts, sections)]
+
+# Entity labels whose text may name a skill (tools, companies' products, languages)
+SKILL_ENTITY_LABELS = frozenset({"ORG", "PRODUCT", "LANGUAGE"})
+
+# Components needed for entities, and additionally for noun chunks
+_ENTITY_PIPES = {"tok2vec", "ner", "entity_ruler"}
+_NOUN_CHUNK_PIPES = {"tok2vec", "tagger", "attribute_ruler", "parser"}
+
+class SpacySkillPipeline:
+    """
+    Bulk skill extraction through spaCy.
+    
+    The model is loaded once (see load_nlp_model) and texts are streamed through
+    ``nlp.pipe`` in batches, optionally over several processes, with every
+    component the candidates do not need disabled. spaCy's tokens replace
+    NLTK's for matching multi-word skills, and named entities and proper-noun
+    chunks are fed to the skill matcher as candidates; those that name no known
+    skill are reported as skill_candidates, which is where new skills for a
+    taxonomy turn up.
     
+    Without spaCy or its model, texts go through the extractor one by one and
+    skill_candidates is always empty. Noun chunks are skipped for pipelines
+    without a dependency parser.
+    
+    Args:
+        extractor: Skill extractor the candidates feed (defaults to the shared one)
+        batch_size: Texts per nlp.pipe batch
+        n_process: Processes nlp.pipe fans the texts out to
+        noun_chunks: Also use noun chunks, which needs the tagger and parser
+        nlp: Loaded spaCy pipeline to use instead of the shared model
+    """
+    
+    def __init__(
+        self,
+        extractor: Optional[SkillExtractor] = None,
+        batch_size: int = 64,
+        n_process: int = 1,
+        noun_chunks: bool = True,
+        nlp: Any = None
+    ):
+        self.extractor = extractor if extractor is not None else SKILL_EXTRACTOR
+        self.batch_size = batch_size
+        self.n_process = n_process
+        self.noun_chunks = noun_chunks
+        self.nlp = nlp if nlp is not None else load_nlp_model()
+        
+        self.disabled_pipes: List[str] = []
+        if self.nlp is not None:
+            needed = _ENTITY_PIPES | (_NOUN_CHUNK_PIPES if noun_chunks else set())
+            self.disabled_pipes = [name for name in self.nlp.pipe_names if name not in needed]
+    
+    def _candidates(self, doc: Any) -> Iterator[Any]:
+        """Yield the entity and proper-noun chunk spans of a parsed text."""
+        for entity in doc.ents:
+            if entity.label_ in SKILL_ENTITY_LABELS:
+                yield entity
+        if self.noun_chunks and doc.has_annotation("DEP"):
+            for chunk in doc.noun_chunks:
+                if chunk.root.pos_ == "PROPN":
+                    yield chunk
+    
+    def extract_doc(self, doc: Any, detailed: bool = False, sections: Any = None) -> Dict[str, Any]:
+        """
+        Extract skills from a text spaCy has parsed.
+        
+        Returns:
+            The result of SkillExtractor.extract plus skill_candidates, the sorted
+            entity and chunk texts that name no known skill
+        """
+        extractor = self.extractor
+        text_lower = lower_text(doc.text)
+        tech_skills: Set[str] = set()
+        soft_skills: Set[str] = set()
+        occurrences: Optional[Occurrences] = {} if detailed else None
+        token_occurrences: Optional[Occurrences] = {} if detailed else None
+        
+        # Filter out stop words and punctuation, as the NLTK path does
+        tokens: List[str] = []
+        token_spans: List[Tuple[int, int]] = []
+        for token in doc:
+            if token.lower_.isalnum() and not token.is_stop:
+                tokens.append(token.lower_)
+                token_spans.append((token.idx, token.idx + len(token)))
+        extractor.match_token_list(tokens, tech_skills, soft_skills, token_occurrences, token_spans)
+        extractor.match_text(text_lower, tech_skills, soft_skills, occurrences)
+        
+        unknown: Set[str] = set()
+        for span in self._candidates(doc):
+            # Leading determiners and other stop words ("the", "our") are not part of a name
+            start = span.start
+            while start < span.end and doc[start].is_stop:
+                start += 1
+            if start == span.end:
+                continue
+            start_char = doc[start].idx
+            candidate = text_lower[start_char:span.end_char].strip()
+            if len(candidate) <= 2:
+                continue
+            if extractor.is_known(candidate):
+                extractor.add_candidate(candidate, start_char, tech_skills, soft_skills, occurrences)
+            else:
+                unknown.add(" ".join(candidate.split()))
+        
+        if detailed:
+            extractor.merge_token_occurrences(token_occurrences, occurrences)
+        result = extractor.build_result(text_lower, tech_skills, soft_skills, occurrences, sections)
+        result["skill_candidates"] = sorted(unknown)
+        return result
+    
+    def extract_many(
+        self,
+        texts: Iterable[str],
+        detailed: bool = False,
+        sections: Optional[Iterable[Any]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Extract skills from many resume texts, yielding results in order.
+        
+        Texts are consumed lazily, so any iterable (a generator reading files,
+        say) can be streamed through without holding the whole corpus.
+        
+        Args:
+            texts: Resume texts
+            detailed: Also report each skill's count, offsets and sections
+            sections: Sections of each text from index_resume_sections, in the
+                same order as texts, for detailed mode
+        """
+        section_iter = iter(sections) if sections is not None else None
+        if self.nlp is None:
+            for text in texts:
+                result = self.extractor.extract(text, detailed, next(section_iter) if section_iter else None)
+                result["skill_candidates"] = []
+                yield result
+            return
+        docs = self.nlp.pipe(
+            texts,
+            batch_size=self.batch_size,
+            n_process=self.n_process,
+            disable=self.disabled_pipes
+        )
+        for doc in docs:
+            yield self.extract_doc(doc, detailed, next(section_iter) if section_iter else None)
+
+# Shared extractor used by the module-level functions, built once at import. It
+# uses the taxonomy index named by RESUME_SKILL_TAXONOMY, or the built-in skills,
+# and fuzzy matching when RESUME_FUZZY_SKILLS sets a minimum confidence.
+SKILL_EXTRACTOR = SkillExtractor(taxonomy=default_skill_index(), fuzzy_confidence=default_fuzzy_confidence())
+
+def extract_skills_with_nlp(text: str) -> Tuple[Set[str], Set[str]]:
+    """Extract skills using NLP libraries if available."""
+    tech_skills: Set[str] = set()
+    soft_skills: Set[str] = set()
+    SKILL_EXTRACTOR.match_tokens(text.lower(), tech_skills, soft_skills)
+    return tech_skills, soft_skills
+
+def extract_skills_with_regex(text: str) -> Tuple[Set[str], Set[str]]:
+    """Extract skills using regex patterns when NLP libraries aren't available."""
+    tech_skills: Set[str] = set()
+    soft_skills: Set[str] = set()
+    SKILL_EXTRACTOR.match_text(text.lower(), tech_skills, soft_skills)
     return tech_skills, soft_skills
 
-def extract_skills(text: str) -> Dict[str, List[str]]:
+def extract_skills(text: str, detailed: bool = False, sections: Any = None) -> Dict[str, Any]:
     """
     Extract technical and soft skills from resume text.
     Works with or without NLP libraries installed.
     
     Args:
         text: The resume text
+        detailed: Also report each skill's count, offsets and sections
+        sections: Sections of the text from index_resume_sections, for detailed mode
         
     Returns:
-        Dictionary with technical_skills and soft_skills lists
+        Dictionary with technical_skills and soft_skills lists (see SkillExtractor.extract)
+    """
+    return SKILL_EXTRACTOR.extract(text, detailed, sections)
+
+def extract_skills_batch(texts: Iterable[str], batch_size: int = 64, n_process: int = 1) -> Iterator[Dict[str, Any]]:
+    """
+    Extract skills from many resume texts through spaCy's batched pipeline.
+    
+    See SpacySkillPipeline; results are yielded in input order.
     """
-    if NLP_LIBRARIES_AVAILABLE:
-        # Use NLP-based extraction
-        tech_skills, soft_skills = extract_skills_with_nlp(text)
-    else:
-        # Fall back to regex-based extraction
-        tech_skills, soft_skills = extract_skills_with_regex(text)
-    
-    # Also use regex extraction in all cases to catch additional terms
-    tech_skills_regex, soft_skills_regex = extract_skills_with_regex(text)
-    
-    # Combine results
-    tech_skills.update(tech_skills_regex)
-    soft_skills.update(soft_skills_regex)
-    
-    # Sort skills alphabetically
-    return {
-        "technical_skills": sorted(list(tech_skills)),
-        "soft_skills": sorted(list(soft_skills))
-    } 
\ No newline at end of file
+    return SpacySkillPipeline(batch_size=batch_size, n_process=n_process).extract_many(texts)
@@ -0,0 +1,181 @@
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+
+def _is_word_char(char: str) -> bool:
+    """Return True if the character counts as a word character for the re module's \\b."""
+    return char.isalnum() or char == "_"
+
+
+class SkillMatcher:
+    """
+    Multi-pattern keyword matcher built on an Aho-Corasick automaton.
+
+    Every keyword is located in a single pass over the text, so the cost of a
+    lookup depends on the length of the text rather than on the dictionary size.
+    A hit only counts when it sits on the same word boundaries that
+    ``re.search(r'\\b' + re.escape(keyword) + r'\\b', text)`` would require, which
+    keeps the results identical to running one regex per keyword.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = []
+        self._lengths: List[int] = []
+        self._starts_with_word: List[bool] = []
+        self._ends_with_word: List[bool] = []
+
+        # Trie transitions, failure links and matched keyword ids per state
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        seen = set()
+        for keyword in keywords:
+            if not keyword or keyword in seen:
+                continue
+            seen.add(keyword)
+            self._add_keyword(keyword)
+
+        self._build_failure_links()
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def _add_keyword(self, keyword: str) -> None:
+        """Insert a keyword into the trie."""
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+
+        keyword_id = len(self.keywords)
+        self.keywords.append(keyword)
+        self._lengths.append(len(keyword))
+        self._starts_with_word.append(_is_word_char(keyword[0]))
+        self._ends_with_word.append(_is_word_char(keyword[-1]))
+        self._output[state].append(keyword_id)
+
+    def _build_failure_links(self) -> None:
+        """Compute failure links breadth-first and merge outputs along them."""
+        goto, fail, output = self._goto, self._fail, self._output
+        # Children of the root keep their default failure link to the root
+        queue = list(goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                if output[fail[next_state]]:
+                    output[next_state] = output[next_state] + output[fail[next_state]]
+
+    def _on_word_boundaries(self, text: str, start: int, end: int, keyword_id: int) -> bool:
+        """Check the \\b assertions on both sides of a raw hit."""
+        before_is_word = start > 0 and _is_word_char(text[start - 1])
+        if before_is_word == self._starts_with_word[keyword_id]:
+            return False
+        after_is_word = end < len(text) and _is_word_char(text[end])
+        return after_is_word != self._ends_with_word[keyword_id]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """
+        Yield every bounded keyword occurrence in the text.
+
+        Args:
+            text: The text to scan (callers lowercase it first for case-insensitive matching)
+
+        Returns:
+            Iterator of (start, end, keyword) tuples in order of their end offset
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        lengths, keywords = self._lengths, self.keywords
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                end = index + 1
+                for keyword_id in output[state]:
+                    start = end - lengths[keyword_id]
+                    if self._on_word_boundaries(text, start, end, keyword_id):
+                        yield start, end, keywords[keyword_id]
+
+    def find(self, text: str) -> Set[str]:
+        """Return the set of keywords that occur in the text."""
+        return {keyword for _, _, keyword in self.iter_matches(text)}
+
+
+class TokenTrie:
+    """
+    Keyword matcher over a sequence of tokens.
+
+    Keywords are split on whitespace and stored as a trie of tokens, so every
+    keyword, whatever its number of words, is found by walking forward from each
+    token. Unlike building space-joined n-grams and looking them up, the walk
+    allocates no intermediate strings: a hit returns the keyword stored at the
+    trie node.
+    """
+
+    # Trie nodes are dicts keyed by token; the keyword ending at a node is stored
+    # under None, which can never collide with a token
+    _KEYWORD = None
+
+    def __init__(self, keywords: Iterable[str]):
+        self._root: Dict[object, object] = {}
+        self.max_tokens = 0
+        self._size = 0
+
+        for keyword in keywords:
+            tokens = keyword.split()
+            if not tokens:
+                continue
+            node = self._root
+            for token in tokens:
+                node = node.setdefault(token, {})
+            if self._KEYWORD not in node:
+                node[self._KEYWORD] = keyword
+                self._size += 1
+            self.max_tokens = max(self.max_tokens, len(tokens))
+
+    def __len__(self) -> int:
+        return self._size
+
+    def iter_matches(self, tokens: Sequence[str], starts: Optional[Iterable[int]] = None) -> Iterator[Tuple[int, int, str]]:
+        """
+        Yield every keyword occurring as a run of consecutive tokens.
+
+        Args:
+            tokens: The token sequence (already lowercased and filtered by the caller)
+            starts: Only look for keywords starting at these token indexes, in
+                increasing order (defaults to every token)
+
+        Returns:
+            Iterator of (start, end, keyword) tuples, with start and end as token indexes
+        """
+        root, keyword_key = self._root, self._KEYWORD
+        count = len(tokens)
+        for start in (range(count) if starts is None else starts):
+            node = root.get(tokens[start])
+            end = start + 1
+            while node is not None:
+                keyword = node.get(keyword_key)
+                if keyword is not None:
+                    yield start, end, keyword
+                if end == count:
+                    break
+                node = node.get(tokens[end])
+                end += 1
+
+    def find(self, tokens: Sequence[str]) -> Set[str]:
+        """Return the set of keywords that occur in the token sequence."""
+        return {keyword for _, _, keyword in self.iter_matches(tokens)}
@@ -0,0 +1,131 @@
+"""
+Sparse resume-by-skill count matrices for analytics.
+
+build_skill_matrix streams resume texts through a skill extractor and keeps only
+the nonzero (resume, skill, count) entries, in compact typed arrays, so memory
+grows with the skills found rather than with resumes times dictionary size.
+Columns are stable skill ids from the extractor's dictionary. Saved matrices
+are plain ``.npz`` files that scipy.sparse.load_npz also reads.
+
+Frequency, co-occurrence and clustering queries then become array operations::
+
+    matrix = build_skill_matrix(texts).tocsr()   # needs SciPy
+    resumes_per_skill = (matrix > 0).sum(axis=0)
+    cooccurrence = (matrix > 0).T @ (matrix > 0)
+"""
+import importlib.util
+from array import array
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .skill_extractor import SKILL_EXTRACTOR, SkillExtractor
+
+# SciPy is optional; without it matrices stay in NumPy coordinate form
+SCIPY_AVAILABLE = importlib.util.find_spec("scipy") is not None
+
+
+class SkillMatrix:
+    """
+    Resume-by-skill matrix of skill counts in coordinate (COO) form.
+
+    Row i is the i-th resume given to build_skill_matrix and column j is skill
+    id j, whose name is skills[j]. Only nonzero entries are stored, sorted by
+    row and then by column.
+
+    Attributes:
+        row: Resume index of each entry (int32)
+        col: Skill id of each entry (int32)
+        data: Number of occurrences of the skill in the resume (int32)
+        shape: (number of resumes, number of skills)
+        skills: Skill name of each id
+    """
+
+    def __init__(self, row: np.ndarray, col: np.ndarray, data: np.ndarray, shape: Tuple[int, int], skills: List[str]):
+        self.row = row
+        self.col = col
+        self.data = data
+        self.shape = shape
+        self.skills = skills
+
+    @property
+    def nnz(self) -> int:
+        """Number of stored (nonzero) entries."""
+        return len(self.data)
+
+    def tocsr(self):
+        """Return the matrix as a SciPy CSR matrix."""
+        if not SCIPY_AVAILABLE:
+            raise ImportError("SciPy is required for CSR matrices; use row, col and data or toarray() instead")
+        from scipy.sparse import csr_matrix
+        return csr_matrix((self.data, (self.row, self.col)), shape=self.shape)
+
+    def toarray(self) -> np.ndarray:
+        """Return the matrix as a dense array; only sensible for small matrices."""
+        dense = np.zeros(self.shape, dtype=self.data.dtype)
+        dense[self.row, self.col] = self.data
+        return dense
+
+    def save(self, path: str) -> None:
+        """
+        Save the matrix and its skill names to a compressed ``.npz`` file.
+
+        The arrays use SciPy's COO layout, so scipy.sparse.load_npz reads the
+        file as well as SkillMatrix.load.
+        """
+        np.savez_compressed(
+            path,
+            format=np.array(b"coo"),
+            shape=np.array(self.shape, dtype=np.int64),
+            row=self.row,
+            col=self.col,
+            data=self.data,
+            skills=np.array(self.skills, dtype=str)
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "SkillMatrix":
+        """Load a matrix written by save."""
+        with np.load(path, allow_pickle=False) as arrays:
+            if arrays["format"].item() != b"coo" or "skills" not in arrays:
+                raise ValueError(f"{path} is not a saved skill matrix")
+            rows, columns = (int(size) for size in arrays["shape"])
+            return cls(arrays["row"], arrays["col"], arrays["data"], (rows, columns), arrays["skills"].tolist())
+
+
+def build_skill_matrix(texts: Iterable[str], extractor: Optional[SkillExtractor] = None) -> SkillMatrix:
+    """
+    Count the skills of many resumes into a sparse matrix.
+
+    Texts are consumed one at a time, so a generator reading resumes from disk
+    is never held in memory; only the nonzero counts are kept.
+
+    Args:
+        texts: Resume texts; row i is the i-th text
+        extractor: Skill extractor to count with (defaults to the shared one);
+            its skill_vocabulary defines the columns
+
+    Returns:
+        SkillMatrix of skill counts
+    """
+    extractor = extractor if extractor is not None else SKILL_EXTRACTOR
+    skills = extractor.skill_vocabulary()
+    skill_ids = {name: skill_id for skill_id, name in enumerate(skills)}
+
+    # Typed arrays hold four bytes per value instead of a Python int each
+    rows, columns, counts = array("i"), array("i"), array("i")
+    resume_count = 0
+    for text in texts:
+        for skill_id, count in sorted((skill_ids[name], count) for name, count in extractor.count_skills(text).items()):
+            rows.append(resume_count)
+            columns.append(skill_id)
+            counts.append(count)
+        resume_count += 1
+
+    return SkillMatrix(
+        np.frombuffer(rows, dtype=np.intc),
+        np.frombuffer(columns, dtype=np.intc),
+        np.frombuffer(counts, dtype=np.intc),
+        (resume_count, len(skills)),
+        skills
+    )
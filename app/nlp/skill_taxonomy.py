@@ -0,0 +1,387 @@
+import argparse
+import csv
+import mmap
+import os
+import re
+import struct
+import sys
+import zlib
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+# Path of a compiled taxonomy index to use instead of the built-in skill sets
+TAXONOMY_ENV_VAR = "RESUME_SKILL_TAXONOMY"
+
+# Category flags stored per skill; a skill may be both
+TECHNICAL = 1
+SOFT = 2
+CATEGORY_FLAGS = {"technical": TECHNICAL, "soft": SOFT}
+
+_MAGIC = b"SKTX"
+_FORMAT_VERSION = 1
+# magic, format version, skill count, key count, hash table size, longest key in characters and in tokens
+_HEADER = struct.Struct("<4sIIIIII")
+
+# Value of keys that only exist so a walk can tell it may still reach a skill
+_PREFIX_ONLY = 0xFFFFFFFF
+# Returned by _probe when a key is not in the index at all
+_ABSENT = -1
+
+_WORD_BOUNDARY = re.compile(r"\b")
+
+TaxonomyEntry = Tuple[str, int, Sequence[str]]
+
+
+def normalize_skill_name(name: str) -> str:
+    """Lowercase a skill name and collapse its whitespace to single spaces."""
+    return " ".join(name.lower().split())
+
+
+def read_taxonomy_csv(path: Union[str, os.PathLike]) -> Iterator[TaxonomyEntry]:
+    """
+    Read a taxonomy CSV with the columns skill, category and aliases.
+
+    The category is "technical", "soft" or both joined by "|" (default:
+    technical); aliases are separated by "|". For example::
+
+        skill,category,aliases
+        kubernetes,technical,k8s|kube
+        postgresql,technical,postgres|psql
+
+    Returns:
+        Iterator of (skill, category flags, aliases) tuples
+    """
+    with open(path, newline="", encoding="utf-8") as file:
+        for line_number, row in enumerate(csv.DictReader(file), start=2):
+            skill = normalize_skill_name(row.get("skill") or "")
+            if not skill:
+                continue
+            flags = 0
+            for category in (row.get("category") or "technical").split("|"):
+                category = category.strip().lower()
+                if category not in CATEGORY_FLAGS:
+                    raise ValueError(f"{path}:{line_number}: unknown skill category '{category}'")
+                flags |= CATEGORY_FLAGS[category]
+            aliases = [alias for alias in (row.get("aliases") or "").split("|") if alias.strip()]
+            yield skill, flags, aliases
+
+
+def taxonomy_from_sets(tech_skills: Iterable[str], soft_skills: Iterable[str]) -> List[TaxonomyEntry]:
+    """Build taxonomy entries without aliases from sets of technical and soft skills."""
+    flags: Dict[str, int] = {}
+    for skills, flag in ((tech_skills, TECHNICAL), (soft_skills, SOFT)):
+        for skill in skills:
+            flags[skill] = flags.get(skill, 0) | flag
+    return [(skill, flags[skill], ()) for skill in sorted(flags)]
+
+
+def _key_prefixes(key: str) -> Iterator[str]:
+    """Yield the prefixes of a key at which a boundary or token walk may stop early."""
+    for match in _WORD_BOUNDARY.finditer(key):
+        if 0 < match.start() < len(key):
+            yield key[:match.start()]
+    position = key.find(" ")
+    while position != -1:
+        yield key[:position]
+        position = key.find(" ", position + 1)
+
+
+def _u32_array(values: Iterable[int]) -> array:
+    """Pack integers as a little-endian unsigned 32-bit array."""
+    packed = array("I", values)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed
+
+
+def _pad(data: bytes) -> bytes:
+    """Pad a section to a multiple of four bytes so the next array stays aligned."""
+    return data + b"\0" * (-len(data) % 4)
+
+
+def build_taxonomy_index(entries: Iterable[TaxonomyEntry]) -> bytes:
+    """
+    Compile taxonomy entries into the binary index format read by SkillIndex.
+
+    Skill names and aliases are normalized with normalize_skill_name. When an
+    alias or name is claimed by several skills, the first one keeps it.
+
+    Args:
+        entries: (skill, category flags, aliases) tuples
+
+    Returns:
+        The index as bytes
+    """
+    skill_names: List[str] = []
+    skill_flags = bytearray()
+    skill_ids: Dict[str, int] = {}
+    keys: Dict[str, int] = {}
+
+    entries = list(entries)
+    # Canonical names first, so a skill's own name always beats another skill's alias
+    for skill, flags, _ in entries:
+        skill = normalize_skill_name(skill)
+        if skill in skill_ids:
+            skill_flags[skill_ids[skill]] |= flags
+            continue
+        skill_ids[skill] = len(skill_names)
+        skill_names.append(skill)
+        skill_flags.append(flags)
+        keys[skill] = skill_ids[skill]
+    for skill, _, aliases in entries:
+        skill_id = skill_ids[normalize_skill_name(skill)]
+        for alias in aliases:
+            keys.setdefault(normalize_skill_name(alias), skill_id)
+
+    # Partial keys let lookups over text and tokens stop as soon as no skill can match
+    for key in list(keys):
+        for prefix in _key_prefixes(key):
+            keys.setdefault(prefix, _PREFIX_ONLY)
+    keys.pop("", None)
+
+    strings = bytearray()
+    skill_offsets = [0]
+    for name in skill_names:
+        strings += name.encode("utf-8")
+        skill_offsets.append(len(strings))
+    key_offsets = [len(strings)]
+    key_values = []
+    encoded_keys = []
+    for key, value in keys.items():
+        encoded = key.encode("utf-8")
+        encoded_keys.append(encoded)
+        strings += encoded
+        key_offsets.append(len(strings))
+        key_values.append(value)
+
+    # Open addressing with linear probing, kept at most half full
+    table_size = 1
+    while table_size < 2 * len(encoded_keys):
+        table_size *= 2
+    mask = table_size - 1
+    table = [0] * table_size
+    for key_id, encoded in enumerate(encoded_keys):
+        slot = zlib.crc32(encoded) & mask
+        while table[slot]:
+            slot = (slot + 1) & mask
+        table[slot] = key_id + 1
+
+    real_keys = [key for key, value in keys.items() if value != _PREFIX_ONLY]
+    header = _HEADER.pack(
+        _MAGIC, _FORMAT_VERSION, len(skill_names), len(encoded_keys), table_size,
+        max((len(key) for key in real_keys), default=0),
+        max((len(key.split()) for key in real_keys), default=0)
+    )
+    return b"".join([
+        header,
+        _u32_array(skill_offsets).tobytes(),
+        _pad(bytes(skill_flags)),
+        _u32_array(key_offsets).tobytes(),
+        _u32_array(key_values).tobytes(),
+        _u32_array(table).tobytes(),
+        bytes(strings),
+    ])
+
+
+def compile_taxonomy(source: Union[str, os.PathLike], index_path: Union[str, os.PathLike]) -> int:
+    """
+    Compile a taxonomy CSV into an index file for SkillIndex.open.
+
+    The index is written to a temporary file and renamed into place, so
+    processes that have the old index mapped keep reading a consistent copy.
+
+    Returns:
+        Number of canonical skills in the index
+    """
+    data = build_taxonomy_index(read_taxonomy_csv(source))
+    temporary_path = f"{os.fspath(index_path)}.tmp"
+    with open(temporary_path, "wb") as file:
+        file.write(data)
+    os.replace(temporary_path, index_path)
+    return _HEADER.unpack_from(data)[2]
+
+
+class SkillIndex:
+    """
+    Read-only skill taxonomy backed by a compiled index.
+
+    Opening an index only maps the file and reads its header; every lookup
+    hashes the name and probes the table in place, so a taxonomy of any size
+    loads near-instantly and its pages are shared by all processes mapping
+    the same file. Skills are identified by integer ids into the canonical
+    names.
+    """
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap]):
+        self._buffer = buffer
+        view = memoryview(buffer)
+        magic, version, skill_count, key_count, table_size, max_chars, max_tokens = _HEADER.unpack_from(view)
+        if magic != _MAGIC:
+            raise ValueError("Not a compiled skill taxonomy index")
+        if version != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported skill taxonomy index version {version}; recompile the taxonomy")
+
+        self.skill_count = skill_count
+        self.key_count = key_count
+        self.max_chars = max_chars
+        self.max_tokens = max_tokens
+
+        position = _HEADER.size
+
+        def take_u32(count: int) -> Sequence[int]:
+            nonlocal position
+            section = view[position:position + 4 * count]
+            position += 4 * count
+            if sys.byteorder != "little":
+                swapped = array("I", section)
+                swapped.byteswap()
+                return swapped
+            return section.cast("I")
+
+        self._skill_offsets = take_u32(skill_count + 1)
+        self._skill_flags = view[position:position + skill_count]
+        position += skill_count + (-skill_count % 4)
+        self._key_offsets = take_u32(key_count + 1)
+        self._key_values = take_u32(key_count)
+        self._table = take_u32(table_size)
+        self._mask = table_size - 1
+        self._strings = view[position:]
+        self._view = view
+
+    @classmethod
+    def open(cls, path: Union[str, os.PathLike]) -> "SkillIndex":
+        """Memory-map a compiled index file."""
+        with open(path, "rb") as file:
+            return cls(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[TaxonomyEntry]) -> "SkillIndex":
+        """Build an in-memory index, mainly for small taxonomies and tests."""
+        return cls(build_taxonomy_index(entries))
+
+    def __len__(self) -> int:
+        return self.skill_count
+
+    def _probe(self, name: str) -> int:
+        """Return the value stored for a key, or _ABSENT."""
+        encoded = name.encode("utf-8")
+        table, key_offsets, strings, mask = self._table, self._key_offsets, self._strings, self._mask
+        slot = zlib.crc32(encoded) & mask
+        while True:
+            entry = table[slot]
+            if not entry:
+                return _ABSENT
+            if strings[key_offsets[entry - 1]:key_offsets[entry]] == encoded:
+                return self._key_values[entry - 1]
+            slot = (slot + 1) & mask
+
+    def lookup(self, name: str) -> Optional[int]:
+        """Return the id of the skill a normalized name or alias refers to."""
+        value = self._probe(name)
+        return None if value == _ABSENT or value == _PREFIX_ONLY else value
+
+    def skill_name(self, skill_id: int) -> str:
+        """Return the canonical name of a skill."""
+        return bytes(self._strings[self._skill_offsets[skill_id]:self._skill_offsets[skill_id + 1]]).decode("utf-8")
+
+    def skill_flags(self, skill_id: int) -> int:
+        """Return the TECHNICAL/SOFT category flags of a skill."""
+        return self._skill_flags[skill_id]
+
+    def canonical(self, name: str) -> Optional[str]:
+        """Return the canonical name for any spelling of a skill, or None if it is unknown."""
+        skill_id = self.lookup(normalize_skill_name(name))
+        return None if skill_id is None else self.skill_name(skill_id)
+
+    def skill_names(self) -> Iterator[str]:
+        """Yield every canonical skill name in id order."""
+        for skill_id in range(self.skill_count):
+            yield self.skill_name(skill_id)
+
+    def iter_text_matches(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """
+        Yield every skill name or alias that occurs on word boundaries in the text.
+
+        Boundaries follow the re module's \\b, as with SkillMatcher.
+
+        Args:
+            text: The text to scan (callers lowercase it first)
+
+        Returns:
+            Iterator of (start, end, skill id) tuples in order of their start offset
+        """
+        boundaries = [match.start() for match in _WORD_BOUNDARY.finditer(text)]
+        probe, max_chars = self._probe, self.max_chars
+        count = len(boundaries)
+        for first in range(count):
+            start = boundaries[first]
+            for following in range(first + 1, count):
+                end = boundaries[following]
+                if end - start > max_chars:
+                    break
+                value = probe(text[start:end])
+                if value == _ABSENT:
+                    break
+                if value != _PREFIX_ONLY:
+                    yield start, end, value
+
+    def iter_token_matches(self, tokens: Sequence[str]) -> Iterator[Tuple[int, int, int]]:
+        """
+        Yield every skill name or alias occurring as a run of consecutive tokens.
+
+        Returns:
+            Iterator of (start, end, skill id) tuples, with start and end as token indexes
+        """
+        probe, max_tokens = self._probe, self.max_tokens
+        count = len(tokens)
+        for start in range(count):
+            name = tokens[start]
+            end = start + 1
+            while True:
+                value = probe(name)
+                if value == _ABSENT:
+                    break
+                if value != _PREFIX_ONLY:
+                    yield start, end, value
+                if end == count or end - start == max_tokens:
+                    break
+                name = name + " " + tokens[end]
+                end += 1
+
+    def close(self) -> None:
+        """Release the mapping of an index opened from a file."""
+        if isinstance(self._buffer, mmap.mmap):
+            for section in (self._skill_offsets, self._skill_flags, self._key_offsets, self._key_values, self._table,
+                            self._strings, self._view):
+                if isinstance(section, memoryview):
+                    section.release()
+            self._buffer.close()
+
+
+def default_skill_index() -> Optional[SkillIndex]:
+    """Open the index named by RESUME_SKILL_TAXONOMY, or return None to use the built-in skills."""
+    path = os.environ.get(TAXONOMY_ENV_VAR)
+    if not path:
+        return None
+    try:
+        return SkillIndex.open(path)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Could not load skill taxonomy {path}: {str(e)}. Using the built-in skills.")
+        return None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point compiling a taxonomy CSV into an index."""
+    parser = argparse.ArgumentParser(description="Compile a skills taxonomy CSV into a memory-mappable index.")
+    parser.add_argument("source", help="CSV with skill, category and aliases columns")
+    parser.add_argument("index", help="Index file to write")
+    args = parser.parse_args(argv)
+
+    skill_count = compile_taxonomy(args.source, args.index)
+    size = os.path.getsize(args.index)
+    print(f"Compiled {skill_count} skills into {args.index} ({size / (1024 * 1024):.1f} MB)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
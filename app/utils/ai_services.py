@@ -1,10 +1,22 @@
-import requests
 import os
 import json
-from typing import Dict, Any, Optional, List, Tuple
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Any, Iterator, Mapping, Optional, List, Set, Tuple
 import google.generativeai as genai
-import openai
+from google.ai import generativelanguage as glm
 from enum import Enum
+from .http_clients import http_get, http_post
+from .provider_clients import (
+    api_key_hash,
+    get_openai_client,
+    get_gemini_deadline,
+    get_gemini_generative_client,
+    get_gemini_model_client
+)
+from .response_cache import get_response_cache, response_cache_key
+from .resume_sections import section_preview
 
 class AIProvider(Enum):
     """Supported AI provider options."""
@@ -86,103 +98,262 @@ def validate_api_key(provider: str, api_key: str) -> bool:
     # For other providers, just check if it's not empty
     return bool(api_key.strip())
 
-def get_available_models(provider: str, api_key: str = None) -> List[Dict[str, Any]]:
+# Seconds a fetched model listing is served before it is refreshed in the background
+MODEL_LIST_TTL = float(os.environ.get("AI_MODEL_LIST_TTL", "3600"))
+
+# Upper bound on cached model listings; each distinct API key holds one per provider
+MAX_CACHED_MODEL_LISTS = 64
+
+_model_list_cache: "OrderedDict[Tuple[str, str], Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+_model_list_refreshing: Set[Tuple[str, str]] = set()
+_model_list_lock = threading.Lock()
+
+def _fetch_models(provider: str, api_key: str) -> List[Dict[str, Any]]:
+    """Fetch the model listing from the provider's API, raising if the request fails."""
+    if provider == AIProvider.OPENAI.value:
+        return _list_openai_models(api_key)
+    elif provider == AIProvider.GOOGLE.value:
+        return _list_gemini_models(api_key)
+    elif provider == AIProvider.OPENROUTER.value:
+        return _list_openrouter_models(api_key)
+    return AVAILABLE_MODELS.get(provider, [])
+
+def _refresh_models(cache_key: Tuple[str, str], provider: str, api_key: str) -> None:
+    """Fetch a listing and store it in the model list cache."""
+    try:
+        models = _fetch_models(provider, api_key)
+        with _model_list_lock:
+            _model_list_cache[cache_key] = (time.monotonic(), models)
+            _model_list_cache.move_to_end(cache_key)
+            while len(_model_list_cache) > MAX_CACHED_MODEL_LISTS:
+                _model_list_cache.popitem(last=False)
+    except Exception as e:
+        # If API call fails, keep serving whatever listing we already have; the
+        # next call after the TTL tries again
+        print(f"Error fetching models from API: {e}")
+    finally:
+        with _model_list_lock:
+            _model_list_refreshing.discard(cache_key)
+
+def clear_model_list_cache() -> None:
+    """Forget every cached model listing."""
+    with _model_list_lock:
+        _model_list_cache.clear()
+
+def get_available_models(provider: str, api_key: str = None, wait: bool = False, ttl: Optional[float] = None) -> List[Dict[str, Any]]:
     """
     Get available models for a given provider, either from local list or by API call
     
+    Listings fetched with an API key are cached per (provider, key hash), keeping
+    the MAX_CACHED_MODEL_LISTS most recently used. A stale
+    listing is returned immediately while a background thread refreshes it, and a
+    cold listing falls back to the predefined models so callers never block on the
+    network unless ``wait`` is set.
+    
     Args:
         provider: The AI provider name
         api_key: Optional API key to fetch models via API
+        wait: Fetch synchronously when nothing is cached yet
+        ttl: Seconds a cached listing stays fresh (defaults to MODEL_LIST_TTL)
         
     Returns:
         List of available models with their details
     """
-    # If API key is provided, try to fetch models from API
-    if api_key and validate_api_key(provider, api_key):
-        try:
-            if provider == AIProvider.OPENAI.value:
-                return get_openai_models(api_key)
-            elif provider == AIProvider.GOOGLE.value:
-                return get_gemini_models(api_key)
-            elif provider == AIProvider.OPENROUTER.value:
-                return get_openrouter_models(api_key)
-        except Exception as e:
-            # If API call fails, fall back to local list
-            print(f"Error fetching models from API: {e}")
+    fetchable = provider in (AIProvider.OPENAI.value, AIProvider.GOOGLE.value, AIProvider.OPENROUTER.value)
+    
+    # If API key is provided, serve the cached listing and refresh it from the API
+    if fetchable and api_key and validate_api_key(provider, api_key):
+        cache_key = (provider, api_key_hash(api_key))
+        ttl = MODEL_LIST_TTL if ttl is None else ttl
+        
+        with _model_list_lock:
+            entry = _model_list_cache.get(cache_key)
+            if entry is not None:
+                _model_list_cache.move_to_end(cache_key)
+                if time.monotonic() - entry[0] < ttl:
+                    return entry[1]
+            start_refresh = cache_key not in _model_list_refreshing
+            if start_refresh:
+                _model_list_refreshing.add(cache_key)
+        
+        if entry is None and wait:
+            if start_refresh:
+                _refresh_models(cache_key, provider, api_key)
+            entry = _model_list_cache.get(cache_key)
+        elif start_refresh:
+            threading.Thread(
+                target=_refresh_models,
+                args=(cache_key, provider, api_key),
+                daemon=True
+            ).start()
+        
+        if entry is not None:
+            return entry[1]
     
     # Return locally defined models
     return AVAILABLE_MODELS.get(provider, [])
 
+def _list_openai_models(api_key: str) -> List[Dict[str, Any]]:
+    """Fetch available models from OpenAI API, raising on failure."""
+    models = get_openai_client(api_key).models.list()
+    model_list = []
+    for model in models.data:
+        # Filter for chat models only
+        if "gpt" in model.id and any(x in model.id for x in ["gpt-4", "gpt-3.5"]):
+            model_info = {
+                "id": model.id,
+                "name": model.id.replace("gpt-", "GPT-").replace("-", " ").title(),
+                "context_window": 0,  # OpenAI API doesn't provide this info directly
+                "description": "OpenAI model"
+            }
+            model_list.append(model_info)
+    return model_list
+
+def _list_gemini_models(api_key: str) -> List[Dict[str, Any]]:
+    """Fetch available models from Google Gemini API, raising on failure."""
+    models = genai.list_models(
+        client=get_gemini_model_client(api_key),
+        request_options={"timeout": get_gemini_deadline()}
+    )
+    model_list = []
+    for model in models:
+        if "gemini" in model.name:
+            model_info = {
+                "id": model.name,
+                "name": model.name.replace("-", " ").title(),
+                "context_window": 0,
+                "description": "Google Gemini model"
+            }
+            model_list.append(model_info)
+    return model_list
+
+def _list_openrouter_models(api_key: str) -> List[Dict[str, Any]]:
+    """Fetch available models from OpenRouter API, raising on failure."""
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {api_key}"
+    }
+    
+    response = http_get(
+        AIProvider.OPENROUTER.value,
+        "https://openrouter.ai/api/v1/models",
+        headers=headers
+    )
+    response.raise_for_status()
+    result = response.json()
+    
+    model_list = []
+    for model in result.get("data", []):
+        model_info = {
+            "id": model.get("id"),
+            "name": model.get("name", model.get("id", "Unknown")),
+            "context_window": model.get("context_length", 0),
+            "description": f"{model.get('description', 'Model from OpenRouter')}"
+        }
+        model_list.append(model_info)
+    return model_list
+
 def get_openai_models(api_key: str) -> List[Dict[str, Any]]:
     """Fetch available models from OpenAI API"""
-    openai.api_key = api_key
     try:
-        models = openai.models.list()
-        model_list = []
-        for model in models.data:
-            # Filter for chat models only
-            if "gpt" in model.id and any(x in model.id for x in ["gpt-4", "gpt-3.5"]):
-                model_info = {
-                    "id": model.id,
-                    "name": model.id.replace("gpt-", "GPT-").replace("-", " ").title(),
-                    "context_window": 0,  # OpenAI API doesn't provide this info directly
-                    "description": "OpenAI model"
-                }
-                model_list.append(model_info)
-        return model_list
+        return _list_openai_models(api_key)
     except Exception as e:
         # Fall back to predefined models
         return AVAILABLE_MODELS.get(AIProvider.OPENAI.value, [])
 
 def get_gemini_models(api_key: str) -> List[Dict[str, Any]]:
     """Fetch available models from Google Gemini API"""
-    genai.configure(api_key=api_key)
     try:
-        models = genai.list_models()
-        model_list = []
-        for model in models:
-            if "gemini" in model.name:
-                model_info = {
-                    "id": model.name,
-                    "name": model.name.replace("-", " ").title(),
-                    "context_window": 0,
-                    "description": "Google Gemini model"
-                }
-                model_list.append(model_info)
-        return model_list
+        return _list_gemini_models(api_key)
     except Exception as e:
         # Fall back to predefined models
         return AVAILABLE_MODELS.get(AIProvider.GOOGLE.value, [])
 
 def get_openrouter_models(api_key: str) -> List[Dict[str, Any]]:
     """Fetch available models from OpenRouter API"""
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {api_key}"
-    }
-    
     try:
-        response = requests.get(
-            "https://openrouter.ai/api/v1/models",
-            headers=headers
-        )
-        response.raise_for_status()
-        result = response.json()
-        
-        model_list = []
-        for model in result.get("data", []):
-            model_info = {
-                "id": model.get("id"),
-                "name": model.get("name", model.get("id", "Unknown")),
-                "context_window": model.get("context_length", 0),
-                "description": f"{model.get('description', 'Model from OpenRouter')}"
-            }
-            model_list.append(model_info)
-        return model_list
+        return _list_openrouter_models(api_key)
     except Exception as e:
         # Fall back to predefined models
         return AVAILABLE_MODELS.get(AIProvider.OPENROUTER.value, [])
 
+def _build_resume_prompts(
+    resume_text: str,
+    extracted_skills: Optional[Dict[str, List[str]]] = None,
+    extracted_sections: Optional[Mapping[str, str]] = None
+) -> Tuple[str, str]:
+    """Assemble the (context, user prompt) pair for a resume analysis."""
+    # Prepare the full prompt with the resume text and extracted info
+    full_prompt = f"Resume Text:\n\n{resume_text}\n\n"
+    
+    if extracted_skills:
+        tech_skills = ", ".join(extracted_skills.get("technical_skills", []))
+        soft_skills = ", ".join(extracted_skills.get("soft_skills", []))
+        full_prompt += f"Extracted Technical Skills: {tech_skills}\n\n"
+        full_prompt += f"Extracted Soft Skills: {soft_skills}\n\n"
+    
+    if extracted_sections:
+        full_prompt += "Extracted Resume Sections:\n"
+        for section in extracted_sections:
+            # Add only the first 200 chars of each section to avoid very long prompts
+            content_preview = section_preview(extracted_sections, section, 200)
+            full_prompt += f"{section.upper()}: {content_preview}\n\n"
+    
+    user_prompt = """
+    Please analyze this resume and provide the following:
+    
+    1. Overall Resume Assessment (strength/quality)
+    2. Key Strengths
+    3. Areas for Improvement 
+    4. Suggestions to enhance impact
+    5. Recommended action items in order of priority
+    
+    Focus on content, impact, and relevance rather than formatting.
+    """
+    
+    return full_prompt, user_prompt
+
+def _analysis_cache_key(provider: str, api_key: str, system_prompt: str, context: str, user_prompt: str, max_tokens: int, model_id: str = None) -> str:
+    """Build the response cache key; custom APIs are keyed by their endpoint as the model."""
+    if provider == AIProvider.CUSTOM.value:
+        model_id = api_key.split('|', 1)[0].strip()
+    return response_cache_key(provider, model_id, system_prompt, context + user_prompt, max_tokens)
+
+def _dispatch_analysis(provider: str, api_key: str, system_prompt: str, context: str, user_prompt: str, max_tokens: int, model_id: str = None) -> Dict[str, Any]:
+    """
+    Route a prompt to the provider, serving repeated identical requests from the response cache.
+    
+    Results carry a "cached" flag telling whether they came from the cache.
+    """
+    cache = get_response_cache()
+    cache_key = _analysis_cache_key(provider, api_key, system_prompt, context, user_prompt, max_tokens, model_id)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        cached["cached"] = True
+        return cached
+    
+    if provider == AIProvider.OPENAI.value:
+        result = analyze_with_openai(api_key, system_prompt, context, user_prompt, max_tokens, model_id)
+    elif provider == AIProvider.GOOGLE.value:
+        result = analyze_with_gemini(api_key, system_prompt, context, user_prompt, max_tokens, model_id)
+    elif provider == AIProvider.OPENROUTER.value:
+        result = analyze_with_openrouter(api_key, system_prompt, context, user_prompt, max_tokens, model_id)
+    elif provider == AIProvider.ANTHROPIC.value:
+        result = analyze_with_anthropic(api_key, system_prompt, context, user_prompt, max_tokens, model_id)
+    elif provider == AIProvider.COHERE.value:
+        result = analyze_with_cohere(api_key, system_prompt, context, user_prompt, max_tokens, model_id)
+    elif provider == AIProvider.NVIDIA.value:
+        result = analyze_with_nvidia(api_key, system_prompt, context, user_prompt, max_tokens, model_id)
+    elif provider == AIProvider.CUSTOM.value:
+        result = analyze_with_custom_api(api_key, system_prompt, context, user_prompt, max_tokens)
+    else:
+        raise AIServiceError(f"Unsupported AI provider: {provider}")
+    
+    # A fallback model's answer must not be served for the requested model later
+    if not result.get("fallback"):
+        cache.put(cache_key, result)
+    return dict(result, cached=False)
+
 def analyze_resume_with_ai(
     resume_text: str, 
     provider: str, 
@@ -190,7 +361,7 @@ def analyze_resume_with_ai(
     system_prompt: str,
     model_id: str = None,
     extracted_skills: Optional[Dict[str, List[str]]] = None,
-    extracted_sections: Optional[Dict[str, str]] = None,
+    extracted_sections: Optional[Mapping[str, str]] = None,
     max_tokens: int = 1000
 ) -> Dict[str, Any]:
     """
@@ -212,64 +383,23 @@ def analyze_resume_with_ai(
     if not validate_api_key(provider, api_key):
         raise AIServiceError("Invalid API key format for the selected provider.")
     
-    # Prepare the full prompt with the resume text and extracted info
-    full_prompt = f"Resume Text:\n\n{resume_text}\n\n"
-    
-    if extracted_skills:
-        tech_skills = ", ".join(extracted_skills.get("technical_skills", []))
-        soft_skills = ", ".join(extracted_skills.get("soft_skills", []))
-        full_prompt += f"Extracted Technical Skills: {tech_skills}\n\n"
-        full_prompt += f"Extracted Soft Skills: {soft_skills}\n\n"
-    
-    if extracted_sections:
-        full_prompt += "Extracted Resume Sections:\n"
-        for section, content in extracted_sections.items():
-            # Add only the first 200 chars of each section to avoid very long prompts
-            content_preview = content[:200] + "..." if len(content) > 200 else content
-            full_prompt += f"{section.upper()}: {content_preview}\n\n"
-    
-    user_prompt = """
-    Please analyze this resume and provide the following:
-    
-    1. Overall Resume Assessment (strength/quality)
-    2. Key Strengths
-    3. Areas for Improvement 
-    4. Suggestions to enhance impact
-    5. Recommended action items in order of priority
-    
-    Focus on content, impact, and relevance rather than formatting.
-    """
+    full_prompt, user_prompt = _build_resume_prompts(resume_text, extracted_skills, extracted_sections)
     
     try:
-        if provider == AIProvider.OPENAI.value:
-            return analyze_with_openai(api_key, system_prompt, full_prompt, user_prompt, max_tokens, model_id)
-        elif provider == AIProvider.GOOGLE.value:
-            return analyze_with_gemini(api_key, system_prompt, full_prompt, user_prompt, max_tokens, model_id)
-        elif provider == AIProvider.OPENROUTER.value:
-            return analyze_with_openrouter(api_key, system_prompt, full_prompt, user_prompt, max_tokens, model_id)
-        elif provider == AIProvider.ANTHROPIC.value:
-            return analyze_with_anthropic(api_key, system_prompt, full_prompt, user_prompt, max_tokens, model_id)
-        elif provider == AIProvider.COHERE.value:
-            return analyze_with_cohere(api_key, system_prompt, full_prompt, user_prompt, max_tokens, model_id)
-        elif provider == AIProvider.NVIDIA.value:
-            return analyze_with_nvidia(api_key, system_prompt, full_prompt, user_prompt, max_tokens, model_id)
-        elif provider == AIProvider.CUSTOM.value:
-            return analyze_with_custom_api(api_key, system_prompt, full_prompt, user_prompt, max_tokens)
-        else:
-            raise AIServiceError(f"Unsupported AI provider: {provider}")
+        return _dispatch_analysis(provider, api_key, system_prompt, full_prompt, user_prompt, max_tokens, model_id)
     except Exception as e:
         raise AIServiceError(f"Error analyzing resume with {provider}: {str(e)}")
 
 def analyze_with_openai(api_key: str, system_prompt: str, context: str, user_prompt: str, max_tokens: int, model_id: str = None) -> Dict[str, Any]:
     """Use OpenAI API to analyze the resume."""
-    openai.api_key = api_key
+    client = get_openai_client(api_key)
     
     # Default model if none specified
     if not model_id:
         model_id = "gpt-4o"
     
     try:
-        response = openai.chat.completions.create(
+        response = client.chat.completions.create(
             model=model_id,
             messages=[
                 {"role": "system", "content": system_prompt},
@@ -290,7 +420,7 @@ def analyze_with_openai(api_key: str, system_prompt: str, context: str, user_pro
         # Try again with gpt-3.5-turbo if the requested model fails
         if model_id != "gpt-3.5-turbo":
             try:
-                response = openai.chat.completions.create(
+                response = client.chat.completions.create(
                     model="gpt-3.5-turbo",
                     messages=[
                         {"role": "system", "content": system_prompt},
@@ -305,34 +435,45 @@ def analyze_with_openai(api_key: str, system_prompt: str, context: str, user_pro
                     "analysis": analysis,
                     "provider": "OpenAI",
                     "model": response.model,
-                    "tokens_used": response.usage.total_tokens
+                    "tokens_used": response.usage.total_tokens,
+                    "fallback": True
                 }
             except Exception as fallback_error:
                 raise AIServiceError(f"OpenAI API error: {str(fallback_error)}")
         else:
             raise AIServiceError(f"OpenAI API error: {str(e)}")
 
+def _gemini_request(model_id: str, prompt: str, max_tokens: int) -> glm.GenerateContentRequest:
+    """Build a Gemini generation request for a single user prompt."""
+    model_name = model_id if "/" in model_id else f"models/{model_id}"
+    return glm.GenerateContentRequest(
+        model=model_name,
+        contents=[glm.Content(role="user", parts=[glm.Part(text=prompt)])],
+        generation_config=glm.GenerationConfig(max_output_tokens=max_tokens, temperature=0.4)
+    )
+
+def _gemini_text(response: glm.GenerateContentResponse) -> str:
+    """Return the text of the first candidate of a Gemini response or stream chunk."""
+    return "".join(part.text for candidate in response.candidates[:1] for part in candidate.content.parts)
+
 def analyze_with_gemini(api_key: str, system_prompt: str, context: str, user_prompt: str, max_tokens: int, model_id: str = None) -> Dict[str, Any]:
     """Use Google's Gemini API to analyze the resume."""
-    genai.configure(api_key=api_key)
     
     # Default model if none specified
     if not model_id:
         model_id = "gemini-pro"
     
     try:
-        model = genai.GenerativeModel(model_id)
-        
-        # Combine system prompt and user content
-        prompt = f"{system_prompt}\n\n{context}{user_prompt}"
-        
-        response = model.generate_content(prompt, generation_config={
-            "max_output_tokens": max_tokens,
-            "temperature": 0.4
-        })
+        # Call the per-key client directly rather than the process-wide genai.configure()
+        response = get_gemini_generative_client(api_key).generate_content(
+            _gemini_request(model_id, f"{system_prompt}\n\n{context}{user_prompt}", max_tokens),
+            timeout=get_gemini_deadline()
+        )
+        if not response.candidates:
+            raise ValueError(f"no candidates returned ({response.prompt_feedback})")
         
         return {
-            "analysis": response.text,
+            "analysis": _gemini_text(response),
             "provider": "Google Gemini",
             "model": model_id,
             "tokens_used": None  # Gemini doesn't provide token usage info
@@ -362,7 +503,8 @@ def analyze_with_anthropic(api_key: str, system_prompt: str, context: str, user_
     }
     
     try:
-        response = requests.post(
+        response = http_post(
+            AIProvider.ANTHROPIC.value,
             "https://api.anthropic.com/v1/messages",
             headers=headers,
             json=data
@@ -400,7 +542,8 @@ def analyze_with_openrouter(api_key: str, system_prompt: str, context: str, user
     }
     
     try:
-        response = requests.post(
+        response = http_post(
+            AIProvider.OPENROUTER.value,
             "https://openrouter.ai/api/v1/chat/completions",
             headers=headers,
             json=data
@@ -436,7 +579,8 @@ def analyze_with_cohere(api_key: str, system_prompt: str, context: str, user_pro
     }
     
     try:
-        response = requests.post(
+        response = http_post(
+            AIProvider.COHERE.value,
             "https://api.cohere.ai/v1/chat",
             headers=headers,
             json=data
@@ -474,7 +618,8 @@ def analyze_with_nvidia(api_key: str, system_prompt: str, context: str, user_pro
     }
     
     try:
-        response = requests.post(
+        response = http_post(
+            AIProvider.NVIDIA.value,
             "https://api.nvcf.nvidia.com/v1/chat/completions",
             headers=headers,
             json=data
@@ -512,7 +657,8 @@ def analyze_with_custom_api(api_key: str, system_prompt: str, context: str, user
             "max_tokens": max_tokens
         }
         
-        response = requests.post(
+        response = http_post(
+            AIProvider.CUSTOM.value,
             endpoint_url,
             headers=headers,
             json=data
@@ -532,6 +678,33 @@ def analyze_with_custom_api(api_key: str, system_prompt: str, context: str, user
     except Exception as e:
         raise AIServiceError(f"Custom API error: {str(e)}")
 
+def _build_job_match_prompts(resume_text: str, job_description: str) -> Tuple[str, str]:
+    """Assemble the (system prompt, user prompt) pair for a job match analysis."""
+    system_prompt = """
+    You are an expert ATS (Applicant Tracking System) and career coach. 
+    Your task is to analyze how well a resume matches a job description.
+    Be detailed, fair, and constructive in your assessment.
+    """
+    
+    user_prompt = f"""
+    Please analyze how well this resume matches the job description below.
+    
+    RESUME:
+    {resume_text}
+    
+    JOB DESCRIPTION:
+    {job_description}
+    
+    Please provide:
+    1. Match Score (estimated percentage match)
+    2. Key Matching Qualifications
+    3. Missing Skills/Requirements
+    4. Suggestions to Improve Match
+    5. Keywords to add to the resume
+    """
+    
+    return system_prompt, user_prompt
+
 def get_job_match_analysis(
     resume_text: str,
     job_description: str,
@@ -554,43 +727,281 @@ def get_job_match_analysis(
     Returns:
         Dictionary containing the match analysis
     """
-    system_prompt = """
-    You are an expert ATS (Applicant Tracking System) and career coach. 
-    Your task is to analyze how well a resume matches a job description.
-    Be detailed, fair, and constructive in your assessment.
+    system_prompt, user_prompt = _build_job_match_prompts(resume_text, job_description)
+    
+    # Use the appropriate provider's API
+    return _dispatch_analysis(provider, api_key, system_prompt, "", user_prompt, max_tokens, model_id)
+
+class AnalysisStream:
     """
+    Iterable of analysis text chunks from a streaming provider call.
     
-    user_prompt = f"""
-    Please analyze how well this resume matches the job description below.
+    Iterate it to receive chunks as they arrive; once exhausted, ``result`` holds
+    the same dictionary the non-streaming functions return and ``on_complete``,
+    if set, is called with it. ``fallback`` marks streams answered by a fallback
+    model instead of the one requested.
+    """
     
-    RESUME:
-    {resume_text}
+    def __init__(self, chunks: Iterator[str], provider: str, model: str, on_complete: Optional[Callable[[Dict[str, Any]], None]] = None, fallback: bool = False):
+        self._chunks = chunks
+        self.provider = provider
+        self.model = model
+        self.fallback = fallback
+        self.result: Optional[Dict[str, Any]] = None
+        self.on_complete = on_complete
+    
+    @classmethod
+    def from_result(cls, result: Dict[str, Any]) -> "AnalysisStream":
+        """Wrap a complete result as a stream with a single final chunk."""
+        stream = cls(iter([result["analysis"]]), result["provider"], result["model"])
+        stream.result = dict(result)
+        return stream
+    
+    def __iter__(self) -> Iterator[str]:
+        if self.result is not None:
+            yield from self._chunks
+            return
+        
+        parts = []
+        try:
+            for chunk in self._chunks:
+                if chunk:
+                    parts.append(chunk)
+                    yield chunk
+        except AIServiceError:
+            raise
+        except Exception as e:
+            raise AIServiceError(f"Error streaming analysis from {self.provider}: {str(e)}")
+        
+        self.result = {
+            "analysis": "".join(parts),
+            "provider": self.provider,
+            "model": self.model,
+            "tokens_used": None  # Streaming responses don't report usage consistently
+        }
+        if self.fallback:
+            self.result["fallback"] = True
+        if self.on_complete is not None:
+            self.on_complete(self.result)
+
+def _iter_sse_events(response) -> Iterator[Dict[str, Any]]:
+    """Yield the JSON payloads of a server-sent events response until [DONE]."""
+    for line in response.iter_lines(decode_unicode=True):
+        if not line or not line.startswith("data:"):
+            continue
+        payload = line[len("data:"):].strip()
+        if payload == "[DONE]":
+            break
+        yield json.loads(payload)
+
+def _iter_chat_completion_deltas(response) -> Iterator[str]:
+    """Yield text deltas from an OpenAI-compatible chat completion stream."""
+    for event in _iter_sse_events(response):
+        choices = event.get("choices") or []
+        if choices:
+            yield choices[0].get("delta", {}).get("content") or ""
+
+def stream_with_openai(api_key: str, system_prompt: str, context: str, user_prompt: str, max_tokens: int, model_id: str = None) -> AnalysisStream:
+    """Stream an OpenAI analysis, falling back to gpt-3.5-turbo if the model is rejected."""
+    client = get_openai_client(api_key)
     
-    JOB DESCRIPTION:
-    {job_description}
+    # Default model if none specified
+    if not model_id:
+        model_id = "gpt-4o"
     
-    Please provide:
-    1. Match Score (estimated percentage match)
-    2. Key Matching Qualifications
-    3. Missing Skills/Requirements
-    4. Suggestions to Improve Match
-    5. Keywords to add to the resume
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": context + user_prompt}
+    ]
+    
+    fallback = False
+    try:
+        response = client.chat.completions.create(model=model_id, messages=messages, max_tokens=max_tokens, stream=True)
+    except Exception as e:
+        if model_id == "gpt-3.5-turbo":
+            raise AIServiceError(f"OpenAI API error: {str(e)}")
+        model_id = "gpt-3.5-turbo"
+        fallback = True
+        try:
+            response = client.chat.completions.create(model=model_id, messages=messages, max_tokens=max_tokens, stream=True)
+        except Exception as fallback_error:
+            raise AIServiceError(f"OpenAI API error: {str(fallback_error)}")
+    
+    def chunks():
+        for chunk in response:
+            if chunk.choices:
+                yield chunk.choices[0].delta.content or ""
+    
+    return AnalysisStream(chunks(), "OpenAI", model_id, fallback=fallback)
+
+def stream_with_gemini(api_key: str, system_prompt: str, context: str, user_prompt: str, max_tokens: int, model_id: str = None) -> AnalysisStream:
+    """Stream a Google Gemini analysis."""
+    # Default model if none specified
+    if not model_id:
+        model_id = "gemini-pro"
+    
+    try:
+        response = get_gemini_generative_client(api_key).stream_generate_content(
+            _gemini_request(model_id, f"{system_prompt}\n\n{context}{user_prompt}", max_tokens),
+            timeout=get_gemini_deadline()
+        )
+    except Exception as e:
+        raise AIServiceError(f"Gemini API error: {str(e)}")
+    
+    def chunks():
+        for chunk in response:
+            yield _gemini_text(chunk)
+    
+    return AnalysisStream(chunks(), "Google Gemini", model_id)
+
+def stream_with_anthropic(api_key: str, system_prompt: str, context: str, user_prompt: str, max_tokens: int, model_id: str = None) -> AnalysisStream:
+    """Stream an Anthropic Claude analysis."""
+    headers = {
+        "Content-Type": "application/json",
+        "x-api-key": api_key,
+        "anthropic-version": "2023-06-01"
+    }
+    
+    # Default model if none specified
+    if not model_id:
+        model_id = "claude-3-opus-20240229"
+    
+    data = {
+        "model": model_id,
+        "max_tokens": max_tokens,
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": context + user_prompt}
+        ],
+        "stream": True
+    }
+    
+    try:
+        response = http_post(
+            AIProvider.ANTHROPIC.value,
+            "https://api.anthropic.com/v1/messages",
+            headers=headers,
+            json=data,
+            stream=True
+        )
+        response.raise_for_status()
+    except Exception as e:
+        raise AIServiceError(f"Anthropic API error: {str(e)}")
+    
+    def chunks():
+        with response:
+            for event in _iter_sse_events(response):
+                if event.get("type") == "content_block_delta":
+                    yield event.get("delta", {}).get("text", "")
+    
+    return AnalysisStream(chunks(), "Anthropic Claude", model_id)
+
+def _stream_chat_completions(provider: str, label: str, url: str, api_key: str, system_prompt: str, context: str, user_prompt: str, max_tokens: int, model_id: str) -> AnalysisStream:
+    """Stream from an OpenAI-compatible chat completions endpoint."""
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {api_key}"
+    }
+    
+    data = {
+        "model": model_id,
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": context + user_prompt}
+        ],
+        "max_tokens": max_tokens,
+        "stream": True
+    }
+    
+    try:
+        response = http_post(provider, url, headers=headers, json=data, stream=True)
+        response.raise_for_status()
+    except Exception as e:
+        raise AIServiceError(f"{label} API error: {str(e)}")
+    
+    def chunks():
+        with response:
+            yield from _iter_chat_completion_deltas(response)
+    
+    return AnalysisStream(chunks(), label, model_id)
+
+def stream_with_openrouter(api_key: str, system_prompt: str, context: str, user_prompt: str, max_tokens: int, model_id: str = None) -> AnalysisStream:
+    """Stream an analysis through OpenRouter."""
+    return _stream_chat_completions(
+        AIProvider.OPENROUTER.value, "OpenRouter", "https://openrouter.ai/api/v1/chat/completions",
+        api_key, system_prompt, context, user_prompt, max_tokens, model_id or "openai/gpt-4o"
+    )
+
+def stream_with_nvidia(api_key: str, system_prompt: str, context: str, user_prompt: str, max_tokens: int, model_id: str = None) -> AnalysisStream:
+    """Stream an analysis from the NVIDIA NIM API."""
+    return _stream_chat_completions(
+        AIProvider.NVIDIA.value, "NVIDIA NIMs", "https://api.nvcf.nvidia.com/v1/chat/completions",
+        api_key, system_prompt, context, user_prompt, max_tokens, model_id or "llama3-70b-instruct"
+    )
+
+def _stream_analysis(provider: str, api_key: str, system_prompt: str, context: str, user_prompt: str, max_tokens: int, model_id: str = None) -> AnalysisStream:
+    """Open a stream for providers that support it; others (and cache hits) return one final chunk."""
+    streamers = {
+        AIProvider.OPENAI.value: stream_with_openai,
+        AIProvider.GOOGLE.value: stream_with_gemini,
+        AIProvider.OPENROUTER.value: stream_with_openrouter,
+        AIProvider.ANTHROPIC.value: stream_with_anthropic,
+        AIProvider.NVIDIA.value: stream_with_nvidia
+    }
+    if provider not in streamers:
+        return AnalysisStream.from_result(_dispatch_analysis(provider, api_key, system_prompt, context, user_prompt, max_tokens, model_id))
+    
+    cache = get_response_cache()
+    cache_key = _analysis_cache_key(provider, api_key, system_prompt, context, user_prompt, max_tokens, model_id)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        cached["cached"] = True
+        return AnalysisStream.from_result(cached)
+    
+    stream = streamers[provider](api_key, system_prompt, context, user_prompt, max_tokens, model_id)
+    
+    def store(result: Dict[str, Any]) -> None:
+        if not result.get("fallback"):
+            cache.put(cache_key, result)
+        result["cached"] = False
+    
+    stream.on_complete = store
+    return stream
+
+def analyze_resume_with_ai_stream(
+    resume_text: str, 
+    provider: str, 
+    api_key: str, 
+    system_prompt: str,
+    model_id: str = None,
+    extracted_skills: Optional[Dict[str, List[str]]] = None,
+    extracted_sections: Optional[Mapping[str, str]] = None,
+    max_tokens: int = 1000
+) -> AnalysisStream:
     """
+    Streaming variant of analyze_resume_with_ai.
     
-    # Use the appropriate provider's API
-    if provider == AIProvider.OPENAI.value:
-        return analyze_with_openai(api_key, system_prompt, "", user_prompt, max_tokens, model_id)
-    elif provider == AIProvider.GOOGLE.value:
-        return analyze_with_gemini(api_key, system_prompt, "", user_prompt, max_tokens, model_id)
-    elif provider == AIProvider.OPENROUTER.value:
-        return analyze_with_openrouter(api_key, system_prompt, "", user_prompt, max_tokens, model_id)
-    elif provider == AIProvider.ANTHROPIC.value:
-        return analyze_with_anthropic(api_key, system_prompt, "", user_prompt, max_tokens, model_id)
-    elif provider == AIProvider.COHERE.value:
-        return analyze_with_cohere(api_key, system_prompt, "", user_prompt, max_tokens, model_id)
-    elif provider == AIProvider.NVIDIA.value:
-        return analyze_with_nvidia(api_key, system_prompt, "", user_prompt, max_tokens, model_id)
-    elif provider == AIProvider.CUSTOM.value:
-        return analyze_with_custom_api(api_key, system_prompt, "", user_prompt, max_tokens)
-    else:
-        raise AIServiceError(f"Unsupported AI provider: {provider}") 
\ No newline at end of file
+    Takes the same arguments and returns an AnalysisStream whose ``result``
+    matches the dictionary analyze_resume_with_ai would have returned.
+    """
+    if not validate_api_key(provider, api_key):
+        raise AIServiceError("Invalid API key format for the selected provider.")
+    
+    full_prompt, user_prompt = _build_resume_prompts(resume_text, extracted_skills, extracted_sections)
+    
+    try:
+        return _stream_analysis(provider, api_key, system_prompt, full_prompt, user_prompt, max_tokens, model_id)
+    except Exception as e:
+        raise AIServiceError(f"Error analyzing resume with {provider}: {str(e)}")
+
+def get_job_match_analysis_stream(
+    resume_text: str,
+    job_description: str,
+    provider: str,
+    api_key: str,
+    model_id: str = None,
+    max_tokens: int = 1000
+) -> AnalysisStream:
+    """Streaming variant of get_job_match_analysis."""
+    system_prompt, user_prompt = _build_job_match_prompts(resume_text, job_description)
+    return _stream_analysis(provider, api_key, system_prompt, "", user_prompt, max_tokens, model_id)
@@ -0,0 +1,191 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple, Union
+
+# Environment variable pointing at an SQLite file for the optional on-disk tier
+CACHE_PATH_ENV_VAR = "RESUME_EXTRACTION_CACHE"
+
+# Seconds a disk entry's last access time may lag behind; hits within it skip the write
+DISK_TOUCH_INTERVAL = 60.0
+
+
+def content_hash(data: Union[bytes, memoryview]) -> str:
+    """Return the SHA-256 hex digest used as the cache key for uploaded bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+class ExtractionCache:
+    """
+    Two-tier cache of resume extraction results keyed by content hash.
+
+    The first tier is an in-process LRU dictionary. The optional second tier is an
+    SQLite file holding zlib-compressed JSON payloads, evicted least-recently-used
+    once their total size exceeds ``max_disk_bytes``. A disk hit only rewrites the
+    entry's access time when it is older than DISK_TOUCH_INTERVAL, so repeated
+    hits on a hot entry cost no write. Every entry records the
+    parser version that produced it; a lookup with a different version is treated
+    as a miss and the stale entry is dropped.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        disk_path: Optional[str] = None,
+        max_disk_bytes: int = 256 * 1024 * 1024
+    ):
+        self.max_entries = max_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[Tuple[str, str], Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+
+        if disk_path:
+            directory = os.path.dirname(os.path.abspath(disk_path))
+            os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(disk_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS extractions ("
+                "digest TEXT NOT NULL, kind TEXT NOT NULL, parser_version TEXT NOT NULL, "
+                "payload BLOB NOT NULL, size INTEGER NOT NULL, last_access REAL NOT NULL, "
+                "PRIMARY KEY (digest, kind))"
+            )
+            self._db.commit()
+
+    def get(self, digest: str, kind: str, parser_version: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached extraction result.
+
+        Args:
+            digest: SHA-256 hex digest of the file bytes
+            kind: File type the bytes were parsed as (e.g. "pdf" or "docx")
+            parser_version: Version string of the parser that would produce the result
+
+        Returns:
+            A copy of the cached result, or None on a miss or version mismatch
+        """
+        key = (digest, kind)
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] == parser_version:
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return dict(entry[1])
+                del self._memory[key]
+
+            result = self._disk_get(digest, kind, parser_version)
+            if result is None:
+                self.misses += 1
+                return None
+
+            self._memory_put(key, parser_version, result)
+            self.hits += 1
+            return dict(result)
+
+    def put(self, digest: str, kind: str, parser_version: str, result: Dict[str, Any]) -> None:
+        """Store an extraction result in every configured tier."""
+        key = (digest, kind)
+        with self._lock:
+            self._memory_put(key, parser_version, dict(result))
+            self._disk_put(digest, kind, parser_version, result)
+
+    def clear(self) -> None:
+        """Remove all entries from every tier."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM extractions")
+                self._db.commit()
+
+    def close(self) -> None:
+        """Close the on-disk tier, if any."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _memory_put(self, key: Tuple[str, str], parser_version: str, result: Dict[str, Any]) -> None:
+        self._memory[key] = (parser_version, result)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _disk_get(self, digest: str, kind: str, parser_version: str) -> Optional[Dict[str, Any]]:
+        if self._db is None:
+            return None
+
+        row = self._db.execute(
+            "SELECT parser_version, payload, last_access FROM extractions WHERE digest = ? AND kind = ?",
+            (digest, kind)
+        ).fetchone()
+        if row is None:
+            return None
+
+        if row[0] != parser_version:
+            self._db.execute("DELETE FROM extractions WHERE digest = ? AND kind = ?", (digest, kind))
+            self._db.commit()
+            return None
+
+        now = time.time()
+        if now - row[2] >= DISK_TOUCH_INTERVAL:
+            self._db.execute(
+                "UPDATE extractions SET last_access = ? WHERE digest = ? AND kind = ?",
+                (now, digest, kind)
+            )
+            self._db.commit()
+        return json.loads(zlib.decompress(row[1]).decode("utf-8"))
+
+    def _disk_put(self, digest: str, kind: str, parser_version: str, result: Dict[str, Any]) -> None:
+        if self._db is None:
+            return
+
+        payload = zlib.compress(json.dumps(result).encode("utf-8"))
+        if len(payload) > self.max_disk_bytes:
+            return
+
+        self._db.execute(
+            "INSERT OR REPLACE INTO extractions "
+            "(digest, kind, parser_version, payload, size, last_access) VALUES (?, ?, ?, ?, ?, ?)",
+            (digest, kind, parser_version, payload, len(payload), time.time())
+        )
+        self._evict_disk()
+        self._db.commit()
+
+    def _evict_disk(self) -> None:
+        """Drop least-recently-used rows until the disk tier fits its size budget."""
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM extractions").fetchone()[0]
+        if total <= self.max_disk_bytes:
+            return
+
+        rows = self._db.execute("SELECT digest, kind, size FROM extractions ORDER BY last_access").fetchall()
+        for digest, kind, size in rows:
+            if total <= self.max_disk_bytes:
+                break
+            self._db.execute("DELETE FROM extractions WHERE digest = ? AND kind = ?", (digest, kind))
+            total -= size
+
+
+_default_cache: Optional[ExtractionCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_extraction_cache() -> ExtractionCache:
+    """
+    Return the process-wide extraction cache.
+
+    The on-disk tier is enabled when the RESUME_EXTRACTION_CACHE environment
+    variable names an SQLite file.
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ExtractionCache(disk_path=os.environ.get(CACHE_PATH_ENV_VAR))
+        return _default_cache
@@ -0,0 +1,104 @@
+import os
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from typing import Dict, Optional, Tuple
+import requests
+from requests.adapters import HTTPAdapter
+
+# Defaults can be overridden through the environment or configure_http_clients()
+DEFAULT_CONNECT_TIMEOUT = float(os.environ.get("AI_HTTP_CONNECT_TIMEOUT", "10"))
+DEFAULT_READ_TIMEOUT = float(os.environ.get("AI_HTTP_READ_TIMEOUT", "120"))
+DEFAULT_POOL_MAXSIZE = int(os.environ.get("AI_HTTP_POOL_MAXSIZE", "16"))
+
+_settings = {
+    "connect_timeout": DEFAULT_CONNECT_TIMEOUT,
+    "read_timeout": DEFAULT_READ_TIMEOUT,
+    "pool_maxsize": DEFAULT_POOL_MAXSIZE,
+    "pool_block": False,
+}
+_sessions: Dict[str, requests.Session] = {}
+_lock = threading.Lock()
+
+
+def _create_session() -> requests.Session:
+    """Create a keep-alive session with a bounded connection pool and no cookie jar."""
+    session = requests.Session()
+    # Sessions are shared by every user of a provider, so never persist cookies between requests
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=_settings["pool_maxsize"],
+        pool_block=_settings["pool_block"],
+        max_retries=0
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def configure_http_clients(
+    connect_timeout: Optional[float] = None,
+    read_timeout: Optional[float] = None,
+    pool_maxsize: Optional[int] = None,
+    pool_block: Optional[bool] = None
+) -> None:
+    """
+    Change timeouts and pool limits for provider HTTP clients.
+
+    Args:
+        connect_timeout: Seconds to wait for a TCP/TLS connection
+        read_timeout: Seconds to wait between bytes of the response
+        pool_maxsize: Maximum keep-alive connections per host and provider
+        pool_block: Wait for a free connection instead of opening extra ones past the limit
+    """
+    with _lock:
+        if connect_timeout is not None:
+            _settings["connect_timeout"] = connect_timeout
+        if read_timeout is not None:
+            _settings["read_timeout"] = read_timeout
+        if pool_maxsize is not None:
+            _settings["pool_maxsize"] = pool_maxsize
+        if pool_block is not None:
+            _settings["pool_block"] = pool_block
+
+        # Rebuild sessions lazily so new pool settings take effect
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+def get_timeout() -> Tuple[float, float]:
+    """Return the (connect, read) timeout tuple passed to every request."""
+    return (_settings["connect_timeout"], _settings["read_timeout"])
+
+
+def get_http_session(provider: str) -> requests.Session:
+    """Return the pooled session for a provider, creating it on first use."""
+    session = _sessions.get(provider)
+    if session is None:
+        with _lock:
+            session = _sessions.get(provider)
+            if session is None:
+                session = _create_session()
+                _sessions[provider] = session
+    return session
+
+
+def close_http_clients() -> None:
+    """Close every pooled session and its open connections."""
+    with _lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+def http_post(provider: str, url: str, **kwargs) -> requests.Response:
+    """POST through the provider's pooled session with the configured timeouts."""
+    kwargs.setdefault("timeout", get_timeout())
+    return get_http_session(provider).post(url, **kwargs)
+
+
+def http_get(provider: str, url: str, **kwargs) -> requests.Response:
+    """GET through the provider's pooled session with the configured timeouts."""
+    kwargs.setdefault("timeout", get_timeout())
+    return get_http_session(provider).get(url, **kwargs)
@@ -1,22 +1,183 @@
-import PyPDF2
+import docx
 from docx import Document
-from typing import BinaryIO, Dict, Any, List
+from typing import BinaryIO, Dict, Any, Iterable, Iterator, List, Optional, Tuple
 import re
 import io
+import zipfile
+import xml.etree.ElementTree as ET
+from .extraction_cache import ExtractionCache, content_hash, get_extraction_cache
+from .pdf_backends import (
+    PDF_PARALLEL_PAGES, extract_pdf_pages_parallel, iter_pdf_backend_pages, parallel_extraction_supported,
+    pdf_backend_version, pdf_page_count, pdf_worker_count, resolve_pdf_backends
+)
+from .resume_sections import (
+    DEFAULT_SECTION_MATCHER, SECTION_HEADERS, SECTION_HEADER_SYNONYMS, ResumeSections, SectionHeaderMatcher,
+    SectionSpan, SectionView, extract_resume_sections, index_resume_sections
+)
+from .resume_source import ResumeSource, open_resume_source, resume_buffer, source_name
+from .upload_guard import check_resume_upload, extract_resume_text_guarded
 
-def extract_text_from_pdf(file: BinaryIO) -> str:
-    """Extract text from a PDF file."""
-    # Need to seek to beginning in case file was already read
+# Bump when the extraction or section logic changes so cached results are invalidated
+PARSER_VERSION = "3"
+
+def _limit_chars(pages: Iterable[str], max_chars: Optional[int]) -> Iterator[str]:
+    """Yield pages until max_chars characters have been produced, truncating the last one."""
+    remaining_chars = max_chars
+    for page_text in pages:
+        if remaining_chars is not None:
+            page_text = page_text[:remaining_chars]
+            remaining_chars -= len(page_text)
+        yield page_text
+        if remaining_chars is not None and remaining_chars <= 0:
+            break
+
+def iter_pdf_pages(
+    file: BinaryIO,
+    max_pages: Optional[int] = None,
+    max_chars: Optional[int] = None,
+    backend: Optional[str] = None
+) -> Iterator[str]:
+    """
+    Yield the text of a PDF one page at a time.
+    
+    Pages are parsed lazily, so stopping early (or hitting a limit) means the
+    remaining pages are never parsed and memory stays flat regardless of size.
+    
+    Args:
+        file: The PDF file
+        max_pages: Stop after this many pages
+        max_chars: Stop once this many characters have been yielded; the last page is truncated
+        backend: PDF text backend, "auto" or a name from PDF_BACKENDS (defaults to RESUME_PDF_BACKEND)
+        
+    Returns:
+        Iterator over page texts
+    """
+    return _limit_chars(iter_pdf_backend_pages(file, max_pages, backend), max_chars)
+
+def join_pdf_pages(pages: Iterable[str], max_chars: Optional[int] = None) -> str:
+    """Join page texts into the document text, truncated to max_chars characters."""
+    return "\n".join(_limit_chars(pages, max_chars)).strip()
+
+def extract_text_from_pdf(
+    file: BinaryIO,
+    max_pages: Optional[int] = None,
+    max_chars: Optional[int] = None,
+    backend: Optional[str] = None,
+    parallel: Optional[bool] = None
+) -> str:
+    """
+    Extract text from a PDF file, optionally bounded by page and character limits.
+    
+    Documents with at least PDF_PARALLEL_PAGES pages (after max_pages) have their
+    pages extracted by a process pool when more than one worker is available;
+    short resumes keep the serial path. parallel=True forces the pool and
+    parallel=False disables it.
+    """
+    # Only count pages when the pool could be used, so most resumes are parsed once
+    pool_possible = parallel or (parallel is None and PDF_PARALLEL_PAGES and pdf_worker_count() > 1)
+    if pool_possible and parallel_extraction_supported():
+        try:
+            page_count = pdf_page_count(file)
+        except Exception:
+            page_count = 0  # let the serial path's backend fallback deal with it
+        if max_pages is not None:
+            page_count = min(page_count, max_pages)
+        
+        if page_count > 1 and (parallel or page_count >= PDF_PARALLEL_PAGES):
+            try:
+                pages = extract_pdf_pages_parallel(file, page_count, backend, max_chars=max_chars)
+                return join_pdf_pages(pages, max_chars)
+            except Exception as e:
+                print(f"Warning: Parallel PDF extraction failed ({str(e)}); extracting serially")
+    
+    return join_pdf_pages(iter_pdf_backend_pages(file, max_pages, backend), max_chars)
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+# Run children rendered as text, matching python-docx's Run.text
+_DOCX_RUN_TEXT = {_W + "tab": "\t", _W + "ptab": "\t", _W + "cr": "\n", _W + "noBreakHyphen": "-"}
+
+def iter_docx_lines(file: BinaryIO) -> Iterator[str]:
+    """
+    Stream the lines of a DOCX file straight from word/document.xml.
+    
+    Paragraphs and table rows are yielded in document order. Each table row is
+    one line with its cells joined by " | "; horizontally or vertically merged
+    cells appear once instead of being repeated for every grid column or row
+    they span. Paragraphs and rows are detached from the tree as soon as they
+    are consumed, so memory stays flat for very large documents.
+    
+    Args:
+        file: The DOCX file
+        
+    Returns:
+        Iterator over paragraph and table-row lines
+    """
     file.seek(0)
-    reader = PyPDF2.PdfReader(file)
-    text = ""
-    for page in reader.pages:
-        page_text = page.extract_text() or ""
-        text += page_text + "\n"
-    return text.strip()
+    with zipfile.ZipFile(file) as archive, archive.open("word/document.xml") as xml:
+        paragraphs: List[List[str]] = []  # text parts of open paragraphs (textboxes nest)
+        cells: List[List[str]] = []       # paragraph texts of open table cells
+        rows: List[List[str]] = []        # cell texts of open table rows
+        continued: List[bool] = []        # whether each open cell continues a vertical merge
+        run_depth = 0
+        open_elements: List[ET.Element] = []
+        
+        for event, elem in ET.iterparse(xml, events=("start", "end")):
+            tag = elem.tag
+            if event == "start":
+                open_elements.append(elem)
+                if tag == _W + "p":
+                    paragraphs.append([])
+                elif tag == _W + "r":
+                    run_depth += 1
+                elif tag == _W + "tc":
+                    cells.append([])
+                    continued.append(False)
+                elif tag == _W + "tr":
+                    rows.append([])
+                continue
+            
+            open_elements.pop()
+            if tag == _W + "t":
+                if run_depth and paragraphs:
+                    paragraphs[-1].append(elem.text or "")
+            elif tag == _W + "r":
+                run_depth -= 1
+            elif tag in _DOCX_RUN_TEXT:
+                if run_depth and paragraphs:
+                    paragraphs[-1].append(_DOCX_RUN_TEXT[tag])
+            elif tag == _W + "br":
+                if run_depth and paragraphs and elem.get(_W + "type", "textWrapping") == "textWrapping":
+                    paragraphs[-1].append("\n")
+            elif tag == _W + "vMerge":
+                # A vMerge without val="restart" continues the cell above
+                if continued:
+                    continued[-1] = elem.get(_W + "val", "continue") == "continue"
+            elif tag == _W + "p":
+                text = "".join(paragraphs.pop())
+                if cells:
+                    cells[-1].append(text)
+                else:
+                    yield text
+                if open_elements:
+                    open_elements[-1].remove(elem)
+            elif tag == _W + "tc":
+                cell_text = "\n".join(cells.pop())
+                if rows and not continued.pop():
+                    rows[-1].append(cell_text)
+                if open_elements:
+                    open_elements[-1].remove(elem)
+            elif tag == _W + "tr":
+                row_text = " | ".join(rows.pop())
+                # Rows of a nested table become part of the enclosing cell
+                if cells:
+                    cells[-1].append(row_text)
+                else:
+                    yield row_text
+                if open_elements:
+                    open_elements[-1].remove(elem)
 
-def extract_text_from_docx(file: BinaryIO) -> str:
-    """Extract text from a DOCX file."""
+def extract_text_from_docx_with_python_docx(file: BinaryIO) -> str:
+    """Extract text from a DOCX file through the python-docx object model."""
     file.seek(0)
     doc = Document(file)
     
@@ -34,71 +195,99 @@ def extract_text_from_docx(file: BinaryIO) -> str:
     all_text = "\n".join(paragraphs_text + tables_text)
     return all_text.strip()
 
-def extract_resume_text(file: BinaryIO, filename: str) -> str:
-    """Extract text from a resume file (PDF or DOCX)."""
-    # Make a copy of the file in memory to avoid consuming it
-    file_copy = io.BytesIO(file.getvalue())
+def extract_text_from_docx(file: BinaryIO) -> str:
+    """Extract text from a DOCX file, falling back to python-docx if streaming fails."""
+    try:
+        return "\n".join(iter_docx_lines(file)).strip()
+    except (zipfile.BadZipFile, KeyError, ET.ParseError) as e:
+        print(f"Warning: Streaming DOCX parser failed ({str(e)}); falling back to python-docx")
+        return extract_text_from_docx_with_python_docx(file)
+
+def extract_resume_text(
+    file: ResumeSource,
+    filename: Optional[str] = None,
+    max_pages: Optional[int] = None,
+    max_chars: Optional[int] = None
+) -> str:
+    """
+    Extract text from a resume file (PDF or DOCX).
+    
+    The resume may be a file path (memory-mapped, never read into memory as a
+    whole), a bytes-like object or memoryview, or a file object such as
+    Streamlit's UploadedFile, whose buffer is read in place.
+    
+    max_pages and max_chars bound PDF extraction so oversized documents stop
+    being parsed once the limit is reached.
+    """
+    filename = (filename or source_name(file)).lower()
+    if not filename.endswith((".pdf", ".docx")):
+        raise ValueError("Unsupported file type. Please upload a PDF or DOCX file.")
     
+    # Read through a view of the bytes so the caller's file is neither copied nor consumed
+    with open_resume_source(file) as stream:
+        if filename.endswith(".pdf"):
+            return extract_text_from_pdf(stream, max_pages, max_chars)
+        return extract_text_from_docx(stream)
+
+def get_parser_version(
+    filename: str,
+    max_pages: Optional[int] = None,
+    max_chars: Optional[int] = None,
+    backend: Optional[str] = None
+) -> str:
+    """Return the version string recorded with cached results for this file type and limits."""
     if filename.lower().endswith(".pdf"):
-        return extract_text_from_pdf(file_copy)
+        backends = "+".join(f"{name}-{pdf_backend_version(name)}" for name in resolve_pdf_backends(backend))
+        return f"{PARSER_VERSION}/{backends}/pages={max_pages}/chars={max_chars}"
     elif filename.lower().endswith(".docx"):
-        return extract_text_from_docx(file_copy)
+        return f"{PARSER_VERSION}/docx-xml/python-docx-{docx.__version__}"
     else:
         raise ValueError("Unsupported file type. Please upload a PDF or DOCX file.")
 
-def extract_resume_sections(text: str) -> Dict[str, str]:
-    """
-    Attempt to extract common resume sections like education, experience, skills, etc.
-    This is a simple heuristic-based approach and won't work for all resumes.
+def extract_resume_cached(
+    file: ResumeSource,
+    filename: Optional[str] = None,
+    cache: Optional[ExtractionCache] = None,
+    max_pages: Optional[int] = None,
+    max_chars: Optional[int] = None,
+    guarded: bool = False
+) -> Tuple[str, ResumeSections]:
     """
-    # Common section headers in resumes
-    section_headers = [
-        "education", "experience", "work experience", "employment", 
-        "skills", "technical skills", "professional skills",
-        "projects", "certifications", "achievements", "awards",
-        "publications", "languages", "interests", "hobbies",
-        "volunteer", "references", "summary", "objective", "profile"
-    ]
-    
-    # Dictionary to store sections
-    sections = {}
-    
-    # Split text into lines and process
-    lines = text.split('\n')
-    current_section = "header"  # Default section for content before any section header
-    section_content = []
-    
-    for line in lines:
-        line = line.strip()
-        if not line:  # Skip empty lines
-            continue
-            
-        # Check if this line is a section header
-        is_header = False
-        header_match = None
-        
-        for header in section_headers:
-            # Case-insensitive match for section headers
-            # Match full words only (e.g., "Skills:" but not "Technical Skills")
-            pattern = r'^\s*(' + re.escape(header) + r')[\s:]*$'
-            match = re.search(pattern, line.lower())
-            if match:
-                is_header = True
-                header_match = match.group(1)
-                break
+    Extract resume text and sections, reusing earlier results for identical bytes.
+    
+    Args:
+        file: The resume as a path, buffer or file object (see extract_resume_text)
+        filename: Original file name, used to pick the parser (defaults to the path)
+        cache: Cache to use instead of the process-wide default
+        max_pages: Optional PDF page limit
+        max_chars: Optional PDF character limit
+        guarded: Validate the upload and extract under the limits of extract_resume_text_guarded
         
-        if is_header and header_match:
-            # Save the previous section
-            if section_content:
-                sections[current_section] = '\n'.join(section_content)
-                section_content = []
-            current_section = header_match
-        else:
-            # Add line to current section
-            section_content.append(line)
-    
-    # Save the last section
-    if section_content:
-        sections[current_section] = '\n'.join(section_content)
-    
-    return sections 
\ No newline at end of file
+    Returns:
+        Tuple of (resume text, lazy sections mapping over the text)
+    """
+    filename = filename or source_name(file)
+    if guarded:
+        # Reject oversized or mislabeled files before hashing or parsing them
+        check_resume_upload(file, filename)
+    parser_version = get_parser_version(filename, max_pages, max_chars)
+    kind = filename.lower().rsplit(".", 1)[-1]
+    with resume_buffer(file) as data:
+        digest = content_hash(data)
+    
+    if cache is None:
+        cache = get_extraction_cache()
+    
+    cached = cache.get(digest, kind, parser_version)
+    if cached is not None:
+        text = cached["text"]
+        return text, ResumeSections(text, [SectionSpan(*span) for span in cached["spans"]])
+    
+    if guarded:
+        text = extract_resume_text_guarded(file, filename, max_pages, max_chars, checked=True)
+    else:
+        text = extract_resume_text(file, filename, max_pages, max_chars)
+    sections = index_resume_sections(text)
+    # Only section offsets are cached; the text is stored once
+    cache.put(digest, kind, parser_version, {"text": text, "spans": [list(span) for span in sections.spans]})
+    return text, sections
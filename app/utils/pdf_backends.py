@@ -0,0 +1,469 @@
+import importlib.util
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from importlib import metadata
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Set, Tuple
+import PyPDF2
+from .resume_source import open_resume_source, resume_buffer
+
+# Environment variable selecting the PDF text backend ("auto" or a backend name)
+PDF_BACKEND_ENV_VAR = "RESUME_PDF_BACKEND"
+
+# Order tried by "auto" and for fallbacks: pdfium is a fast native engine, PyPDF2 is
+# always installed, and pdfminer.six is slow but handles some layouts the others miss
+PDF_BACKEND_PREFERENCE = ["pypdfium2", "pypdf2", "pdfminer"]
+
+# Documents with at least this many pages are split across a process pool (0 disables)
+PDF_PARALLEL_PAGES = int(os.environ.get("RESUME_PDF_PARALLEL_PAGES", "30"))
+# Worker processes for parallel extraction (0 uses the CPU count)
+PDF_WORKERS = int(os.environ.get("RESUME_PDF_WORKERS", "0"))
+
+# Import name and distribution name of each backend's library
+_BACKEND_PACKAGES = {
+    "pypdf2": ("PyPDF2", "PyPDF2"),
+    "pypdfium2": ("pypdfium2", "pypdfium2"),
+    "pdfminer": ("pdfminer", "pdfminer.six"),
+}
+
+_reported_warnings: Set[str] = set()
+
+
+def _warn_once(message: str) -> None:
+    """Print a warning about a backend setting only the first time it occurs."""
+    if message not in _reported_warnings:
+        _reported_warnings.add(message)
+        print(f"Warning: {message}")
+
+
+def _iter_pages_pypdf2(file: BinaryIO, start: int, stop: Optional[int]) -> Iterator[str]:
+    """Yield page texts with PyPDF2, parsing pages lazily."""
+    reader = PyPDF2.PdfReader(file)
+    page_count = len(reader.pages) if stop is None else min(len(reader.pages), stop)
+    for page_number in range(start, page_count):
+        yield reader.pages[page_number].extract_text() or ""
+
+
+def _iter_pages_pypdfium2(file: BinaryIO, start: int, stop: Optional[int]) -> Iterator[str]:
+    """Yield page texts with PDFium through pypdfium2."""
+    import pypdfium2
+
+    pdf = pypdfium2.PdfDocument(file)
+    try:
+        page_count = len(pdf) if stop is None else min(len(pdf), stop)
+        for page_number in range(start, page_count):
+            page = pdf[page_number]
+            text_page = page.get_textpage()
+            try:
+                yield text_page.get_text_range().replace("\r\n", "\n")
+            finally:
+                text_page.close()
+                page.close()
+    finally:
+        pdf.close()
+
+
+def _iter_pages_pdfminer(file: BinaryIO, start: int, stop: Optional[int]) -> Iterator[str]:
+    """Yield page texts with pdfminer.six's layout analysis."""
+    from pdfminer.high_level import extract_pages
+    from pdfminer.layout import LTTextContainer
+
+    # maxpages=0 means "no limit" to pdfminer, so an empty range must return here
+    if stop is not None and stop <= start:
+        return
+    page_numbers = range(start, sys.maxsize if stop is None else stop) if start else None
+    for layout in extract_pages(file, page_numbers=page_numbers, maxpages=stop or 0):
+        yield "".join(element.get_text() for element in layout if isinstance(element, LTTextContainer))
+
+
+# Each backend yields the text of pages [start, stop) of a PDF; stop=None reads to the end
+PDF_BACKENDS: Dict[str, Callable[[BinaryIO, int, Optional[int]], Iterator[str]]] = {
+    "pypdf2": _iter_pages_pypdf2,
+    "pypdfium2": _iter_pages_pypdfium2,
+    "pdfminer": _iter_pages_pdfminer,
+}
+
+
+def pdf_backend_available(name: str) -> bool:
+    """Return whether a backend's library is installed, without importing it."""
+    if name not in _BACKEND_PACKAGES:
+        return name in PDF_BACKENDS
+    return importlib.util.find_spec(_BACKEND_PACKAGES[name][0]) is not None
+
+
+def pdf_backend_version(name: str) -> str:
+    """Return the installed version of a backend's library."""
+    if name not in _BACKEND_PACKAGES:
+        return "custom"
+    try:
+        return metadata.version(_BACKEND_PACKAGES[name][1])
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def resolve_pdf_backends(backend: Optional[str] = None) -> List[str]:
+    """
+    Return the installed backends to try, in order.
+
+    Args:
+        backend: "auto" or a backend name; defaults to RESUME_PDF_BACKEND or "auto".
+            A named backend is tried first and the others serve as fallbacks.
+
+    Returns:
+        List of backend names
+    """
+    backend = (backend or os.environ.get(PDF_BACKEND_ENV_VAR) or "auto").lower()
+    if backend != "auto" and backend not in PDF_BACKENDS:
+        raise ValueError(f"Unknown PDF backend '{backend}'. Choose from: auto, {', '.join(PDF_BACKENDS)}")
+
+    order = PDF_BACKEND_PREFERENCE + [name for name in PDF_BACKENDS if name not in PDF_BACKEND_PREFERENCE]
+    if backend != "auto":
+        if not pdf_backend_available(backend):
+            _warn_once(f"PDF backend '{backend}' is not installed; using the available backends instead")
+        order = [backend] + [name for name in order if name != backend]
+    return [name for name in order if pdf_backend_available(name)]
+
+
+def iter_pdf_backend_pages(
+    file: BinaryIO,
+    max_pages: Optional[int] = None,
+    backend: Optional[str] = None,
+    first_page: int = 0
+) -> Iterator[str]:
+    """
+    Yield raw page texts from the first backend that produces text.
+
+    A backend that raises, or that returns only empty pages, before any text has
+    been yielded is skipped in favour of the next one. Errors after text has been
+    yielded are raised, since the pages already returned cannot be taken back.
+
+    Args:
+        file: The PDF file
+        max_pages: Stop after this many pages
+        backend: "auto" or a backend name (see resolve_pdf_backends)
+        first_page: Index of the first page to read
+
+    Returns:
+        Iterator over page texts
+    """
+    candidates = resolve_pdf_backends(backend)
+    stop = None if max_pages is None else first_page + max_pages
+    last_error: Optional[Exception] = None
+    empty_pages: Optional[int] = None
+
+    for name in candidates:
+        file.seek(0)
+        leading_empty = 0
+        produced_text = False
+        try:
+            for page_text in PDF_BACKENDS[name](file, first_page, stop):
+                if produced_text:
+                    yield page_text
+                elif page_text.strip():
+                    # Hold back leading empty pages until this backend has proven it can read text
+                    for _ in range(leading_empty):
+                        yield ""
+                    produced_text = True
+                    yield page_text
+                else:
+                    leading_empty += 1
+        except Exception as e:
+            if produced_text:
+                raise
+            last_error = e
+            print(f"Warning: PDF backend '{name}' failed ({str(e)}); trying the next backend")
+            continue
+
+        if produced_text:
+            return
+        if empty_pages is None:
+            empty_pages = leading_empty
+
+    # No backend found any text (e.g. a scanned PDF): report the blank pages, or the last failure
+    if empty_pages is None and last_error is not None:
+        raise last_error
+    for _ in range(empty_pages or 0):
+        yield ""
+
+
+def _process_context():
+    """Return a multiprocessing context whose workers are not forked from the caller."""
+    # Forking copies a multithreaded process such as the Streamlit server mid-flight,
+    # locks included; forkserver and spawn start workers from a clean process instead
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload([__name__])
+        return context
+    return multiprocessing.get_context("spawn")
+
+
+# Start method shared by the extraction pool and the upload guard's child processes
+PROCESS_CONTEXT = _process_context()
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _count_pages_pypdfium2(file: BinaryIO) -> int:
+    import pypdfium2
+
+    pdf = pypdfium2.PdfDocument(file)
+    try:
+        return len(pdf)
+    finally:
+        pdf.close()
+
+
+def _count_pages_pdfminer(file: BinaryIO) -> int:
+    from pdfminer.pdfpage import PDFPage
+
+    return sum(1 for _ in PDFPage.get_pages(file))
+
+
+def _count_pages_pypdf2(file: BinaryIO) -> int:
+    return len(PyPDF2.PdfReader(file).pages)
+
+
+# Page counters of the built-in backends; other backends are counted with PyPDF2
+_PAGE_COUNTERS: Dict[str, Callable[[BinaryIO], int]] = {
+    "pypdf2": _count_pages_pypdf2,
+    "pypdfium2": _count_pages_pypdfium2,
+    "pdfminer": _count_pages_pdfminer,
+}
+
+
+def pdf_page_count(file: BinaryIO) -> int:
+    """Return the number of pages in a PDF using the cheapest installed parser."""
+    file.seek(0)
+    if pdf_backend_available("pypdfium2"):
+        return _count_pages_pypdfium2(file)
+    return _count_pages_pypdf2(file)
+
+
+def inspect_pdf(file: BinaryIO, backend: Optional[str] = None) -> Tuple[str, int]:
+    """
+    Pick the backend for a whole document and count its pages.
+
+    Returns the first backend (in resolve_pdf_backends order) that opens the
+    document, and the page count it reports. Raises the last error if none can.
+    """
+    last_error: Exception = ValueError("No PDF backend is installed")
+    for name in resolve_pdf_backends(backend):
+        file.seek(0)
+        try:
+            return name, _PAGE_COUNTERS.get(name, _count_pages_pypdf2)(file)
+        except Exception as e:
+            last_error = e
+    raise last_error
+
+
+def pdf_worker_count() -> int:
+    """Return the number of worker processes used for parallel extraction."""
+    return PDF_WORKERS or os.cpu_count() or 1
+
+
+def parallel_extraction_supported() -> bool:
+    """Return whether this process may start a worker pool (daemonic pool workers may not)."""
+    return not multiprocessing.current_process().daemon
+
+
+def _inspect_pdf_path(path: str, backend: Optional[str]) -> Tuple[str, int]:
+    """Pool task: inspect_pdf on a file the worker memory-maps."""
+    with open_resume_source(path) as stream:
+        return inspect_pdf(stream, backend)
+
+
+def _extract_page_range(path: str, start: int, stop: int, backend: str, fallback: bool, max_chars: Optional[int]) -> List[str]:
+    """
+    Pool task: extract pages [start, stop), stopping once max_chars characters are read.
+
+    With fallback the other backends are tried as iter_pdf_backend_pages does;
+    otherwise only the document's backend is used, so ranges never mix engines.
+    """
+    pages: List[str] = []
+    characters = 0
+    with open_resume_source(path) as stream:
+        if fallback:
+            page_texts = iter_pdf_backend_pages(stream, stop - start, backend, first_page=start)
+        else:
+            page_texts = PDF_BACKENDS[backend](stream, start, stop)
+        for page_text in page_texts:
+            pages.append(page_text)
+            characters += len(page_text)
+            if max_chars is not None and characters >= max_chars:
+                break
+    return pages
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Return the shared extraction pool, starting it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=pdf_worker_count(), mp_context=PROCESS_CONTEXT)
+        return _pool
+
+
+def _discard_broken_pool(pool: ProcessPoolExecutor) -> None:
+    """Forget a pool whose worker crashed; the next task starts a new pool."""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_pdf_pool() -> None:
+    """Stop the worker processes used for parallel extraction."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
+
+
+class PooledPdf:
+    """
+    A PDF handed to the extraction pool.
+
+    Paths are passed to the workers as they are; other sources are written once
+    to a temporary file, which every worker memory-maps, rather than being
+    pickled into each task. A crashed worker raises BrokenProcessPool, and the
+    broken pool is replaced for the next document. The pool is shared, so tasks
+    are never killed here; time limits belong to the upload guard, which runs
+    each upload in a process of its own.
+
+    Use as a context manager so the temporary file is removed.
+    """
+
+    def __init__(self, source: Any):
+        self._temporary: Optional[str] = None
+        if isinstance(source, (str, os.PathLike)):
+            self.path = os.fspath(source)
+        else:
+            handle, self._temporary = tempfile.mkstemp(suffix=".pdf")
+            with os.fdopen(handle, "wb") as output, resume_buffer(source) as view:
+                output.write(view)
+            self.path = self._temporary
+
+    def __enter__(self) -> "PooledPdf":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Remove the temporary copy of the document, if one was made."""
+        if self._temporary is not None:
+            os.remove(self._temporary)
+            self._temporary = None
+
+    @staticmethod
+    def _result(pool: ProcessPoolExecutor, future: Future) -> Any:
+        """Wait for a task, replacing the pool if a worker crashed."""
+        try:
+            return future.result()
+        except BrokenProcessPool:
+            _discard_broken_pool(pool)
+            raise
+
+    def inspect(self, backend: Optional[str] = None) -> Tuple[str, int]:
+        """Run inspect_pdf in a worker and return (backend, page count)."""
+        pool = _get_process_pool()
+        return self._result(pool, pool.submit(_inspect_pdf_path, self.path, backend))
+
+    def extract_pages(
+        self,
+        page_count: int,
+        backend: Optional[str] = None,
+        ranges: int = 1,
+        max_chars: Optional[int] = None
+    ) -> List[str]:
+        """
+        Extract the first page_count pages, split into contiguous page ranges.
+
+        A single range falls back across backends like the serial path. Several
+        ranges all use backend, the document's backend from inspect; if one of
+        them fails, the document is extracted again as a single range. Each
+        range stops at max_chars characters, and ranges after the first
+        max_chars characters are cancelled.
+
+        Returns:
+            List of page texts in page order
+        """
+        if page_count <= 0:
+            return []
+        ranges = max(1, min(ranges, page_count))
+        if ranges == 1 or backend is None:
+            return self._extract_ranges(page_count, backend, 1, max_chars, fallback=True)
+        try:
+            return self._extract_ranges(page_count, backend, ranges, max_chars, fallback=False)
+        except BrokenProcessPool:
+            raise
+        except Exception as e:
+            print(f"Warning: PDF backend '{backend}' failed on part of the document ({str(e)}); extracting it whole")
+            return self._extract_ranges(page_count, backend, 1, max_chars, fallback=True)
+
+    def _extract_ranges(
+        self,
+        page_count: int,
+        backend: Optional[str],
+        ranges: int,
+        max_chars: Optional[int],
+        fallback: bool
+    ) -> List[str]:
+        pages_per_range = -(-page_count // ranges)
+        pool = _get_process_pool()
+        futures = [
+            pool.submit(_extract_page_range, self.path, start, min(start + pages_per_range, page_count),
+                        backend, fallback, max_chars)
+            for start in range(0, page_count, pages_per_range)
+        ]
+        pages: List[str] = []
+        characters = 0
+        try:
+            for future in futures:
+                chunk = self._result(pool, future)
+                pages.extend(chunk)
+                characters += sum(len(page_text) for page_text in chunk)
+                if max_chars is not None and characters >= max_chars:
+                    break
+        finally:
+            for future in futures:
+                future.cancel()
+        return pages
+
+
+def extract_pdf_pages_parallel(
+    file: Any,
+    page_count: int,
+    backend: Optional[str] = None,
+    workers: Optional[int] = None,
+    max_chars: Optional[int] = None
+) -> List[str]:
+    """
+    Extract the first page_count pages by splitting them across a process pool.
+
+    Pages are divided into one contiguous range per worker and reassembled in
+    page order. One backend is chosen for the whole document before the ranges
+    fan out, and each range stops at max_chars characters. Processes rather
+    than threads are used because PyPDF2 is pure Python and PDFium is not
+    thread-safe.
+
+    Args:
+        file: The PDF as a path, buffer or file object
+        page_count: Number of pages to extract
+        backend: "auto" or a backend name (see resolve_pdf_backends)
+        workers: Page ranges to split into (defaults to RESUME_PDF_WORKERS or the CPU count)
+        max_chars: Stop once this many characters have been extracted
+
+    Returns:
+        List of page texts in page order
+    """
+    with PooledPdf(file) as pdf:
+        document_backend, _ = pdf.inspect(backend)
+        return pdf.extract_pages(page_count, document_backend, workers or pdf_worker_count(), max_chars)
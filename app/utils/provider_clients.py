@@ -0,0 +1,77 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable
+import openai
+from google.ai import generativelanguage as glm
+from .http_clients import get_timeout
+
+# Upper bound on cached SDK clients; each distinct API key holds one per service
+MAX_CACHED_CLIENTS = 64
+
+_clients: "OrderedDict[tuple, Any]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def api_key_hash(api_key: str) -> str:
+    """Hash API keys so they are never used verbatim as cache keys."""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+
+def _get_cached_client(service: str, api_key: str, factory: Callable[[], Any]) -> Any:
+    """Return the client cached for (service, key hash), creating it on a miss."""
+    cache_key = (service, api_key_hash(api_key))
+    with _lock:
+        client = _clients.get(cache_key)
+        if client is not None:
+            _clients.move_to_end(cache_key)
+            return client
+
+    # Build outside the lock; a racing duplicate is harmless and simply discarded
+    client = factory()
+    with _lock:
+        client = _clients.setdefault(cache_key, client)
+        _clients.move_to_end(cache_key)
+        while len(_clients) > MAX_CACHED_CLIENTS:
+            _clients.popitem(last=False)
+    return client
+
+
+def get_openai_client(api_key: str) -> openai.OpenAI:
+    """Return an OpenAI client bound to this API key instead of the module-global key."""
+    connect_timeout, read_timeout = get_timeout()
+    return _get_cached_client(
+        "openai",
+        api_key,
+        lambda: openai.OpenAI(api_key=api_key, timeout=openai.Timeout(read_timeout, connect=connect_timeout))
+    )
+
+
+def get_gemini_generative_client(api_key: str) -> glm.GenerativeServiceClient:
+    """Return a Gemini generation client bound to this API key instead of genai.configure()."""
+    return _get_cached_client(
+        "gemini-generative",
+        api_key,
+        lambda: glm.GenerativeServiceClient(client_options={"api_key": api_key})
+    )
+
+
+def get_gemini_deadline() -> float:
+    """Return the deadline in seconds for Gemini calls; gRPC takes one deadline, not connect and read timeouts."""
+    connect_timeout, read_timeout = get_timeout()
+    return connect_timeout + read_timeout
+
+
+def get_gemini_model_client(api_key: str) -> glm.ModelServiceClient:
+    """Return a Gemini model-listing client bound to this API key."""
+    return _get_cached_client(
+        "gemini-model",
+        api_key,
+        lambda: glm.ModelServiceClient(client_options={"api_key": api_key})
+    )
+
+
+def clear_provider_clients() -> None:
+    """Drop every cached SDK client."""
+    with _lock:
+        _clients.clear()
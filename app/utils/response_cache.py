@@ -0,0 +1,174 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+# Environment variables configuring the process-wide response cache
+CACHE_PATH_ENV_VAR = "AI_RESPONSE_CACHE"
+CACHE_TTL_ENV_VAR = "AI_RESPONSE_CACHE_TTL"
+
+
+def response_cache_key(provider: str, model_id: Optional[str], system_prompt: str, prompt: str, max_tokens: int) -> str:
+    """Hash everything that determines a provider response into a cache key."""
+    material = json.dumps([provider, model_id, system_prompt, prompt, max_tokens])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    TTL + LRU cache of AI analysis results.
+
+    Entries live in an in-process LRU dictionary and, when ``disk_path`` is given,
+    in an SQLite table that survives restarts. Entries older than ``ttl`` seconds
+    are misses in both tiers. ``hits`` and ``misses`` count lookups.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 24 * 60 * 60,
+        max_entries: int = 256,
+        disk_path: Optional[str] = None,
+        max_disk_entries: int = 10000
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+
+        if disk_path:
+            directory = os.path.dirname(os.path.abspath(disk_path))
+            os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(disk_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, payload TEXT NOT NULL, "
+                "created REAL NOT NULL, last_access REAL NOT NULL)"
+            )
+            self._db.commit()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached result, or None if missing or expired."""
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if now - entry[0] < self.ttl:
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return dict(entry[1])
+                del self._memory[key]
+
+            entry = self._disk_get(key, now)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._memory_put(key, entry[0], entry[1])
+            self.hits += 1
+            return dict(entry[1])
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a result in every configured tier."""
+        if not self.enabled:
+            return
+
+        now = time.time()
+        with self._lock:
+            self._memory_put(key, now, dict(result))
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses (key, payload, created, last_access) VALUES (?, ?, ?, ?)",
+                    (key, json.dumps(result), now, now)
+                )
+                self._evict_disk(now)
+                self._db.commit()
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._memory.clear()
+            self.hits = 0
+            self.misses = 0
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+
+    def close(self) -> None:
+        """Close the on-disk tier, if any."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the number of in-memory entries."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._memory)}
+
+    def _memory_put(self, key: str, created: float, result: Dict[str, Any]) -> None:
+        self._memory[key] = (created, result)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _disk_get(self, key: str, now: float) -> Optional[Tuple[float, Dict[str, Any]]]:
+        if self._db is None:
+            return None
+
+        row = self._db.execute("SELECT payload, created FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+
+        if now - row[1] >= self.ttl:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._db.commit()
+            return None
+
+        self._db.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+        self._db.commit()
+        return row[1], json.loads(row[0])
+
+    def _evict_disk(self, now: float) -> None:
+        """Drop expired rows, then least-recently-used rows beyond the entry limit."""
+        self._db.execute("DELETE FROM responses WHERE created <= ?", (now - self.ttl,))
+        self._db.execute(
+            "DELETE FROM responses WHERE key IN ("
+            "SELECT key FROM responses ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+            (self.max_disk_entries,)
+        )
+
+
+_default_cache: Optional[ResponseCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """
+    Return the process-wide response cache.
+
+    AI_RESPONSE_CACHE_TTL sets the TTL in seconds (0 disables caching) and
+    AI_RESPONSE_CACHE names an SQLite file for the persistent tier.
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ResponseCache(
+                ttl=float(os.environ.get(CACHE_TTL_ENV_VAR, 24 * 60 * 60)),
+                disk_path=os.environ.get(CACHE_PATH_ENV_VAR)
+            )
+        return _default_cache
@@ -0,0 +1,220 @@
+from collections.abc import Mapping
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+# Common section headers in resumes
+SECTION_HEADERS = [
+    "education", "experience", "work experience", "employment",
+    "skills", "technical skills", "professional skills",
+    "projects", "certifications", "achievements", "awards",
+    "publications", "languages", "interests", "hobbies",
+    "volunteer", "references", "summary", "objective", "profile"
+]
+
+# Optional synonyms mapped onto a canonical section name. They are not part of the
+# default vocabulary; pass them to SectionHeaderMatcher to recognize them.
+SECTION_HEADER_SYNONYMS = {
+    "experience": ["work history", "employment history", "professional experience", "career history"],
+    "skills": ["core competencies", "key skills", "technical proficiencies", "areas of expertise"],
+    "education": ["academic background", "education and training"],
+    "certifications": ["licenses and certifications", "certificates"],
+    "summary": ["professional summary", "career summary", "executive summary"],
+    "volunteer": ["volunteer experience", "volunteering"],
+}
+
+
+class SectionHeaderMatcher:
+    """
+    Recognize section header lines with a single dictionary lookup.
+
+    A line is a header when, lowercased and stripped of trailing whitespace and
+    colons, it equals one of the configured names. Synonyms report their canonical
+    section name; plain headers report themselves.
+    """
+
+    def __init__(self, headers: Iterable[str] = SECTION_HEADERS, synonyms: Optional[Dict[str, Iterable[str]]] = None):
+        self._lookup: Dict[str, str] = {}
+        for header in headers:
+            header = header.strip().lower()
+            self._lookup[header] = header
+        for canonical, names in (synonyms or {}).items():
+            canonical = canonical.strip().lower()
+            for name in names:
+                self._lookup.setdefault(name.strip().lower(), canonical)
+
+    def match(self, line: str) -> Optional[str]:
+        """Return the section name for a stripped line, or None if it is not a header."""
+        key = line.lower()
+        # Same as the trailing [\s:]* of the original per-header regex
+        while key and (key[-1] == ':' or key[-1].isspace()):
+            key = key.rstrip().rstrip(':')
+        return self._lookup.get(key)
+
+    def __contains__(self, name: str) -> bool:
+        return name.lower() in self._lookup
+
+
+DEFAULT_SECTION_MATCHER = SectionHeaderMatcher()
+
+
+class SectionSpan(NamedTuple):
+    """A section's name and the [start, end) offsets of its content in the resume text."""
+    name: str
+    start: int
+    end: int
+
+
+class SectionView:
+    """
+    Lazy view of one section of a resume.
+
+    The content is the non-empty, stripped lines between ``start`` and ``end``
+    joined by newlines; it is only built when asked for.
+    """
+
+    __slots__ = ("text", "name", "start", "end")
+
+    def __init__(self, text: str, span: SectionSpan):
+        self.text = text
+        self.name, self.start, self.end = span
+
+    def _lines(self) -> Iterator[str]:
+        position = self.start
+        while position < self.end:
+            newline = self.text.find("\n", position, self.end)
+            if newline == -1:
+                newline = self.end
+            line = self.text[position:newline].strip()
+            if line:
+                yield line
+            position = newline + 1
+
+    def head(self, limit: int) -> str:
+        """Return the first ``limit`` characters without materializing the rest."""
+        parts: List[str] = []
+        size = 0
+        for line in self._lines():
+            if parts:
+                parts.append("\n")
+                size += 1
+            parts.append(line)
+            size += len(line)
+            if size >= limit:
+                break
+        return "".join(parts)[:limit]
+
+    def __str__(self) -> str:
+        return "\n".join(self._lines())
+
+    def __repr__(self) -> str:
+        return f"SectionView({self.name!r}, {self.start}, {self.end})"
+
+
+class ResumeSections(Mapping):
+    """
+    Section index over a resume's text, usable wherever a sections dict is.
+
+    Only (name, start, end) offsets are stored; looking a section up builds its
+    string on demand, so holding many parsed resumes costs little more than
+    their text. When a section name occurs more than once, lookups return the
+    last occurrence, as the dictionary returned by extract_resume_sections does;
+    ``spans`` keeps every occurrence in document order.
+    """
+
+    def __init__(self, text: str, spans: List[SectionSpan]):
+        self.text = text
+        self.spans = spans
+        self._index: Dict[str, SectionSpan] = {}
+        for span in spans:
+            self._index[span.name] = span
+
+    def view(self, name: str) -> SectionView:
+        """Return the lazy view of a section."""
+        return SectionView(self.text, self._index[name])
+
+    def views(self) -> Iterator[SectionView]:
+        """Yield the lazy view of every section in mapping order."""
+        for span in self._index.values():
+            yield SectionView(self.text, span)
+
+    def to_dict(self) -> Dict[str, str]:
+        """Materialize every section into a plain dictionary."""
+        return {view.name: str(view) for view in self.views()}
+
+    def __getitem__(self, name: str) -> str:
+        return str(self.view(name))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __repr__(self) -> str:
+        return f"ResumeSections({list(self._index.values())!r})"
+
+
+def index_resume_sections(text: str, header_matcher: Optional[SectionHeaderMatcher] = None) -> ResumeSections:
+    """
+    Locate resume sections without copying their content.
+
+    Args:
+        text: The resume text
+        header_matcher: Header vocabulary to use (defaults to SECTION_HEADERS)
+
+    Returns:
+        ResumeSections index of the text
+    """
+    match_header = (header_matcher or DEFAULT_SECTION_MATCHER).match
+
+    spans: List[SectionSpan] = []
+    current_section = "header"  # Default section for content before any section header
+    content_start = content_end = None
+    position = 0
+
+    for line in text.split('\n'):
+        line_start = position
+        position += len(line) + 1
+        stripped = line.strip()
+        if not stripped:  # Skip empty lines
+            continue
+
+        header_match = match_header(stripped)
+        if header_match:
+            # Close the previous section; sections without content are dropped
+            if content_start is not None:
+                spans.append(SectionSpan(current_section, content_start, content_end))
+                content_start = None
+            current_section = header_match
+        else:
+            if content_start is None:
+                content_start = line_start
+            content_end = line_start + len(line)
+
+    if content_start is not None:
+        spans.append(SectionSpan(current_section, content_start, content_end))
+
+    return ResumeSections(text, spans)
+
+
+def extract_resume_sections(text: str, header_matcher: Optional[SectionHeaderMatcher] = None) -> Dict[str, str]:
+    """
+    Attempt to extract common resume sections like education, experience, skills, etc.
+    This is a simple heuristic-based approach and won't work for all resumes.
+
+    Args:
+        text: The resume text
+        header_matcher: Header vocabulary to use (defaults to SECTION_HEADERS)
+
+    Returns:
+        Dictionary mapping section names to their content
+    """
+    return index_resume_sections(text, header_matcher).to_dict()
+
+
+def section_preview(sections: Mapping, name: str, limit: int) -> str:
+    """Return up to ``limit`` characters of a section, with "..." appended if it is longer."""
+    if isinstance(sections, ResumeSections):
+        content = sections.view(name).head(limit + 1)
+    else:
+        content = sections[name][:limit + 1]
+    return content[:limit] + "..." if len(content) > limit else content
@@ -0,0 +1,128 @@
+import io
+import mmap
+import os
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Union
+
+# Anything extract_resume_text accepts: a path, an in-memory buffer or a binary file object
+ResumeSource = Union[str, os.PathLike, bytes, bytearray, memoryview, BinaryIO]
+
+
+class BufferReader(io.RawIOBase):
+    """
+    Read-only, seekable file object over a buffer.
+
+    Reads copy only the requested range, so parsers can seek around a large
+    memory-mapped file or upload without the whole buffer being duplicated.
+    """
+
+    def __init__(self, data):
+        super().__init__()
+        self._view = memoryview(data).cast("B")
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = len(self._view) + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError("Negative seek position")
+        self._position = position
+        return position
+
+    def read(self, size: int = -1) -> bytes:
+        end = len(self._view) if size is None or size < 0 else min(len(self._view), self._position + size)
+        if end <= self._position:
+            return b""
+        data = self._view[self._position:end].tobytes()
+        self._position = end
+        return data
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def close(self) -> None:
+        if not self.closed:
+            self._view.release()
+        super().close()
+
+
+def source_name(source: ResumeSource) -> str:
+    """Return the file name carried by a source, or an empty string."""
+    if isinstance(source, (str, os.PathLike)):
+        return os.fspath(source)
+    return getattr(source, "name", "") or ""
+
+
+@contextmanager
+def resume_buffer(source: ResumeSource) -> Iterator[memoryview]:
+    """
+    Expose the bytes of a resume as a memoryview without copying them.
+
+    Paths are memory-mapped, so the file is paged in by the OS on demand rather
+    than read into Python memory. BytesIO objects (including Streamlit's
+    UploadedFile) expose their internal bytes. Other file objects are read once.
+    The view is released when the context exits.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as handle:
+            if os.fstat(handle.fileno()).st_size == 0:
+                yield memoryview(b"")
+                return
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    yield view
+                finally:
+                    view.release()
+        return
+
+    if isinstance(source, io.BytesIO):
+        # getvalue() hands back the internal bytes object without copying, whereas
+        # getbuffer() must unshare (copy) a buffer BytesIO shares with its initial value
+        view = memoryview(source.getvalue())
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source)
+    else:
+        position = source.tell()
+        source.seek(0)
+        view = memoryview(source.read())
+        source.seek(position)
+
+    try:
+        yield view
+    finally:
+        view.release()
+
+
+@contextmanager
+def open_resume_source(source: ResumeSource) -> Iterator[BinaryIO]:
+    """
+    Open a resume as a seekable binary stream without copying its bytes.
+
+    The caller's file position is left untouched, so an upload can be read
+    again afterwards.
+    """
+    with resume_buffer(source) as view:
+        # Parsers issue many tiny reads; the C buffered layer serves them in 64 KiB chunks
+        reader = io.BufferedReader(BufferReader(view), buffer_size=64 * 1024)
+        try:
+            yield reader
+        finally:
+            reader.close()
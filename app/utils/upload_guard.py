@@ -0,0 +1,228 @@
+import io
+import os
+import zipfile
+from typing import Any, Callable, Optional, Tuple
+from .pdf_backends import PROCESS_CONTEXT, parallel_extraction_supported, pdf_page_count
+from .resume_source import ResumeSource, open_resume_source, resume_buffer, source_name
+
+# Limits for guarded extraction; override through the environment or per call
+MAX_UPLOAD_BYTES = int(os.environ.get("RESUME_MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))
+MAX_DOCX_UNCOMPRESSED_BYTES = int(os.environ.get("RESUME_MAX_DOCX_BYTES", str(50 * 1024 * 1024)))
+MAX_PDF_PAGES = int(os.environ.get("RESUME_MAX_PDF_PAGES", "500"))
+EXTRACTION_TIMEOUT = float(os.environ.get("RESUME_EXTRACTION_TIMEOUT", "30"))
+
+# Seconds a guard process may take to start before its task; not counted against the timeout
+PROCESS_START_TIMEOUT = 60
+
+# Archive members expanding more than this many times their compressed size are treated as zip bombs
+MAX_COMPRESSION_RATIO = 200
+
+# PDF readers accept a header anywhere in the first kilobyte
+_PDF_HEADER_WINDOW = 1024
+
+
+class UploadRejectedError(ValueError):
+    """Raised when an upload is refused by guarded extraction."""
+    pass
+
+
+def sniff_resume_type(header: bytes) -> Optional[str]:
+    """Return "pdf" or "docx" from a file's leading bytes, or None if neither."""
+    if b"%PDF-" in header[:_PDF_HEADER_WINDOW]:
+        return "pdf"
+    if header.startswith(b"PK\x03\x04"):
+        return "docx"
+    return None
+
+
+def _check_docx_archive(source: ResumeSource, max_docx_bytes: int) -> None:
+    """Reject DOCX archives that are not Word documents or would expand too far."""
+    with open_resume_source(source) as stream:
+        try:
+            with zipfile.ZipFile(stream) as archive:
+                members = archive.infolist()
+        except zipfile.BadZipFile:
+            raise UploadRejectedError("File is not a valid DOCX archive")
+
+    if not any(member.filename == "word/document.xml" for member in members):
+        raise UploadRejectedError("Archive does not contain a Word document")
+
+    # zipfile never inflates a member past its declared size, so the directory is authoritative
+    total = sum(member.file_size for member in members)
+    if total > max_docx_bytes:
+        raise UploadRejectedError(
+            f"DOCX expands to {total / (1024 * 1024):.1f} MB; the limit is {max_docx_bytes / (1024 * 1024):.1f} MB"
+        )
+    for member in members:
+        if member.file_size > 1024 * 1024 and member.file_size > MAX_COMPRESSION_RATIO * max(member.compress_size, 1):
+            raise UploadRejectedError(f"DOCX member {member.filename} has a suspicious compression ratio")
+
+
+def check_resume_upload(
+    source: ResumeSource,
+    filename: Optional[str] = None,
+    max_bytes: int = MAX_UPLOAD_BYTES,
+    max_docx_bytes: int = MAX_DOCX_UNCOMPRESSED_BYTES
+) -> str:
+    """
+    Validate an upload before any parsing, rejecting it in milliseconds if unsafe.
+
+    Checks the byte size, that the magic bytes match the file extension and, for
+    DOCX, the archive directory's decompressed size and compression ratios.
+
+    Args:
+        source: The resume as a path, buffer or file object
+        filename: Original file name (defaults to the path)
+        max_bytes: Largest accepted file size
+        max_docx_bytes: Largest accepted total decompressed size of a DOCX
+
+    Returns:
+        The detected file type, "pdf" or "docx"
+    """
+    extension = (filename or source_name(source)).lower().rsplit(".", 1)[-1]
+    if extension not in ("pdf", "docx"):
+        raise UploadRejectedError("Unsupported file type. Please upload a PDF or DOCX file.")
+
+    with resume_buffer(source) as view:
+        size = view.nbytes
+        header = view[:_PDF_HEADER_WINDOW].tobytes()
+
+    if size == 0:
+        raise UploadRejectedError("File is empty")
+    if size > max_bytes:
+        raise UploadRejectedError(
+            f"File is {size / (1024 * 1024):.1f} MB; the limit is {max_bytes / (1024 * 1024):.1f} MB"
+        )
+    if sniff_resume_type(header) != extension:
+        raise UploadRejectedError(f"File content does not match its .{extension} extension")
+
+    if extension == "docx":
+        _check_docx_archive(source, max_docx_bytes)
+    return extension
+
+
+def _run_and_send(connection, func: Callable[..., Any], args: Tuple) -> None:
+    """
+    Subprocess entry point: send ("started", None), run func and send back
+    ("ok", result) or ("error", exception).
+    """
+    connection.send(("started", None))
+    try:
+        message = ("ok", func(*args))
+    except Exception as e:
+        message = ("error", e)
+    try:
+        connection.send(message)
+    except Exception:
+        # The exception may not be picklable; keep its type name and message
+        connection.send(("error", RuntimeError(f"{type(message[1]).__name__}: {str(message[1])}")))
+    finally:
+        connection.close()
+
+
+def run_with_timeout(func: Callable[..., Any], args: Tuple, timeout: Optional[float]) -> Any:
+    """
+    Run func(*args) in its own child process and kill it after timeout seconds.
+
+    Every call gets a separate process, so killing one overrunning task never
+    affects another upload. The timeout runs from the moment the child starts
+    the task, not from process start-up. The child is started with
+    PROCESS_CONTEXT, so func and args must be picklable. Exceptions raised by
+    func are re-raised here. Without a timeout, or inside a daemonic pool
+    worker that may not start children, func runs in-process.
+    """
+    if timeout is None or not parallel_extraction_supported():
+        return func(*args)
+
+    # Never fork: the caller may be the multithreaded Streamlit server
+    receiver, sender = PROCESS_CONTEXT.Pipe(duplex=False)
+    process = PROCESS_CONTEXT.Process(target=_run_and_send, args=(sender, func, args), daemon=True)
+    process.start()
+    sender.close()
+    try:
+        try:
+            if not receiver.poll(PROCESS_START_TIMEOUT):
+                raise UploadRejectedError("Resume extraction could not be started")
+            receiver.recv()  # ("started", None)
+            if not receiver.poll(timeout):
+                raise UploadRejectedError(f"Resume extraction took longer than {timeout:g} seconds")
+            status, value = receiver.recv()
+        except EOFError:
+            process.join()
+            raise UploadRejectedError(f"Resume extraction crashed (exit code {process.exitcode})")
+    finally:
+        receiver.close()
+        if process.is_alive():
+            process.kill()
+        process.join()
+
+    if status == "error":
+        raise value
+    return value
+
+
+def _extract_with_page_limit(
+    source: ResumeSource,
+    filename: str,
+    max_pages: Optional[int],
+    max_chars: Optional[int],
+    page_limit: Optional[int]
+) -> str:
+    """Count PDF pages against the limit, then extract the text."""
+    from .parse_resume import extract_resume_text
+
+    if page_limit is not None and filename.lower().endswith(".pdf"):
+        with open_resume_source(source) as stream:
+            page_count = pdf_page_count(stream)
+        if page_count > page_limit:
+            raise UploadRejectedError(f"PDF has {page_count} pages; the limit is {page_limit}")
+    return extract_resume_text(source, filename, max_pages, max_chars)
+
+
+def extract_resume_text_guarded(
+    source: ResumeSource,
+    filename: Optional[str] = None,
+    max_pages: Optional[int] = None,
+    max_chars: Optional[int] = None,
+    max_bytes: int = MAX_UPLOAD_BYTES,
+    max_docx_bytes: int = MAX_DOCX_UNCOMPRESSED_BYTES,
+    page_limit: Optional[int] = MAX_PDF_PAGES,
+    timeout: Optional[float] = EXTRACTION_TIMEOUT,
+    checked: bool = False
+) -> str:
+    """
+    Extract resume text under resource limits.
+
+    The upload is validated with check_resume_upload first, so oversized or
+    mislabeled files never reach a parser. The file is then parsed in a child
+    process of its own, which is killed once the timeout expires without
+    touching other uploads or the shared extraction pool; PDFs with more than
+    page_limit pages are rejected before their text is extracted.
+
+    Args:
+        source: The resume as a path, buffer or file object
+        filename: Original file name (defaults to the path)
+        max_pages: Only extract this many PDF pages
+        max_chars: Only extract this many PDF characters
+        max_bytes: Largest accepted file size
+        max_docx_bytes: Largest accepted total decompressed size of a DOCX
+        page_limit: Reject PDFs with more pages than this
+        timeout: Seconds before extraction is abandoned (None runs in-process)
+        checked: The caller already ran check_resume_upload on this upload
+
+    Returns:
+        The extracted text
+    """
+    filename = filename or source_name(source)
+    if not checked:
+        check_resume_upload(source, filename, max_bytes, max_docx_bytes)
+
+    # Paths are reopened by the child; in-memory uploads are handed over as bytes
+    if isinstance(source, (str, os.PathLike, bytes)):
+        payload = source
+    elif isinstance(source, io.BytesIO):
+        payload = source.getvalue()  # shares the upload's buffer instead of copying it
+    else:
+        with resume_buffer(source) as view:
+            payload = view.tobytes()
+    return run_with_timeout(_extract_with_page_limit, (payload, filename, max_pages, max_chars, page_limit), timeout)
@@ -0,0 +1,3 @@
+# Resume Analyzer Benchmarks
+# Standalone performance scripts, run from the repository root with `python -m benchmarks.<name>`.
+# © 2024 @INFINITYone22 (https://github.com/INFINITYone22). All Rights Reserved. 
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""
+Measure batch ingestion throughput for 1, 4 and N worker processes.
+
+A synthetic corpus of multi-page PDF and DOCX resumes is generated in a
+temporary directory and pushed through app.batch.iter_batch_results.
+
+Usage:
+    python -m benchmarks.bench_batch [--files 200]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from docx import Document
+from reportlab.pdfgen import canvas
+
+from app.batch import iter_batch_results
+
+RESUME_LINES = [
+    "EXPERIENCE",
+    "Senior software engineer building microservices with Python, Django and PostgreSQL",
+    "Led a team of six engineers; drove agile delivery, code reviews and mentoring",
+    "Deployed workloads on AWS with Docker, Kubernetes and Terraform via GitHub Actions",
+    "SKILLS",
+    "Python, Java, JavaScript, React, Node.js, SQL, Redis, Kafka, Leadership, Communication",
+]
+
+
+def build_corpus(directory: str, files: int, pages: int = 3) -> None:
+    """Write an even mix of PDF and DOCX resumes."""
+    for index in range(files):
+        if index % 2 == 0:
+            pdf = canvas.Canvas(os.path.join(directory, f"resume_{index:05d}.pdf"))
+            for _ in range(pages):
+                for line_number, line in enumerate(RESUME_LINES * 6):
+                    pdf.drawString(50, 780 - line_number * 20, line)
+                pdf.showPage()
+            pdf.save()
+        else:
+            doc = Document()
+            for line in RESUME_LINES * 6 * pages:
+                doc.add_paragraph(line)
+            doc.save(os.path.join(directory, f"resume_{index:05d}.docx"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--chunk-size", type=int, default=8)
+    args = parser.parse_args()
+
+    cpu_count = os.cpu_count() or 1
+    with tempfile.TemporaryDirectory() as corpus:
+        build_corpus(corpus, args.files)
+        print(f"Corpus: {args.files} resumes, {cpu_count} CPU(s) available")
+        print(f"{'workers':>8} {'seconds':>8} {'files/s':>8}")
+
+        for workers in sorted({1, 4, cpu_count}):
+            started = time.perf_counter()
+            results = list(iter_batch_results([corpus], workers=workers, chunk_size=args.chunk_size))
+            elapsed = time.perf_counter() - started
+            assert len(results) == args.files and not any(record["error"] for record in results)
+            print(f"{workers:>8} {elapsed:>8.2f} {args.files / elapsed:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
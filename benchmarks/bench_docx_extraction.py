@@ -0,0 +1,65 @@
+"""
+Compare the python-docx object model with the streaming word/document.xml parser.
+
+The corpus is made of tabular resumes (skills matrices, project tables) of
+growing size, with merged cells that python-docx repeats for every grid
+column and row they span.
+
+Usage:
+    python -m benchmarks.bench_docx_extraction
+"""
+import io
+import time
+
+from docx import Document
+
+from app.utils.parse_resume import extract_text_from_docx, extract_text_from_docx_with_python_docx
+
+TABLE_ROWS = [50, 200, 1000]
+
+ROW_VALUES = ["Acme Corp", "Senior Engineer", "Python, Django, PostgreSQL", "2019-2024", "Led a team of six"]
+
+
+def build_tabular_resume(rows: int) -> io.BytesIO:
+    """Return a DOCX with a five-column table of the given size between paragraphs."""
+    doc = Document()
+    doc.add_paragraph("Jane Doe")
+    doc.add_paragraph("EXPERIENCE")
+    table = doc.add_table(rows=rows, cols=len(ROW_VALUES))
+    for row in table.rows:
+        for cell, value in zip(row.cells, ROW_VALUES):
+            cell.text = value
+    # Merge a few cells in both directions, as skills matrices often do
+    for row in range(0, rows - 1, 10):
+        table.cell(row, 3).merge(table.cell(row, 4))
+        table.cell(row, 0).merge(table.cell(row + 1, 0))
+    doc.add_paragraph("SKILLS")
+    doc.add_paragraph("Python, Leadership")
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer
+
+
+def time_call(func, *args, repeat: int = 3) -> float:
+    """Best-of-N wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    print(f"{'rows':>6} {'python-docx ms':>15} {'streaming ms':>13} {'speedup':>8} {'chars old/new':>15}")
+    for rows in TABLE_ROWS:
+        resume = build_tabular_resume(rows)
+        old_chars = len(extract_text_from_docx_with_python_docx(resume))
+        new_chars = len(extract_text_from_docx(resume))
+        old_ms = time_call(extract_text_from_docx_with_python_docx, resume)
+        new_ms = time_call(extract_text_from_docx, resume)
+        print(f"{rows:>6} {old_ms:>15.1f} {new_ms:>13.1f} {old_ms / new_ms:>7.1f}x {old_chars:>7}/{new_chars:<7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Measure the cost of fuzzy skill matching on top of exact matching.
+
+A corpus of synthetic resumes mixes ordinary words, skills and garbled skills
+(typos and words split in two, as bad PDF extraction produces). Skill
+extraction runs over the corpus with and without the fuzzy stage, in both
+NLP modes; cold passes start with an empty word-correction cache, warm passes
+show the steady state of a long-running worker. The modes are run in turn
+several times, and fuzzy matching passes when its median slowdown against the
+exact pass of the same round stays within MAX_SLOWDOWN. A second table shows
+that the cost of correcting a word barely moves as the dictionary grows.
+
+Usage:
+    python -m benchmarks.bench_fuzzy_matching [--repeats 7]
+"""
+import argparse
+import random
+import statistics
+import time
+from typing import List
+
+from app.nlp.fuzzy_matcher import FuzzySkillMatcher
+from app.nlp.skill_extractor import BUSINESS_SKILLS, COMMON_TECH_SKILLS, SkillExtractor, _get_nltk_tools
+from benchmarks.bench_skill_matching import build_dictionary
+
+RESUME_COUNT = 200
+WORDS_PER_RESUME = 600
+DICTIONARY_SIZES = [250, 5000, 50000]
+
+# Fuzzy extraction may take at most this many times as long as exact extraction
+MAX_SLOWDOWN = 2.0
+
+COMMON_WORDS = (
+    "experience team built designed developed services led managed improved delivered platform customers "
+    "using with and for the in of on at to from across large scale reliable production data systems company "
+    "responsible worked senior engineer analyst years project role cloud backend frontend internal tooling"
+).split()
+
+
+def garble(skill: str, rng: random.Random) -> str:
+    """Drop a character or split a word in two pieces of at least three characters, like broken PDF text."""
+    words = skill.split(" ")
+    long_words = [index for index, word in enumerate(words) if len(word) >= 6]
+    if not long_words or rng.random() < 0.5:
+        position = rng.randint(1, len(skill) - 2)
+        return skill[:position] + skill[position + 1:]
+    index = rng.choice(long_words)
+    position = rng.randint(3, len(words[index]) - 3)
+    words[index] = words[index][:position] + " " + words[index][position:]
+    return " ".join(words)
+
+
+def build_corpus(seed: int = 7) -> List[str]:
+    """Return synthetic resumes with about one skill in ten words, a third of them garbled."""
+    rng = random.Random(seed)
+    skills = sorted(COMMON_TECH_SKILLS | BUSINESS_SKILLS)
+    resumes = []
+    for _ in range(RESUME_COUNT):
+        words = []
+        for _ in range(WORDS_PER_RESUME):
+            if rng.random() < 0.1:
+                skill = rng.choice(skills)
+                words.append(garble(skill, rng) if len(skill) >= 7 and rng.random() < 0.33 else skill)
+            else:
+                words.append(rng.choice(COMMON_WORDS))
+        resumes.append(" ".join(words))
+    return resumes
+
+
+def docs_per_second(extractor: SkillExtractor, corpus: List[str]) -> float:
+    """Extract skills from every resume and return the throughput."""
+    started = time.perf_counter()
+    extractor.extract_many(corpus)
+    return len(corpus) / (time.perf_counter() - started)
+
+
+def compare(corpus: List[str], use_nlp: bool, repeats: int) -> bool:
+    """Print exact and fuzzy throughput for one NLP mode and return whether fuzzy stays within the bound."""
+    exact = SkillExtractor(use_nlp=use_nlp)
+    fuzzy = SkillExtractor(use_nlp=use_nlp, fuzzy_confidence=0.8)
+    rates = {"exact": [], "fuzzy (cold cache)": [], "fuzzy (warm cache)": []}
+    for _ in range(repeats):
+        rates["exact"].append(docs_per_second(exact, corpus))
+        fuzzy.fuzzy_matcher.correct.cache_clear()
+        rates["fuzzy (cold cache)"].append(docs_per_second(fuzzy, corpus))
+        rates["fuzzy (warm cache)"].append(docs_per_second(fuzzy, corpus))
+
+    # Each round's fuzzy passes are compared with the exact pass run just before them,
+    # so drifting machine load affects both sides of a ratio alike
+    passed = True
+    print(f"{'mode':<22} {'docs/s':>8} {'vs exact':>9}")
+    for mode, samples in rates.items():
+        slowdown = statistics.median(exact_rate / rate for exact_rate, rate in zip(rates["exact"], samples))
+        verdict = ""
+        if mode != "exact":
+            verdict = "pass" if slowdown <= MAX_SLOWDOWN else "FAIL"
+            passed = passed and slowdown <= MAX_SLOWDOWN
+        print(f"{mode:<22} {statistics.median(samples):>8.0f} {slowdown:>8.2f}x {verdict}")
+    return passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the cost of fuzzy skill matching")
+    parser.add_argument("--repeats", type=int, default=7, help="Rounds of exact, cold and warm passes; medians are reported")
+    args = parser.parse_args()
+
+    corpus = build_corpus()
+    fuzzy = SkillExtractor(use_nlp=False, fuzzy_confidence=0.8)
+    recovered = sum(len(result["fuzzy_matches"]) for result in fuzzy.extract_many(corpus[:20]))
+    print(f"{RESUME_COUNT} resumes of {WORDS_PER_RESUME} words; {recovered} garbled skills recovered in the first 20")
+
+    passed = True
+    for use_nlp in (False, True):
+        print()
+        note = " (NLTK data not installed, falls back to text matching)" if use_nlp and _get_nltk_tools() is None else ""
+        print(f"use_nlp={use_nlp}{note}")
+        passed = compare(corpus, use_nlp, args.repeats) and passed
+    print()
+    print(f"Fuzzy matching within {MAX_SLOWDOWN:g}x of exact matching: {'pass' if passed else 'FAIL'}")
+
+    print()
+    print(f"{'skills':>8} {'build s':>8} {'uncached correction us':>23}")
+    typos = [skill[:3] + skill[4:] for skill in sorted(COMMON_TECH_SKILLS) if len(skill) >= 7 and skill.isalnum()]
+    for size in DICTIONARY_SIZES:
+        started = time.perf_counter()
+        matcher = FuzzySkillMatcher(build_dictionary(size), cache_size=0)
+        build_s = time.perf_counter() - started
+        started = time.perf_counter()
+        for typo in typos:
+            matcher.correct(typo)
+        correction_us = (time.perf_counter() - started) / len(typos) * 1e6
+        print(f"{size:>8} {build_s:>8.2f} {correction_us:>23.1f}")
+
+
+if __name__ == "__main__":
+    main()
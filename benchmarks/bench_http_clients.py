@@ -0,0 +1,78 @@
+"""
+Measure per-call latency of bare requests.post versus the pooled provider sessions.
+
+A local keep-alive HTTP stub stands in for a provider endpoint, so the numbers
+isolate connection setup cost. Real providers also pay a TLS handshake on every
+new connection, which makes the saving larger in production than shown here.
+
+Usage:
+    python -m benchmarks.bench_http_clients
+"""
+import json
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from app.utils.http_clients import http_post, close_http_clients
+
+CALLS = 300
+RESPONSE_BODY = json.dumps({"text": "Stub analysis", "model": "stub"}).encode("utf-8")
+
+
+class StubProviderHandler(BaseHTTPRequestHandler):
+    """Minimal HTTP/1.1 endpoint that answers every POST with a fixed JSON body."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; avoid Nagle stalls on kept-alive sockets
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(RESPONSE_BODY)))
+        self.end_headers()
+        self.wfile.write(RESPONSE_BODY)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def measure(post, url: str) -> list:
+    """Return per-call latencies in milliseconds."""
+    payload = {"prompt": "Analyze this resume", "max_tokens": 100}
+    latencies = []
+    for _ in range(CALLS):
+        started = time.perf_counter()
+        response = post(url, json=payload)
+        response.raise_for_status()
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+def main():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubProviderHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/v1/chat"
+
+    try:
+        bare = measure(requests.post, url)
+        pooled = measure(lambda target, **kwargs: http_post("Benchmark", target, **kwargs), url)
+    finally:
+        close_http_clients()
+        server.shutdown()
+
+    print(f"{CALLS} calls against a local stub server")
+    print(f"{'client':>14} {'median ms':>10} {'p95 ms':>8}")
+    for label, latencies in (("requests.post", bare), ("pooled session", pooled)):
+        p95 = sorted(latencies)[int(len(latencies) * 0.95) - 1]
+        print(f"{label:>14} {statistics.median(latencies):>10.3f} {p95:>8.3f}")
+    saved = statistics.median(bare) - statistics.median(pooled)
+    print(f"Median latency saved per call: {saved:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
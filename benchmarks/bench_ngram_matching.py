@@ -0,0 +1,82 @@
+"""
+Compare n-gram lookups with the token trie used by the NLP skill extractor.
+
+The original NLP path joined every bigram and trigram of the filtered tokens
+into new strings and looked each one up in the skill sets. The token trie walks
+the tokens once and allocates no intermediate strings. Both are timed on the
+same token lists, and tracemalloc reports the peak memory of one call.
+
+Usage:
+    python -m benchmarks.bench_ngram_matching
+"""
+import re
+import time
+import tracemalloc
+from typing import List
+
+from app.nlp.skill_extractor import BUSINESS_SKILLS, COMMON_TECH_SKILLS
+from app.nlp.skill_matcher import TokenTrie
+
+TOKEN_COUNTS = [200, 2000, 20000, 100000]
+
+RESUME_PARAGRAPH = (
+    "Senior software engineer experienced python java machine learning deep learning. Built "
+    "microservices django flask deployed aws kubernetes terraform google cloud. Strong leadership "
+    "communication project management time management skills practised agile scrum data science. "
+)
+
+
+def ngram_lookup(tokens: List[str]) -> set:
+    """The original approach: build all 1-, 2- and 3-grams and look each one up."""
+    unigrams = tokens
+    bigrams = [unigrams[i] + " " + unigrams[i+1] for i in range(len(unigrams)-1)]
+    trigrams = [unigrams[i] + " " + unigrams[i+1] + " " + unigrams[i+2] for i in range(len(unigrams)-2)]
+    all_ngrams = unigrams + bigrams + trigrams
+
+    skills = set()
+    for term in all_ngrams:
+        if term in COMMON_TECH_SKILLS or term in BUSINESS_SKILLS:
+            skills.add(term)
+    return skills
+
+
+def time_call(func, *args, repeat: int = 5) -> float:
+    """Best-of-N wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def peak_kib(func, *args) -> float:
+    """Peak memory allocated during one call, in KiB."""
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def main():
+    trie = TokenTrie(sorted(COMMON_TECH_SKILLS | BUSINESS_SKILLS))
+    paragraph_tokens = re.findall(r"\w+", RESUME_PARAGRAPH.lower())
+
+    print(f"{'tokens':>8} {'n-gram ms':>10} {'trie ms':>9} {'speedup':>8} {'n-gram KiB':>11} {'trie KiB':>9}")
+    for count in TOKEN_COUNTS:
+        tokens = (paragraph_tokens * (count // len(paragraph_tokens) + 1))[:count]
+        assert trie.find(tokens) == ngram_lookup(tokens)
+
+        ngram_ms = time_call(ngram_lookup, tokens)
+        trie_ms = time_call(trie.find, tokens)
+        ngram_kib = peak_kib(ngram_lookup, tokens)
+        trie_kib = peak_kib(trie.find, tokens)
+        print(f"{count:>8} {ngram_ms:>10.2f} {trie_ms:>9.2f} {ngram_ms / trie_ms:>7.1f}x "
+              f"{ngram_kib:>11.1f} {trie_kib:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Compare PDF text backends on a synthetic resume corpus.
+
+Reports pages per second for every installed backend and how closely its
+output matches PyPDF2: the ratio of extracted characters and the share of
+pages whose whitespace-normalized text is identical.
+
+Usage:
+    python -m benchmarks.bench_pdf_backends [--files 20 --pages 5]
+"""
+import argparse
+import io
+import time
+from typing import List
+
+from reportlab.pdfgen import canvas
+
+from app.utils.pdf_backends import PDF_BACKENDS, iter_pdf_backend_pages, pdf_backend_available, pdf_backend_version
+
+RESUME_LINES = [
+    "EXPERIENCE",
+    "Senior software engineer building microservices with Python, Django and PostgreSQL",
+    "Led a team of six engineers; drove agile delivery, code reviews and mentoring",
+    "Deployed workloads on AWS with Docker, Kubernetes and Terraform via GitHub Actions",
+    "SKILLS",
+    "Python, Java, JavaScript, React, Node.js, SQL, Redis, Kafka, Leadership, Communication",
+]
+
+
+def build_corpus(files: int, pages: int) -> List[bytes]:
+    """Return PDFs with a full page of resume text per page."""
+    corpus = []
+    for _ in range(files):
+        buffer = io.BytesIO()
+        pdf = canvas.Canvas(buffer)
+        for _ in range(pages):
+            for line_number, line in enumerate(RESUME_LINES * 6):
+                pdf.drawString(50, 780 - line_number * 20, line)
+            pdf.showPage()
+        pdf.save()
+        corpus.append(buffer.getvalue())
+    return corpus
+
+
+def extract_pages(corpus: List[bytes], backend: str) -> List[str]:
+    """Extract every page of the corpus with one backend."""
+    pages = []
+    for data in corpus:
+        pages.extend(iter_pdf_backend_pages(io.BytesIO(data), backend=backend))
+    return pages
+
+
+def normalize(text: str) -> str:
+    """Collapse whitespace so layout differences do not count as mismatches."""
+    return " ".join(text.split())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.files, args.pages)
+    reference = extract_pages(corpus, "pypdf2")
+    reference_chars = sum(len(page) for page in reference)
+    print(f"Corpus: {args.files} PDFs x {args.pages} pages")
+    print(f"{'backend':<22} {'pages/s':>9} {'chars vs pypdf2':>16} {'identical pages':>16}")
+
+    for name in PDF_BACKENDS:
+        label = f"{name} {pdf_backend_version(name)}"
+        if not pdf_backend_available(name):
+            print(f"{name:<22} {'not installed':>9}")
+            continue
+        started = time.perf_counter()
+        pages = extract_pages(corpus, name)
+        elapsed = time.perf_counter() - started
+        chars = sum(len(page) for page in pages)
+        identical = sum(normalize(a) == normalize(b) for a, b in zip(pages, reference))
+        print(f"{label:<22} {len(pages) / elapsed:>9.1f} {chars / reference_chars:>15.1%} "
+              f"{identical / len(reference):>15.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Compare serial and per-page parallel PDF extraction latency.
+
+Long synthetic CVs (publication lists) are extracted once on the serial path
+and once split across a process pool. The speedup grows with the number of
+available cores; on a single core the pool only adds overhead.
+
+Usage:
+    python -m benchmarks.bench_pdf_parallel [--backend pypdf2]
+"""
+import argparse
+import io
+import os
+import time
+
+from reportlab.pdfgen import canvas
+
+from app.utils.parse_resume import extract_text_from_pdf
+from app.utils.pdf_backends import shutdown_pdf_pool
+
+PAGE_COUNTS = [5, 30, 60, 120]
+
+
+def build_cv(pages: int) -> io.BytesIO:
+    """Return a PDF with a dense page of publication entries per page."""
+    buffer = io.BytesIO()
+    pdf = canvas.Canvas(buffer)
+    for page in range(pages):
+        for line in range(45):
+            pdf.drawString(40, 800 - line * 17, f"[{page * 45 + line}] Doe, J. et al. Scalable skill extraction "
+                                                f"with Python and Kubernetes. Proc. ICML, pp. {line}-{line + 9}.")
+        pdf.showPage()
+    pdf.save()
+    return buffer
+
+
+def time_call(func, *args, repeat: int = 3, **kwargs) -> float:
+    """Best-of-N wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args, **kwargs)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--backend", default="pypdf2")
+    args = parser.parse_args()
+
+    print(f"Backend: {args.backend}, {os.cpu_count()} CPU(s)")
+    print(f"{'pages':>6} {'serial ms':>10} {'parallel ms':>12} {'speedup':>8}")
+    try:
+        for pages in PAGE_COUNTS:
+            cv = build_cv(pages)
+            serial = extract_text_from_pdf(cv, backend=args.backend, parallel=False)
+            assert extract_text_from_pdf(cv, backend=args.backend, parallel=True) == serial
+            serial_ms = time_call(extract_text_from_pdf, cv, backend=args.backend, parallel=False)
+            parallel_ms = time_call(extract_text_from_pdf, cv, backend=args.backend, parallel=True)
+            print(f"{pages:>6} {serial_ms:>10.1f} {parallel_ms:>12.1f} {serial_ms / parallel_ms:>7.2f}x")
+    finally:
+        shutdown_pdf_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Compare peak Python memory of the old copying input path with zero-copy inputs.
+
+A large multi-page PDF is extracted with a one-page limit, so the numbers show
+the cost of getting the bytes to the parser rather than of parsing them. Peak
+allocations are measured with tracemalloc; memory-mapped pages belong to the
+OS page cache and are not counted against the process heap.
+
+Usage:
+    python -m benchmarks.bench_resume_input [--pages 1000]
+"""
+import argparse
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+
+from reportlab.pdfgen import canvas
+
+from app.utils.parse_resume import extract_resume_text, extract_text_from_pdf
+
+
+def build_pdf(path: str, pages: int) -> None:
+    """Write a PDF with a few dozen lines of text per page."""
+    pdf = canvas.Canvas(path)
+    for page in range(pages):
+        for line in range(40):
+            pdf.drawString(50, 800 - line * 18, f"Page {page} line {line}: Python, Kubernetes, PostgreSQL, leadership")
+        pdf.showPage()
+    pdf.save()
+
+
+def legacy_extract(upload: io.BytesIO) -> str:
+    """The original input path: copy the upload into a fresh BytesIO."""
+    return extract_text_from_pdf(io.BytesIO(upload.getvalue()), max_pages=1)
+
+
+def legacy_extract_path(path: str) -> str:
+    """The original batch path: read the whole file into memory first."""
+    with open(path, "rb") as handle:
+        return extract_text_from_pdf(io.BytesIO(handle.read()), max_pages=1)
+
+
+def measure(func, *args):
+    """Return (peak traced MiB, milliseconds) for one call."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / (1024 * 1024), elapsed * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pages", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "large.pdf")
+        build_pdf(path, args.pages)
+        with open(path, "rb") as handle:
+            upload = io.BytesIO(handle.read())
+        print(f"PDF: {args.pages} pages, {os.path.getsize(path) / (1024 * 1024):.1f} MiB")
+        print(f"{'input':<22} {'peak MiB':>9} {'ms':>8}")
+
+        cases = [
+            ("upload copy (old)", legacy_extract, upload),
+            ("upload in place", lambda: extract_resume_text(upload, "large.pdf", max_pages=1)),
+            ("memoryview", lambda: extract_resume_text(upload.getbuffer(), "large.pdf", max_pages=1)),
+            ("file read (old batch)", legacy_extract_path, path),
+            ("file path (mmap)", lambda: extract_resume_text(path, max_pages=1)),
+        ]
+        # Warm up imports and parser caches so the first case is not penalized
+        legacy_extract(upload)
+        for label, func, *call_args in cases:
+            peak, elapsed = measure(func, *call_args)
+            print(f"{label:<22} {peak:>9.2f} {elapsed:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
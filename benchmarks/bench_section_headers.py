@@ -0,0 +1,90 @@
+"""
+Compare the original per-header regex loop with the precompiled section matcher.
+
+Synthetic resumes of increasing length mix section headers, header-like lines
+and ordinary content; both implementations must produce identical sections.
+
+Usage:
+    python -m benchmarks.bench_section_headers
+"""
+import random
+import re
+import time
+from typing import Dict
+
+from app.utils.parse_resume import SECTION_HEADERS, extract_resume_sections
+
+RESUME_LENGTHS = [300, 3000, 30000]
+
+CONTENT_LINES = [
+    "Senior software engineer building microservices with Python and Django",
+    "Led a team of six engineers; drove agile delivery and code reviews",
+    "Skills include Kubernetes, Terraform and GitHub Actions",
+    "University XYZ, 2015-2019",
+    "Email: jane.doe@example.com",
+    "",
+]
+
+
+def legacy_extract_resume_sections(text: str) -> Dict[str, str]:
+    """The original implementation: one freshly built regex per header per line."""
+    sections = {}
+    current_section = "header"
+    section_content = []
+    for line in text.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        header_match = None
+        for header in SECTION_HEADERS:
+            match = re.search(r'^\s*(' + re.escape(header) + r')[\s:]*$', line.lower())
+            if match:
+                header_match = match.group(1)
+                break
+        if header_match:
+            if section_content:
+                sections[current_section] = '\n'.join(section_content)
+                section_content = []
+            current_section = header_match
+        else:
+            section_content.append(line)
+    if section_content:
+        sections[current_section] = '\n'.join(section_content)
+    return sections
+
+
+def build_resume(lines: int, seed: int = 42) -> str:
+    """Return resume text where roughly one line in ten is a header."""
+    rng = random.Random(seed)
+    out = []
+    for _ in range(lines):
+        if rng.random() < 0.1:
+            header = rng.choice(SECTION_HEADERS)
+            out.append(rng.choice([header.upper(), header.title() + ":", f"  {header} : "]))
+        else:
+            out.append(rng.choice(CONTENT_LINES))
+    return "\n".join(out)
+
+
+def time_call(func, *args, repeat: int = 3) -> float:
+    """Best-of-N wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    print(f"{'lines':>8} {'regex ms':>10} {'matcher ms':>11} {'speedup':>8}")
+    for lines in RESUME_LENGTHS:
+        text = build_resume(lines)
+        assert legacy_extract_resume_sections(text) == extract_resume_sections(text)
+        legacy_ms = time_call(legacy_extract_resume_sections, text)
+        matcher_ms = time_call(extract_resume_sections, text)
+        print(f"{lines:>8} {legacy_ms:>10.2f} {matcher_ms:>11.2f} {legacy_ms / matcher_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
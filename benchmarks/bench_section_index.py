@@ -0,0 +1,64 @@
+"""
+Compare the memory held by parsed resumes with section dicts and with span indexes.
+
+Many synthetic resumes are kept in memory together with their sections, once
+as text plus a dict of section strings and once as text plus a ResumeSections
+span index. Peak allocations are measured with tracemalloc.
+
+Usage:
+    python -m benchmarks.bench_section_index [--resumes 2000]
+"""
+import argparse
+import gc
+import random
+import tracemalloc
+
+from app.utils.resume_sections import SECTION_HEADERS, extract_resume_sections, index_resume_sections
+
+CONTENT_LINES = [
+    "Senior software engineer building microservices with Python and Django",
+    "Led a team of six engineers; drove agile delivery and code reviews",
+    "Deployed workloads on AWS with Docker, Kubernetes and Terraform",
+    "University XYZ, B.Sc. Computer Science, 2015-2019",
+]
+
+
+def build_resume(rng: random.Random) -> str:
+    """Return a resume of eight sections with a dozen content lines each."""
+    lines = ["Jane Doe", "jane.doe@example.com"]
+    for header in rng.sample(SECTION_HEADERS, 8):
+        lines.append(header.upper())
+        lines.extend(rng.choice(CONTENT_LINES) for _ in range(12))
+    return "\n".join(lines)
+
+
+def measure(texts, parse) -> float:
+    """Return MiB allocated to hold every text alongside its parsed sections."""
+    gc.collect()
+    tracemalloc.start()
+    held = [(text, parse(text)) for text in texts]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return current / (1024 * 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--resumes", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    texts = [build_resume(rng) for _ in range(args.resumes)]
+    text_mib = sum(len(text) for text in texts) / (1024 * 1024)
+    print(f"{args.resumes} resumes, {text_mib:.1f} MiB of text (held in both cases)")
+
+    dict_mib = measure(texts, extract_resume_sections)
+    index_mib = measure(texts, index_resume_sections)
+    print(f"{'sections as':<16} {'extra MiB':>10} {'total MiB':>10}")
+    print(f"{'dict of str':<16} {dict_mib:>10.1f} {dict_mib + text_mib:>10.1f}")
+    print(f"{'span index':<16} {index_mib:>10.1f} {index_mib + text_mib:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
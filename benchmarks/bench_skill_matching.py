@@ -0,0 +1,77 @@
+"""
+Compare the per-skill regex scan with the Aho-Corasick skill matcher.
+
+Dictionaries grow from the built-in skill sets (~250 entries) to 50k entries by
+adding synthetic skill names, so the numbers show how each approach scales with
+dictionary size on the same resume text.
+
+Usage:
+    python -m benchmarks.bench_skill_matching
+"""
+import random
+import re
+import string
+import time
+from typing import List
+
+from app.nlp.skill_extractor import COMMON_TECH_SKILLS, BUSINESS_SKILLS
+from app.nlp.skill_matcher import SkillMatcher
+
+DICTIONARY_SIZES = [250, 1000, 5000, 20000, 50000]
+
+RESUME_PARAGRAPH = (
+    "Senior software engineer with experience in python, java and c++. Built microservices "
+    "with django, flask and node.js, deployed on aws and kubernetes using terraform and ci/cd. "
+    "Strong leadership, communication and project management skills; practised agile and scrum. "
+)
+
+
+def build_dictionary(size: int, seed: int = 42) -> List[str]:
+    """Return the built-in skills padded with synthetic multi-word skill names."""
+    rng = random.Random(seed)
+    skills = set(COMMON_TECH_SKILLS | BUSINESS_SKILLS)
+    while len(skills) < size:
+        words = rng.randint(1, 3)
+        skills.add(" ".join(
+            "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 9)))
+            for _ in range(words)
+        ))
+    return sorted(skills)
+
+
+def regex_scan(skills: List[str], text: str) -> set:
+    """The original approach: one word-bounded re.search per skill."""
+    return {skill for skill in skills if re.search(r'\b' + re.escape(skill) + r'\b', text)}
+
+
+def time_call(func, *args, repeat: int = 3) -> float:
+    """Best-of-N wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    text = (RESUME_PARAGRAPH * 20).lower()
+    print(f"Resume text: {len(text):,} characters")
+    print(f"{'skills':>8} {'build ms':>10} {'regex ms':>10} {'matcher ms':>11} {'speedup':>8}")
+
+    for size in DICTIONARY_SIZES:
+        skills = build_dictionary(size)
+
+        started = time.perf_counter()
+        matcher = SkillMatcher(skills)
+        build_ms = (time.perf_counter() - started) * 1000
+
+        assert matcher.find(text) == regex_scan(skills, text)
+
+        regex_ms = time_call(regex_scan, skills, text, repeat=1 if size > 5000 else 3)
+        matcher_ms = time_call(matcher.find, text)
+        print(f"{size:>8} {build_ms:>10.1f} {regex_ms:>10.1f} {matcher_ms:>11.2f} {regex_ms / matcher_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
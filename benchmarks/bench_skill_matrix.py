@@ -0,0 +1,80 @@
+"""
+Build a resume-by-skill matrix and compare it with the pandas route.
+
+Synthetic resumes are counted into a sparse SkillMatrix, and separately
+extracted one by one with extract and turned into a resume-by-skill table
+with pandas (explode plus crosstab), as analytics scripts did before. The
+benchmark reports both build times, the memory each result takes and how long
+a skill frequency query takes on each.
+
+Usage:
+    python -m benchmarks.bench_skill_matrix [--resumes 5000]
+"""
+import argparse
+import random
+import time
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from app.nlp.skill_extractor import BUSINESS_SKILLS, COMMON_TECH_SKILLS, SkillExtractor
+from app.nlp.skill_matrix import build_skill_matrix
+
+WORDS_PER_RESUME = 400
+COMMON_WORDS = (
+    "experience team built designed developed services led managed improved delivered platform customers "
+    "using with and for the in of on at to from across large scale reliable production systems company"
+).split()
+
+
+def build_corpus(resumes: int, seed: int = 11) -> List[str]:
+    """Return synthetic resumes with about one skill in ten words."""
+    rng = random.Random(seed)
+    skills = sorted(COMMON_TECH_SKILLS | BUSINESS_SKILLS)
+    return [
+        " ".join(rng.choice(skills) if rng.random() < 0.1 else rng.choice(COMMON_WORDS) for _ in range(WORDS_PER_RESUME))
+        for _ in range(resumes)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--resumes", type=int, default=5000, help="Synthetic resumes to count")
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.resumes)
+    extractor = SkillExtractor(use_nlp=False)
+
+    started = time.perf_counter()
+    matrix = build_skill_matrix(iter(corpus), extractor)
+    matrix_s = time.perf_counter() - started
+    matrix_bytes = matrix.row.nbytes + matrix.col.nbytes + matrix.data.nbytes
+
+    started = time.perf_counter()
+    records = [extractor.extract(text) for text in corpus]
+    frame = pd.DataFrame({"skill": [result["technical_skills"] + result["soft_skills"] for result in records]})
+    exploded = frame.explode("skill").dropna()
+    table = pd.crosstab(exploded.index, exploded["skill"])
+    pandas_s = time.perf_counter() - started
+    table_bytes = int(table.memory_usage(deep=True).sum())
+
+    started = time.perf_counter()
+    resumes_per_skill = np.bincount(matrix.col, minlength=matrix.shape[1])
+    matrix_query_ms = (time.perf_counter() - started) * 1000
+    started = time.perf_counter()
+    table_counts = (table > 0).sum(axis=0)
+    table_query_ms = (time.perf_counter() - started) * 1000
+    top = matrix.skills[int(resumes_per_skill.argmax())]
+    assert resumes_per_skill.max() == table_counts.max()
+
+    print(f"{args.resumes:,} resumes, {matrix.shape[1]} skills, {matrix.nnz:,} nonzero counts; most common: {top}")
+    print(f"{'route':<26} {'build s':>8} {'resumes/s':>10} {'memory KiB':>11} {'frequency ms':>13}")
+    print(f"{'SkillMatrix (COO)':<26} {matrix_s:>8.2f} {args.resumes / matrix_s:>10.0f} "
+          f"{matrix_bytes / 1024:>11.0f} {matrix_query_ms:>13.2f}")
+    print(f"{'extract + pandas crosstab':<26} {pandas_s:>8.2f} {args.resumes / pandas_s:>10.0f} "
+          f"{table_bytes / 1024:>11.0f} {table_query_ms:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Measure a large compiled skill taxonomy against the built-in skill sets.
+
+A synthetic taxonomy of 100k skills with two aliases each is written as CSV
+and compiled into an index. The benchmark reports the compile time, the index
+size, how long opening the memory-mapped index takes, and the time to extract
+skills from a resume with it. For comparison it also times building the
+Aho-Corasick matcher the built-in skills use over the same names, which every
+worker process would otherwise repeat.
+
+Usage:
+    python -m benchmarks.bench_skill_taxonomy
+"""
+import csv
+import os
+import random
+import string
+import tempfile
+import time
+
+from app.nlp.skill_extractor import BUSINESS_SKILLS, COMMON_TECH_SKILLS, SkillExtractor
+from app.nlp.skill_matcher import SkillMatcher
+from app.nlp.skill_taxonomy import SkillIndex, compile_taxonomy
+
+TAXONOMY_SIZE = 100000
+ALIASES_PER_SKILL = 2
+
+RESUME_PARAGRAPH = (
+    "Senior software engineer with experience in python, java and c++. Built microservices "
+    "with django, flask and node.js, deployed on aws and kubernetes using terraform and ci/cd. "
+    "Strong leadership, communication and project management skills; practised agile and scrum. "
+)
+
+
+def random_name(rng: random.Random) -> str:
+    """Return a synthetic one- to three-word skill name."""
+    return " ".join(
+        "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 9)))
+        for _ in range(rng.randint(1, 3))
+    )
+
+
+def write_taxonomy(path: str, size: int, seed: int = 42) -> None:
+    """Write the built-in skills plus synthetic skills and aliases as a taxonomy CSV."""
+    rng = random.Random(seed)
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(["skill", "category", "aliases"])
+        for skill in sorted(COMMON_TECH_SKILLS | BUSINESS_SKILLS):
+            categories = [name for name, skills in (("technical", COMMON_TECH_SKILLS), ("soft", BUSINESS_SKILLS))
+                          if skill in skills]
+            writer.writerow([skill, "|".join(categories), ""])
+        for _ in range(size):
+            aliases = "|".join(random_name(rng) for _ in range(ALIASES_PER_SKILL))
+            writer.writerow([random_name(rng), rng.choice(["technical", "soft"]), aliases])
+
+
+def time_call(func, *args, repeat: int = 5) -> float:
+    """Best-of-N wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    text = RESUME_PARAGRAPH * 20
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "skills.csv")
+        index_path = os.path.join(directory, "skills.idx")
+        write_taxonomy(source, TAXONOMY_SIZE)
+
+        started = time.perf_counter()
+        skill_count = compile_taxonomy(source, index_path)
+        compile_s = time.perf_counter() - started
+        print(f"Compiled {skill_count:,} skills in {compile_s:.1f}s; "
+              f"index is {os.path.getsize(index_path) / (1024 * 1024):.1f} MB")
+
+        open_ms = time_call(lambda: SkillIndex.open(index_path).close())
+        print(f"Open memory-mapped index: {open_ms:.3f} ms")
+
+        index = SkillIndex.open(index_path)
+        builtin = SkillExtractor(use_nlp=False)
+        taxonomy = SkillExtractor(taxonomy=index, use_nlp=False)
+        assert set(builtin.extract(text)["technical_skills"]) <= set(taxonomy.extract(text)["technical_skills"])
+
+        print(f"Resume text: {len(text):,} characters")
+        print(f"  built-in skills ({len(builtin.matcher):,} names): {time_call(builtin.extract, text):.2f} ms")
+        print(f"  taxonomy index ({index.key_count:,} keys):  {time_call(taxonomy.extract, text):.2f} ms")
+
+        names = [name for name in index.skill_names()]
+        started = time.perf_counter()
+        SkillMatcher(names)
+        print(f"Building an Aho-Corasick matcher over the {len(names):,} canonical names instead: "
+              f"{time.perf_counter() - started:.1f}s per process")
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
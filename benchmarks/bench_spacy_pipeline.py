@@ -0,0 +1,81 @@
+"""
+Compare batched spaCy skill extraction with calling the model per document.
+
+A synthetic corpus of resumes is parsed three ways: ``nlp(text)`` for each
+document with the full pipeline, ``nlp.pipe`` in batches with the components
+the skill candidates do not need disabled, and the same over several
+processes. Each run feeds its tokens, entities and noun chunks to the skill
+matcher, and the docs per second are reported.
+
+Needs spaCy and its model (``python -m spacy download en_core_web_sm``).
+
+Usage:
+    python -m benchmarks.bench_spacy_pipeline [--docs 400 --batch-size 64 --processes 4]
+"""
+import argparse
+import random
+import time
+from typing import List
+
+from app.nlp.skill_extractor import SkillExtractor, SpacySkillPipeline, load_nlp_model
+
+RESUME_SENTENCES = [
+    "Senior software engineer at Acme Corp building microservices with Python, Django and PostgreSQL.",
+    "Led a team of six engineers at Globex; drove agile delivery, code reviews and mentoring.",
+    "Deployed workloads on AWS with Docker, Kubernetes and Terraform through GitHub Actions.",
+    "Built streaming pipelines with Apache Kafka, Snowflake and Airflow for the analytics team.",
+    "Strong communication, stakeholder management and project management skills.",
+    "Trained machine learning models with PyTorch and scikit-learn on Google Cloud.",
+]
+
+
+def build_corpus(docs: int, seed: int = 3) -> List[str]:
+    """Return resumes of 30 shuffled sentences each."""
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(RESUME_SENTENCES) for _ in range(30)) for _ in range(docs)]
+
+
+def docs_per_second(run, corpus: List[str]) -> float:
+    """Run an extraction over the corpus and return the throughput."""
+    started = time.perf_counter()
+    run(corpus)
+    return len(corpus) / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--docs", type=int, default=400, help="Synthetic resumes to parse")
+    parser.add_argument("--batch-size", type=int, default=64, help="Texts per nlp.pipe batch")
+    parser.add_argument("--processes", type=int, default=4, help="Processes for the multiprocess run")
+    args = parser.parse_args()
+
+    nlp = load_nlp_model()
+    if nlp is None:
+        print("spaCy or its model is not installed; nothing to compare.")
+        return
+
+    corpus = build_corpus(args.docs)
+    extractor = SkillExtractor(use_nlp=False)
+    single = SpacySkillPipeline(extractor, batch_size=args.batch_size, nlp=nlp)
+    parallel = SpacySkillPipeline(extractor, batch_size=args.batch_size, n_process=args.processes, nlp=nlp)
+
+    def per_document(texts):
+        # What calling the model directly costs: every component, one text at a time
+        return [single.extract_doc(nlp(text)) for text in texts]
+
+    print(f"{args.docs} resumes of {sum(map(len, corpus)) // args.docs:,} characters; "
+          f"disabled pipes: {', '.join(single.disabled_pipes) or 'none'}")
+    baseline = docs_per_second(per_document, corpus)
+    rows = [
+        ("nlp(text) per document", baseline),
+        (f"nlp.pipe batch {args.batch_size}", docs_per_second(lambda texts: list(single.extract_many(texts)), corpus)),
+        (f"nlp.pipe x{args.processes} processes",
+         docs_per_second(lambda texts: list(parallel.extract_many(texts)), corpus)),
+    ]
+    print(f"{'mode':<28} {'docs/s':>8} {'speedup':>8}")
+    for name, rate in rows:
+        print(f"{name:<28} {rate:>8.1f} {rate / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import io
+from docx import Document
+from reportlab.pdfgen import canvas
+
+def pdf_bytes(pages):
+    """Build PDF bytes with one line of text per page."""
+    buffer = io.BytesIO()
+    pdf = canvas.Canvas(buffer)
+    for page_text in pages:
+        pdf.drawString(72, 720, page_text)
+        pdf.showPage()
+    pdf.save()
+    return buffer.getvalue()
+
+def docx_bytes(*paragraphs):
+    """Build DOCX bytes with the given paragraphs."""
+    doc = Document()
+    for paragraph in paragraphs:
+        doc.add_paragraph(paragraph)
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+def make_pdf(pages):
+    """Build an in-memory PDF file with one line of text per page."""
+    return io.BytesIO(pdf_bytes(pages))
+
+def make_docx(*paragraphs):
+    """Build an in-memory DOCX file with the given paragraphs."""
+    return io.BytesIO(docx_bytes(*paragraphs))
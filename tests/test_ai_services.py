@@ -1,15 +1,38 @@
 import unittest
+import time
 from unittest.mock import patch, MagicMock
 from app.utils.ai_services import (
     validate_api_key, 
     AIProvider, 
-    AIServiceError,
-    get_available_models
+    get_available_models,
+    clear_model_list_cache,
+    _refresh_models,
+    AVAILABLE_MODELS,
+    MAX_CACHED_MODEL_LISTS,
+    analyze_with_cohere,
+    analyze_with_openai,
+    analyze_resume_with_ai,
+    analyze_resume_with_ai_stream,
+    get_job_match_analysis_stream
+)
+from app.utils.provider_clients import api_key_hash, get_openai_client, get_gemini_generative_client
+from app.utils.response_cache import get_response_cache
+from app.utils.http_clients import (
+    get_http_session,
+    get_timeout,
+    configure_http_clients,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_READ_TIMEOUT
 )
 
 class TestAIServices(unittest.TestCase):
     """Test cases for AI services functionality."""
     
+    def setUp(self):
+        """Start every test with empty response and model list caches."""
+        get_response_cache().clear()
+        clear_model_list_cache()
+    
     def test_validate_api_key(self):
         """Test API key validation for different providers."""
         # OpenAI - should start with sk-
@@ -35,17 +58,18 @@ class TestAIServices(unittest.TestCase):
         self.assertIn("name", models[0])
         self.assertIn("context_window", models[0])
     
-    @patch('app.utils.ai_services.openai.models.list')
-    def test_get_available_models_with_api_key(self, mock_list):
+    @patch('app.utils.ai_services.get_openai_client')
+    def test_get_available_models_with_api_key(self, mock_get_client):
         """Test getting available models with a valid API key."""
         # Mock the OpenAI models.list response
         mock_model = MagicMock()
         mock_model.id = "gpt-4"
         mock_response = MagicMock()
         mock_response.data = [mock_model]
+        mock_list = mock_get_client.return_value.models.list
         mock_list.return_value = mock_response
         
-        models = get_available_models(AIProvider.OPENAI.value, "sk-valid-key")
+        models = get_available_models(AIProvider.OPENAI.value, "sk-valid-key", wait=True)
         
         # Should have at least one model
         self.assertTrue(len(models) > 0)
@@ -53,19 +77,223 @@ class TestAIServices(unittest.TestCase):
         # The mock was called
         mock_list.assert_called_once()
 
-    @patch('app.utils.ai_services.openai.models.list')
-    def test_get_available_models_api_error(self, mock_list):
+    @patch('app.utils.ai_services.get_openai_client')
+    def test_get_available_models_api_error(self, mock_get_client):
         """Test handling API errors when fetching models."""
         # Make the API call fail
-        mock_list.side_effect = Exception("API Error")
+        mock_get_client.return_value.models.list.side_effect = Exception("API Error")
         
         # Should fall back to predefined models
-        models = get_available_models(AIProvider.OPENAI.value, "sk-valid-key")
+        models = get_available_models(AIProvider.OPENAI.value, "sk-valid-key", wait=True)
         
         # Should still return models from the predefined list
         self.assertTrue(len(models) > 0)
         self.assertIn("id", models[0])
         self.assertIn("name", models[0])
 
+    @patch('app.utils.ai_services._fetch_models')
+    def test_get_available_models_never_blocks(self, mock_fetch):
+        """Test that cold and stale listings return immediately and refresh in the background."""
+        fetched = [{"id": "gpt-live", "name": "Live", "context_window": 0, "description": "OpenAI model"}]
+        mock_fetch.return_value = fetched
+        
+        # Cold: predefined models right away, fetch happens in the background
+        models = get_available_models(AIProvider.OPENAI.value, "sk-valid-key")
+        self.assertEqual(models, AVAILABLE_MODELS[AIProvider.OPENAI.value])
+        for _ in range(100):
+            if get_available_models(AIProvider.OPENAI.value, "sk-valid-key") == fetched:
+                break
+            time.sleep(0.01)
+        self.assertEqual(get_available_models(AIProvider.OPENAI.value, "sk-valid-key"), fetched)
+        self.assertEqual(mock_fetch.call_count, 1)
+        
+        # Stale: cached listing is served while a refresh runs
+        self.assertEqual(get_available_models(AIProvider.OPENAI.value, "sk-valid-key", ttl=0), fetched)
+        for _ in range(100):
+            if mock_fetch.call_count == 2:
+                break
+            time.sleep(0.01)
+        self.assertEqual(mock_fetch.call_count, 2)
+    
+    @patch('app.utils.ai_services.get_openai_client')
+    def test_failed_refresh_keeps_listing(self, mock_get_client):
+        """Test that a failed refresh keeps the last listing and is retried on the next call."""
+        model = MagicMock()
+        model.id = "gpt-4o-live"
+        mock_get_client.return_value.models.list.return_value.data = [model]
+        fetched = get_available_models(AIProvider.OPENAI.value, "sk-valid-key", wait=True)
+        self.assertEqual([entry["id"] for entry in fetched], ["gpt-4o-live"])
+        
+        mock_get_client.return_value.models.list.side_effect = Exception("API Error")
+        _refresh_models((AIProvider.OPENAI.value, api_key_hash("sk-valid-key")), AIProvider.OPENAI.value, "sk-valid-key")
+        self.assertEqual(get_available_models(AIProvider.OPENAI.value, "sk-valid-key"), fetched)
+        
+        # The failed entry is still stale, so the next call refreshes again
+        mock_get_client.return_value.models.list.side_effect = None
+        get_available_models(AIProvider.OPENAI.value, "sk-valid-key", ttl=0)
+        for _ in range(100):
+            if mock_get_client.return_value.models.list.call_count == 3:
+                break
+            time.sleep(0.01)
+        self.assertEqual(mock_get_client.return_value.models.list.call_count, 3)
+    
+    @patch('app.utils.ai_services._fetch_models')
+    def test_model_list_cache_evicts_least_recently_used(self, mock_fetch):
+        """Test that the model list cache keeps only the most recently used keys."""
+        mock_fetch.side_effect = lambda provider, api_key: [{"id": api_key}]
+        keys = [f"sk-key-{number:03d}" for number in range(MAX_CACHED_MODEL_LISTS + 1)]
+        get_available_models(AIProvider.OPENAI.value, keys[0], wait=True)
+        for key in keys[1:-1]:
+            get_available_models(AIProvider.OPENAI.value, key, wait=True)
+        get_available_models(AIProvider.OPENAI.value, keys[0])  # keys[0] becomes most recently used
+        get_available_models(AIProvider.OPENAI.value, keys[-1], wait=True)
+        
+        calls = mock_fetch.call_count
+        self.assertEqual(get_available_models(AIProvider.OPENAI.value, keys[0]), [{"id": keys[0]}])
+        self.assertEqual(mock_fetch.call_count, calls)
+        # keys[1] was the least recently used, so it was evicted and is fetched again
+        get_available_models(AIProvider.OPENAI.value, keys[1], wait=True)
+        self.assertEqual(mock_fetch.call_count, calls + 1)
+    
+    def test_http_sessions_pooled_per_provider(self):
+        """Test that each provider reuses one pooled session."""
+        session = get_http_session(AIProvider.COHERE.value)
+        
+        self.assertIs(session, get_http_session(AIProvider.COHERE.value))
+        self.assertIsNot(session, get_http_session(AIProvider.NVIDIA.value))
+    
+    def test_provider_requests_use_session_and_timeout(self):
+        """Test that provider calls go through the pooled session with a timeout."""
+        configure_http_clients(connect_timeout=2, read_timeout=30)
+        self.addCleanup(configure_http_clients, connect_timeout=DEFAULT_CONNECT_TIMEOUT, read_timeout=DEFAULT_READ_TIMEOUT)
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"text": "Strong resume"}
+        
+        with patch.object(get_http_session(AIProvider.COHERE.value), "post", return_value=mock_response) as mock_post:
+            result = analyze_with_cohere("key", "system", "context", "prompt", 100)
+        
+        self.assertEqual(result["analysis"], "Strong resume")
+        self.assertEqual(mock_post.call_args.kwargs["timeout"], (2, 30))
+        self.assertEqual(get_timeout(), (2, 30))
+        self.assertNotIn("Authorization", get_http_session(AIProvider.COHERE.value).headers)
+    
+    def test_provider_clients_cached_per_key(self):
+        """Test that SDK clients are reused per key and never shared between keys."""
+        client = get_openai_client("sk-first-key-1234567890")
+        
+        self.assertIs(client, get_openai_client("sk-first-key-1234567890"))
+        self.assertIsNot(client, get_openai_client("sk-second-key-1234567890"))
+        self.assertEqual(client.api_key, "sk-first-key-1234567890")
+        self.assertIsNot(get_gemini_generative_client("a" * 30), get_gemini_generative_client("b" * 30))
+    
+    @patch('app.utils.ai_services.get_openai_client')
+    def test_openai_analysis_leaves_global_key_untouched(self, mock_get_client):
+        """Test that analyses use a per-key client instead of openai.api_key."""
+        import openai
+        original_key = openai.api_key
+        mock_response = MagicMock()
+        mock_response.choices[0].message.content = "Looks good"
+        mock_response.model = "gpt-4o"
+        mock_response.usage.total_tokens = 42
+        mock_get_client.return_value.chat.completions.create.return_value = mock_response
+        
+        result = analyze_with_openai("sk-user-key-1234567890", "system", "context", "prompt", 100)
+        
+        self.assertEqual(result["analysis"], "Looks good")
+        mock_get_client.assert_called_once_with("sk-user-key-1234567890")
+        self.assertEqual(openai.api_key, original_key)
+    
+    @patch('app.utils.ai_services.get_gemini_generative_client')
+    def test_gemini_analysis_uses_per_key_client_with_deadline(self, mock_get_client):
+        """Test that Gemini requests go through the per-key client with an explicit timeout."""
+        from google.ai import generativelanguage as glm
+        mock_get_client.return_value.generate_content.return_value = glm.GenerateContentResponse(
+            candidates=[glm.Candidate(content=glm.Content(parts=[glm.Part(text="Strong "), glm.Part(text="resume")]))]
+        )
+        configure_http_clients(connect_timeout=2, read_timeout=30)
+        
+        result = analyze_resume_with_ai("Resume", AIProvider.GOOGLE.value, "a" * 30, "system", model_id="gemini-1.5-pro")
+        
+        self.assertEqual(result["analysis"], "Strong resume")
+        mock_get_client.assert_called_once_with("a" * 30)
+        request = mock_get_client.return_value.generate_content.call_args.args[0]
+        self.assertEqual(request.model, "models/gemini-1.5-pro")
+        self.assertEqual(mock_get_client.return_value.generate_content.call_args.kwargs["timeout"], 32)
+    
+    def test_streaming_chat_completions(self):
+        """Test that OpenAI-compatible SSE deltas are yielded as they arrive."""
+        mock_response = MagicMock()
+        mock_response.iter_lines.return_value = [
+            'data: {"choices": [{"delta": {"content": "Strong "}}]}',
+            '',
+            'data: {"choices": [{"delta": {"content": "resume"}}]}',
+            'data: [DONE]'
+        ]
+        
+        with patch.object(get_http_session(AIProvider.OPENROUTER.value), "post", return_value=mock_response) as mock_post:
+            stream = analyze_resume_with_ai_stream("Resume", AIProvider.OPENROUTER.value, "sk-or-1234567890", "system")
+            chunks = list(stream)
+        
+        self.assertEqual(chunks, ["Strong ", "resume"])
+        self.assertTrue(mock_post.call_args.kwargs["json"]["stream"])
+        self.assertEqual(stream.result["analysis"], "Strong resume")
+        self.assertEqual(stream.result["provider"], "OpenRouter")
+    
+    def test_streaming_fallback_single_chunk(self):
+        """Test that providers without streaming yield the full analysis once."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"text": "Good match"}
+        
+        with patch.object(get_http_session(AIProvider.COHERE.value), "post", return_value=mock_response):
+            stream = get_job_match_analysis_stream("Resume", "Job", AIProvider.COHERE.value, "cohere-key-123")
+            chunks = list(stream)
+        
+        self.assertEqual(chunks, ["Good match"])
+        self.assertEqual(stream.result["provider"], "Cohere")
+    
+    def test_repeated_analysis_served_from_cache(self):
+        """Test that identical analyses hit the response cache and are marked as cached."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"text": "Solid resume"}
+        
+        with patch.object(get_http_session(AIProvider.COHERE.value), "post", return_value=mock_response) as mock_post:
+            first = analyze_resume_with_ai("Resume", AIProvider.COHERE.value, "cohere-key-123", "system")
+            second = analyze_resume_with_ai("Resume", AIProvider.COHERE.value, "cohere-key-123", "system")
+            different = analyze_resume_with_ai("Resume", AIProvider.COHERE.value, "cohere-key-123", "system", max_tokens=500)
+        
+        self.assertFalse(first["cached"])
+        self.assertTrue(second["cached"])
+        self.assertEqual(second["analysis"], "Solid resume")
+        self.assertFalse(different["cached"])
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertEqual(get_response_cache().stats()["hits"], 1)
+    
+    @patch('app.utils.ai_services.get_openai_client')
+    def test_fallback_answers_not_cached(self, mock_get_client):
+        """Test that answers from the gpt-3.5-turbo fallback are not cached for the requested model."""
+        fallback_response = MagicMock()
+        fallback_response.choices[0].message.content = "Fallback answer"
+        fallback_response.model = "gpt-3.5-turbo"
+        fallback_response.usage.total_tokens = 10
+        
+        def create_completion(model, **kwargs):
+            if model != "gpt-3.5-turbo":
+                raise Exception("model not found")
+            return fallback_response
+        
+        create = mock_get_client.return_value.chat.completions.create
+        create.side_effect = create_completion
+        
+        for _ in range(2):
+            result = analyze_resume_with_ai("Resume", AIProvider.OPENAI.value, "sk-user-key-1234567890", "system", model_id="gpt-4o")
+            self.assertEqual(result["analysis"], "Fallback answer")
+            self.assertFalse(result["cached"])
+        
+        stream = analyze_resume_with_ai_stream("Resume", AIProvider.OPENAI.value, "sk-user-key-1234567890", "system", model_id="gpt-4o")
+        list(stream)
+        self.assertTrue(stream.result["fallback"])
+        self.assertEqual(get_response_cache().stats()["entries"], 0)
+        self.assertEqual(create.call_count, 6)
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
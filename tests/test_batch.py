@@ -0,0 +1,77 @@
+import unittest
+import json
+import os
+import tempfile
+from docx import Document
+from reportlab.pdfgen import canvas
+from app.batch import collect_resume_paths, iter_batch_results, main
+
+class TestBatch(unittest.TestCase):
+    """Test cases for batch resume ingestion."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        root = self.tmp.name
+
+        pdf = canvas.Canvas(os.path.join(root, "alice.pdf"))
+        pdf.drawString(72, 720, "SKILLS")
+        pdf.drawString(72, 700, "Python, Docker, Leadership")
+        pdf.save()
+
+        os.makedirs(os.path.join(root, "nested"))
+        doc = Document()
+        doc.add_paragraph("EXPERIENCE")
+        doc.add_paragraph("Built React apps with JavaScript")
+        doc.save(os.path.join(root, "nested", "bob.docx"))
+
+        with open(os.path.join(root, "broken.pdf"), "wb") as handle:
+            handle.write(b"not really a pdf")
+        with open(os.path.join(root, "notes.txt"), "w") as handle:
+            handle.write("ignored")
+
+    def test_collect_resume_paths(self):
+        """Test that directories are walked and only PDF/DOCX files are kept."""
+        paths = collect_resume_paths([self.tmp.name])
+
+        self.assertEqual([os.path.basename(path) for path in paths], ["alice.pdf", "broken.pdf", "bob.docx"])
+
+    def test_batch_reports_corrupt_files(self):
+        """Test that a corrupt file is reported without stopping the batch."""
+        for workers in (1, 2):
+            records = {os.path.basename(record["path"]): record for record in iter_batch_results([self.tmp.name], workers=workers, chunk_size=1)}
+
+            self.assertEqual(set(records), {"alice.pdf", "broken.pdf", "bob.docx"})
+            self.assertIsNotNone(records["broken.pdf"]["error"])
+            self.assertIsNone(records["alice.pdf"]["error"])
+            self.assertIn("python", records["alice.pdf"]["skills"]["technical_skills"])
+            self.assertIn("experience", records["bob.docx"]["sections"])
+
+    def test_skill_details(self):
+        """Test that skill details place skills in their sections."""
+        records = list(iter_batch_results([os.path.join(self.tmp.name, "alice.pdf")], workers=1, skill_details=True))
+        details = records[0]["skills"]["skill_details"]
+
+        self.assertEqual(details["python"]["count"], 1)
+        self.assertEqual(details["docker"]["sections"], ["skills"])
+
+    def test_cli_writes_jsonl(self):
+        """Test that the CLI writes one JSON record per file."""
+        output = os.path.join(self.tmp.name, "results.jsonl")
+        exit_code = main([self.tmp.name, "--workers", "2", "--output", output, "--include-text"])
+
+        with open(output, encoding="utf-8") as handle:
+            records = [json.loads(line) for line in handle]
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(len(records), 3)
+        self.assertTrue(any("Python" in record.get("text", "") for record in records))
+
+    def test_cli_exit_code(self):
+        """Test that the CLI exits with 1 only when a file failed."""
+        output = os.path.join(self.tmp.name, "results.jsonl")
+
+        self.assertEqual(main([os.path.join(self.tmp.name, "alice.pdf"), "--workers", "1", "--output", output]), 0)
+        self.assertEqual(main([os.path.join(self.tmp.name, "broken.pdf"), "--workers", "1", "--output", output]), 1)
+
+if __name__ == "__main__":
+    unittest.main()
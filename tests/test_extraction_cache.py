@@ -0,0 +1,98 @@
+import unittest
+import os
+import sqlite3
+import tempfile
+from app.utils.extraction_cache import DISK_TOUCH_INTERVAL, ExtractionCache, content_hash
+from app.utils.parse_resume import extract_resume_cached
+from tests.helpers import make_docx
+
+class TestExtractionCache(unittest.TestCase):
+    """Test cases for the content-hash extraction cache."""
+
+    def setUp(self):
+        self.result = {"text": "Python developer", "sections": {"header": "Python developer"}}
+
+    def test_memory_lru_eviction(self):
+        """Test that the in-process tier evicts the least recently used entry."""
+        cache = ExtractionCache(max_entries=2)
+        cache.put("a", "pdf", "1", self.result)
+        cache.put("b", "pdf", "1", self.result)
+        cache.get("a", "pdf", "1")
+        cache.put("c", "pdf", "1", self.result)
+
+        self.assertIsNotNone(cache.get("a", "pdf", "1"))
+        self.assertIsNone(cache.get("b", "pdf", "1"))
+        self.assertIsNotNone(cache.get("c", "pdf", "1"))
+
+    def test_parser_version_invalidates(self):
+        """Test that a different parser version is a miss and drops the entry."""
+        cache = ExtractionCache()
+        cache.put("a", "pdf", "1", self.result)
+
+        self.assertIsNone(cache.get("a", "pdf", "2"))
+        self.assertIsNone(cache.get("a", "pdf", "1"))
+
+    def test_disk_tier_persists_and_evicts(self):
+        """Test that the SQLite tier survives a new instance and respects its size budget."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cache.sqlite3")
+            cache = ExtractionCache(disk_path=path)
+            cache.put("a", "docx", "1", self.result)
+            cache.close()
+
+            reopened = ExtractionCache(disk_path=path, max_disk_bytes=100)
+            self.assertEqual(reopened.get("a", "docx", "1"), self.result)
+
+            reopened.put("b", "docx", "1", self.result)
+            reopened.put("c", "docx", "1", self.result)
+            reopened.close()
+
+            evicted = ExtractionCache(disk_path=path, max_disk_bytes=100)
+            self.assertIsNone(evicted.get("a", "docx", "1"))
+            self.assertIsNotNone(evicted.get("c", "docx", "1"))
+            evicted.close()
+
+    def test_disk_hits_touch_stale_access_times_only(self):
+        """Test that a disk hit rewrites the access time only once it is older than the touch interval."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cache.sqlite3")
+            cache = ExtractionCache(max_entries=0, disk_path=path)  # every hit goes to disk
+            cache.put("a", "docx", "1", self.result)
+            db = sqlite3.connect(path)
+
+            def last_access():
+                return db.execute("SELECT last_access FROM extractions WHERE digest = 'a'").fetchone()[0]
+
+            stored = last_access()
+            self.assertEqual(cache.get("a", "docx", "1"), self.result)
+            self.assertEqual(last_access(), stored)
+
+            stale = stored - DISK_TOUCH_INTERVAL - 1
+            db.execute("UPDATE extractions SET last_access = ?", (stale,))
+            db.commit()
+            self.assertEqual(cache.get("a", "docx", "1"), self.result)
+            self.assertGreater(last_access(), stale)
+            db.close()
+            cache.close()
+
+    def test_extract_resume_cached(self):
+        """Test that identical uploads are parsed once and served from the cache."""
+        cache = ExtractionCache()
+        upload = make_docx("John Doe", "SKILLS", "Python, SQL")
+
+        text, sections = extract_resume_cached(upload, "resume.docx", cache=cache)
+        self.assertIn("Python, SQL", text)
+        self.assertEqual(sections["skills"], "Python, SQL")
+        self.assertEqual(cache.misses, 1)
+
+        # Sections are a read-only view, so callers cannot corrupt the cached entry
+        with self.assertRaises(TypeError):
+            sections["skills"] = "changed"
+        again_text, again_sections = extract_resume_cached(upload, "resume.docx", cache=cache)
+        self.assertEqual(again_text, text)
+        self.assertEqual(again_sections, sections)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(len(content_hash(upload.getvalue())), 64)
+
+if __name__ == "__main__":
+    unittest.main()
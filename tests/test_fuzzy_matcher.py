@@ -0,0 +1,105 @@
+import unittest
+import io
+import os
+from contextlib import redirect_stdout
+from unittest.mock import patch
+from app.nlp.fuzzy_matcher import FuzzySkillMatcher, edit_distance
+from app.nlp.skill_extractor import (
+    BUSINESS_SKILLS, COMMON_TECH_SKILLS, FUZZY_SKILLS_ENV_VAR, SkillExtractor, default_fuzzy_confidence
+)
+from app.nlp.skill_taxonomy import SkillIndex, TECHNICAL
+
+class TestFuzzySkillMatcher(unittest.TestCase):
+    """Test cases for fuzzy skill matching."""
+
+    def setUp(self):
+        self.matcher = FuzzySkillMatcher(sorted(COMMON_TECH_SKILLS | BUSINESS_SKILLS))
+
+    def test_edit_distance(self):
+        """Test the bounded optimal string alignment distance."""
+        self.assertEqual(edit_distance("kitten", "sitting", 5), 3)
+        self.assertEqual(edit_distance("javscript", "javascript", 2), 1)
+        self.assertEqual(edit_distance("pyhton", "python", 2), 1)
+        self.assertEqual(edit_distance("kubernetes", "kubernetes", 0), 0)
+        self.assertEqual(edit_distance("python", "go", 2), 3)
+
+    def test_typos_splits_and_merges(self):
+        """Test that garbled skills are found with their offsets and confidence."""
+        text = "ran kuber netes, javscript and machne learning on datascience teams"
+        matches = {keyword: (text[start:end], round(confidence, 3))
+                   for start, end, keyword, confidence in self.matcher.iter_matches(text)}
+
+        self.assertEqual(matches, {
+            "kubernetes": ("kuber netes", 0.9),
+            "javascript": ("javscript", 0.9),
+            "machine learning": ("machne learning", 0.938),
+            "data science": ("datascience", 0.917),
+        })
+
+    def test_exact_and_risky_words_not_reported(self):
+        """Test that exact skills, short typos and punctuated skills are left alone."""
+        text = "kubernetes and machine learning; pythn, scale, reach, nodejs c+"
+        self.assertEqual(list(self.matcher.iter_matches(text)), [])
+
+    def test_corrections_are_memoized(self):
+        """Test that each distinct word is corrected once, across texts too."""
+        self.matcher.correct.cache_clear()
+        list(self.matcher.iter_matches("javscript javscript javscript"))
+        list(self.matcher.iter_matches("javscript"))
+        info = self.matcher.correct.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 1))
+
+    def test_short_fragments_are_not_joined(self):
+        """Test that split words are only joined back from fragments of three characters or whole keyword words."""
+        matcher = FuzzySkillMatcher(["ai", "rest", "kubernetes", "gitlab ci"])
+        self.assertEqual(list(matcher.iter_matches("a i and re st")), [])
+        for text, keyword in [("kuber netes", "kubernetes"), ("git lab ci", "gitlab ci")]:
+            self.assertEqual([match[2] for match in matcher.iter_matches(text)], [keyword])
+
+class TestFuzzySkillExtraction(unittest.TestCase):
+    """Test cases for the extractor's fuzzy stage."""
+
+    def test_extract_reports_confidence(self):
+        """Test that fuzzy hits join the skill lists and carry a confidence."""
+        extractor = SkillExtractor(use_nlp=False, fuzzy_confidence=0.8)
+        result = extractor.extract("Postgre SQL, Kubernetes and Leadershp")
+
+        self.assertIn("postgresql", result["technical_skills"])
+        self.assertIn("leadership", result["soft_skills"])
+        self.assertEqual(result["fuzzy_matches"], {"leadership": 0.9, "postgresql": 0.9})
+
+        strict = SkillExtractor(use_nlp=False, fuzzy_confidence=0.95).extract("Postgre SQL")
+        self.assertEqual(strict["fuzzy_matches"], {})
+        self.assertNotIn("fuzzy_matches", SkillExtractor(use_nlp=False).extract("Postgre SQL"))
+
+    def test_taxonomy_names(self):
+        """Test fuzzy matching against a taxonomy's canonical names."""
+        index = SkillIndex.from_entries([("kubernetes", TECHNICAL, ["k8s"]), ("terraform", TECHNICAL, [])])
+        extractor = SkillExtractor(taxonomy=index, use_nlp=False, fuzzy_confidence=0.8)
+
+        result = extractor.extract("K8s and Terra form")
+        self.assertEqual(result["technical_skills"], ["kubernetes", "terraform"])
+        self.assertEqual(result["fuzzy_matches"], {"terraform": 0.889})
+
+    def test_large_taxonomy_skips_fuzzy_index(self):
+        """Test that fuzzy matching is not built for taxonomies over the size limit."""
+        index = SkillIndex.from_entries([("kubernetes", TECHNICAL, []), ("terraform", TECHNICAL, [])])
+        with patch("app.nlp.skill_extractor.FUZZY_MAX_SKILLS", 1), redirect_stdout(io.StringIO()) as output:
+            extractor = SkillExtractor(taxonomy=index, use_nlp=False, fuzzy_confidence=0.8)
+
+        self.assertIsNone(extractor.fuzzy_matcher)
+        self.assertIn("Fuzzy skill matching is disabled", output.getvalue())
+        self.assertEqual(extractor.extract("Terra form and kubernetes")["technical_skills"], ["kubernetes"])
+
+    def test_confidence_from_environment(self):
+        """Test that RESUME_FUZZY_SKILLS is parsed without failing on bad values."""
+        with patch.dict(os.environ, {FUZZY_SKILLS_ENV_VAR: "0.85"}):
+            self.assertEqual(default_fuzzy_confidence(), 0.85)
+        for value in ("yes", "1.5", "nan"):
+            with self.subTest(value=value), patch.dict(os.environ, {FUZZY_SKILLS_ENV_VAR: value}), \
+                    redirect_stdout(io.StringIO()) as output:
+                self.assertEqual(default_fuzzy_confidence(), 0.0)
+                self.assertIn("Warning", output.getvalue())
+
+if __name__ == "__main__":
+    unittest.main()
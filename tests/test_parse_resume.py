@@ -1,6 +1,31 @@
 import unittest
 import io
-from app.utils.parse_resume import extract_resume_text, extract_resume_sections
+from contextlib import redirect_stdout
+from unittest.mock import patch
+from docx import Document
+from app.utils.parse_resume import (
+    SECTION_HEADER_SYNONYMS, SectionHeaderMatcher, extract_resume_text, extract_resume_sections,
+    extract_text_from_docx, extract_text_from_docx_with_python_docx, extract_text_from_pdf,
+    iter_docx_lines, iter_pdf_pages
+)
+from tests.helpers import make_pdf
+
+def make_tabular_docx():
+    """Build an in-memory DOCX with a table between paragraphs and merged cells."""
+    doc = Document()
+    doc.add_paragraph("Jane Doe")
+    doc.add_paragraph("Tab").add_run("\tafter")
+    table = doc.add_table(rows=4, cols=3)
+    for row, values in enumerate([("Company", "Role", "Years"), ("Acme", "Engineer", "5"), ("2019-2024", "Lead", "2")]):
+        for column, value in enumerate(values):
+            table.cell(row, column).text = value
+    table.cell(1, 0).merge(table.cell(2, 0))  # vertical merge
+    table.cell(3, 0).merge(table.cell(3, 2)).text = "Python, Django"  # horizontal merge
+    doc.add_paragraph("SKILLS")
+    doc.add_paragraph("Python")
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return io.BytesIO(buffer.getvalue())
 
 class TestParseResume(unittest.TestCase):
     """Test cases for resume parsing functionality."""
@@ -42,6 +67,29 @@ class TestParseResume(unittest.TestCase):
         self.assertIn("Bachelor of Science", sections["education"])
         self.assertIn("Software Developer", sections["experience"])
         self.assertIn("Python", sections["skills"])
+
+    def test_extract_sections_header_variants(self):
+        """Headers match case-insensitively with trailing colons, but only as whole lines."""
+        text = "Jane\nTechnical Skills:\nPython\nSKILLS : :\nSQL\nSkills include Go\nWork History\nAcme"
+        
+        sections = extract_resume_sections(text)
+        
+        self.assertEqual(sections, {
+            "header": "Jane",
+            "technical skills": "Python",
+            "skills": "SQL\nSkills include Go\nWork History\nAcme",
+        })
+    
+    def test_extract_sections_with_synonyms(self):
+        """Configured synonyms are reported under their canonical section name."""
+        matcher = SectionHeaderMatcher(synonyms=SECTION_HEADER_SYNONYMS)
+        text = "Jane\nWork History:\nAcme Corp\nCore Competencies\nPython, SQL"
+        
+        sections = extract_resume_sections(text, header_matcher=matcher)
+        
+        self.assertEqual(sections, {"header": "Jane", "experience": "Acme Corp", "skills": "Python, SQL"})
+        self.assertIn("work history", matcher)
+        self.assertIsNone(matcher.match("Work History and more"))
     
     def test_pdf_extraction_mock(self):
         """Mock test for PDF extraction."""
@@ -61,5 +109,53 @@ class TestParseResume(unittest.TestCase):
         # This is just a placeholder for a real test
         self.assertTrue(callable(extract_resume_text))
 
+    def test_pdf_pages_streamed(self):
+        """Test that PDF text is yielded page by page and joined like the original loop."""
+        pdf = make_pdf(["Page one text", "Page two text", "Page three text"])
+        
+        pages = list(iter_pdf_pages(pdf))
+        self.assertEqual([page.strip() for page in pages], ["Page one text", "Page two text", "Page three text"])
+        
+        # Same result as the original `text += page_text + "\n"` accumulation
+        expected = "".join(page + "\n" for page in pages).strip()
+        self.assertEqual(extract_text_from_pdf(pdf), expected)
+        self.assertEqual(extract_resume_text(pdf, "resume.pdf"), expected)
+    
+    def test_pdf_bounded_extraction(self):
+        """Test that page and character limits stop extraction early."""
+        pdf = make_pdf([f"Portfolio page {number}" for number in range(1, 21)])
+        
+        pages = list(iter_pdf_pages(pdf, max_pages=2))
+        self.assertEqual([page.strip() for page in pages], ["Portfolio page 1", "Portfolio page 2"])
+        self.assertEqual(len("".join(iter_pdf_pages(pdf, max_chars=20))), 20)
+        self.assertEqual(extract_resume_text(pdf, "resume.pdf", max_pages=1), "Portfolio page 1")
+
+    def test_docx_streamed_in_document_order(self):
+        """Test that DOCX paragraphs and table rows stream in order with merged cells once."""
+        docx_file = make_tabular_docx()
+        
+        self.assertEqual(list(iter_docx_lines(docx_file)), [
+            "Jane Doe",
+            "Tab\tafter",
+            "Company | Role | Years",
+            "Acme\n2019-2024 | Engineer | 5",
+            "Lead | 2",
+            "Python, Django",
+            "SKILLS",
+            "Python",
+        ])
+        self.assertEqual(extract_resume_text(docx_file, "resume.docx"), "\n".join(iter_docx_lines(docx_file)))
+    
+    def test_docx_falls_back_to_python_docx(self):
+        """Test that a streaming failure falls back to the python-docx extractor."""
+        docx_file = make_tabular_docx()
+        
+        with patch("app.utils.parse_resume.iter_docx_lines", side_effect=KeyError("word/document.xml")):
+            with redirect_stdout(io.StringIO()) as output:
+                text = extract_text_from_docx(docx_file)
+        
+        self.assertEqual(text, extract_text_from_docx_with_python_docx(docx_file))
+        self.assertIn("Warning:", output.getvalue())
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
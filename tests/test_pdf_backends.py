@@ -0,0 +1,164 @@
+import unittest
+import io
+import os
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import redirect_stdout
+from unittest.mock import patch
+from app.utils.parse_resume import extract_text_from_pdf, get_parser_version
+from app.utils.pdf_backends import (
+    PDF_BACKEND_ENV_VAR, PDF_BACKENDS, PROCESS_CONTEXT, PooledPdf, extract_pdf_pages_parallel, inspect_pdf,
+    iter_pdf_backend_pages, parallel_extraction_supported, pdf_backend_available, pdf_page_count,
+    resolve_pdf_backends, shutdown_pdf_pool, _get_process_pool
+)
+from tests.helpers import make_pdf
+
+def broken_backend(file, start, stop):
+    raise RuntimeError("cannot parse")
+    yield  # makes this a generator like the real backends
+
+def blank_backend(file, start, stop):
+    yield from ["", " "]
+
+class TestPdfBackends(unittest.TestCase):
+    """Test cases for the pluggable PDF text backends."""
+
+    def setUp(self):
+        self.pdf = make_pdf(["Page one text", "Page two text", "Page three text"])
+
+    def test_installed_backends_extract_pages(self):
+        """Test that every installed backend yields the same page texts."""
+        for name in PDF_BACKENDS:
+            if not pdf_backend_available(name):
+                continue
+            with self.subTest(backend=name):
+                pages = [page.strip() for page in iter_pdf_backend_pages(self.pdf, backend=name)]
+                self.assertEqual(pages, ["Page one text", "Page two text", "Page three text"])
+                self.assertEqual(extract_text_from_pdf(self.pdf, max_pages=1, backend=name), "Page one text")
+
+    def test_backends_honour_page_ranges(self):
+        """Test that every installed backend reads exactly pages [start, stop)."""
+        cases = [(0, 0, []), (0, 2, ["Page one text", "Page two text"]), (1, None, ["Page two text", "Page three text"]),
+                 (1, 2, ["Page two text"]), (2, 2, [])]
+        for name, backend in PDF_BACKENDS.items():
+            if not pdf_backend_available(name):
+                continue
+            for start, stop, expected in cases:
+                with self.subTest(backend=name, start=start, stop=stop):
+                    self.pdf.seek(0)
+                    self.assertEqual([page.strip() for page in backend(self.pdf, start, stop)], expected)
+
+    def test_resolve_backends(self):
+        """Test backend selection from arguments and the environment."""
+        self.assertIn("pypdf2", resolve_pdf_backends())
+        self.assertEqual(resolve_pdf_backends("pypdf2")[0], "pypdf2")
+        with patch.dict(os.environ, {PDF_BACKEND_ENV_VAR: "PyPDF2"}):
+            self.assertEqual(resolve_pdf_backends()[0], "pypdf2")
+        with patch("app.utils.pdf_backends.pdf_backend_available", side_effect=lambda name: name == "pypdf2"):
+            self.assertEqual(resolve_pdf_backends("auto"), ["pypdf2"])
+        with self.assertRaises(ValueError):
+            resolve_pdf_backends("ghostscript")
+
+    def test_missing_backend_warned_once(self):
+        """Test that a configured but missing backend is reported only once."""
+        output = io.StringIO()
+        with patch("app.utils.pdf_backends.pdf_backend_available", side_effect=lambda name: name != "pdfminer"), \
+                patch("app.utils.pdf_backends._reported_warnings", set()), redirect_stdout(output):
+            for _ in range(3):
+                self.assertNotIn("pdfminer", resolve_pdf_backends("pdfminer"))
+                get_parser_version("resume.pdf", backend="pdfminer")
+        self.assertEqual(output.getvalue().count("Warning: PDF backend 'pdfminer' is not installed"), 1)
+
+    def test_fallback_on_error_and_empty_text(self):
+        """Test that failing or blank backends fall back to the next one."""
+        with patch.dict(PDF_BACKENDS, {"broken": broken_backend, "blank": blank_backend}):
+            for name in ("broken", "blank"):
+                with self.subTest(backend=name), redirect_stdout(io.StringIO()):
+                    text = extract_text_from_pdf(self.pdf, backend=name)
+                    self.assertIn("Page three text", text)
+
+            with patch("app.utils.pdf_backends.resolve_pdf_backends", return_value=["blank"]):
+                self.assertEqual(list(iter_pdf_backend_pages(self.pdf)), ["", ""])
+            with patch("app.utils.pdf_backends.resolve_pdf_backends", return_value=["broken"]):
+                with redirect_stdout(io.StringIO()), self.assertRaises(RuntimeError):
+                    list(iter_pdf_backend_pages(self.pdf))
+
+    def test_parser_version_names_backends(self):
+        """Test that cached PDF results are keyed by the backends in use."""
+        version = get_parser_version("resume.pdf", backend="pypdf2")
+        self.assertIn("pypdf2-", version)
+        self.assertNotEqual(version, get_parser_version("resume.pdf", max_pages=2, backend="pypdf2"))
+
+class TestParallelPdfExtraction(unittest.TestCase):
+    """Test cases for per-page parallel PDF extraction."""
+
+    @classmethod
+    def tearDownClass(cls):
+        shutdown_pdf_pool()
+
+    def setUp(self):
+        self.page_texts = [f"Publication number {number}" for number in range(1, 8)]
+        self.pdf = make_pdf(self.page_texts)
+
+    def test_pages_reassembled_in_order(self):
+        """Test that page ranges from several workers come back in page order."""
+        self.assertEqual(pdf_page_count(self.pdf), 7)
+        pages = extract_pdf_pages_parallel(self.pdf, 7, backend="pypdf2", workers=3)
+        self.assertEqual([page.strip() for page in pages], self.page_texts)
+
+    def test_one_backend_per_document(self):
+        """Test that a document's backend is the first one that can open it."""
+        backends = resolve_pdf_backends()
+        self.assertEqual(inspect_pdf(self.pdf), (backends[0], 7))
+        with patch.dict("app.utils.pdf_backends._PAGE_COUNTERS", {backends[0]: broken_backend}):
+            if len(backends) > 1:
+                self.assertEqual(inspect_pdf(self.pdf), (backends[1], 7))
+
+    def test_max_chars_stops_ranges(self):
+        """Test that ranges stop at max_chars and later ranges are not waited for."""
+        pages = extract_pdf_pages_parallel(self.pdf, 7, workers=3, max_chars=10)
+        self.assertEqual([page.strip() for page in pages], self.page_texts[:1])
+
+    def test_crashed_worker_replaces_pool(self):
+        """Test that a crashed worker breaks only its pool, and a new pool serves the next document."""
+        self.assertNotEqual(PROCESS_CONTEXT.get_start_method(), "fork")
+        pool = _get_process_pool()
+        with self.assertRaises(BrokenProcessPool):
+            PooledPdf._result(pool, pool.submit(os._exit, 1))
+        self.assertIsNot(_get_process_pool(), pool)
+        pages = extract_pdf_pages_parallel(self.pdf, 7, workers=2)
+        self.assertEqual([page.strip() for page in pages], self.page_texts)
+
+    def test_threshold_selects_mode(self):
+        """Test that only documents at or above the page threshold use the pool."""
+        serial = extract_text_from_pdf(self.pdf, parallel=False)
+        with patch("app.utils.parse_resume.extract_pdf_pages_parallel", wraps=extract_pdf_pages_parallel) as parallel, \
+                patch("app.utils.parse_resume.pdf_worker_count", return_value=2):
+            with patch("app.utils.parse_resume.PDF_PARALLEL_PAGES", 8):
+                self.assertEqual(extract_text_from_pdf(self.pdf), serial)
+                parallel.assert_not_called()
+            with patch("app.utils.parse_resume.PDF_PARALLEL_PAGES", 5):
+                self.assertEqual(extract_text_from_pdf(self.pdf), serial)
+                # max_pages brings the document under the threshold again
+                self.assertEqual(extract_text_from_pdf(self.pdf, max_pages=4),
+                                 extract_text_from_pdf(self.pdf, max_pages=4, parallel=False))
+                self.assertEqual(parallel.call_count, 1)
+            self.assertEqual(extract_text_from_pdf(self.pdf, max_chars=30, parallel=True),
+                             extract_text_from_pdf(self.pdf, max_chars=30, parallel=False))
+
+    def test_single_worker_parses_once(self):
+        """Test that pages are not counted when the pool could not be used."""
+        with patch("app.utils.parse_resume.pdf_page_count", wraps=pdf_page_count) as page_count:
+            with patch("app.utils.parse_resume.pdf_worker_count", return_value=1):
+                self.assertIn("Publication number 7", extract_text_from_pdf(self.pdf))
+            extract_text_from_pdf(self.pdf, parallel=False)
+            page_count.assert_not_called()
+
+    def test_no_pool_inside_daemonic_workers(self):
+        """Test that batch pool workers, which cannot fork, stay serial."""
+        self.assertTrue(parallel_extraction_supported())
+        with patch("app.utils.pdf_backends.multiprocessing.current_process") as current_process:
+            current_process.return_value.daemon = True
+            self.assertFalse(parallel_extraction_supported())
+
+if __name__ == "__main__":
+    unittest.main()
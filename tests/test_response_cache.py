@@ -0,0 +1,63 @@
+import unittest
+import os
+import tempfile
+from unittest.mock import patch
+from app.utils.response_cache import ResponseCache, response_cache_key
+
+class TestResponseCache(unittest.TestCase):
+    """Test cases for the AI response cache."""
+
+    def setUp(self):
+        self.result = {"analysis": "Strong resume", "provider": "OpenAI", "model": "gpt-4o", "tokens_used": 120}
+
+    def test_cache_key_covers_request_fields(self):
+        """Test that any change to the request produces a different key."""
+        key = response_cache_key("OpenAI", "gpt-4o", "system", "prompt", 1000)
+
+        self.assertEqual(key, response_cache_key("OpenAI", "gpt-4o", "system", "prompt", 1000))
+        self.assertNotEqual(key, response_cache_key("OpenAI", "gpt-4", "system", "prompt", 1000))
+        self.assertNotEqual(key, response_cache_key("OpenAI", "gpt-4o", "system", "prompt", 500))
+
+    @patch("app.utils.response_cache.time.time")
+    def test_ttl_expiry_and_counters(self, mock_time):
+        """Test that entries expire after the TTL and lookups are counted."""
+        mock_time.return_value = 1000.0
+        cache = ResponseCache(ttl=60)
+        cache.put("key", self.result)
+
+        mock_time.return_value = 1030.0
+        self.assertEqual(cache.get("key"), self.result)
+
+        mock_time.return_value = 1061.0
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(cache.stats(), {"hits": 1, "misses": 1, "entries": 0})
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = ResponseCache(max_entries=2)
+        cache.put("a", self.result)
+        cache.put("b", self.result)
+        cache.get("a")
+        cache.put("c", self.result)
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+
+    def test_disk_tier_persists(self):
+        """Test that the SQLite tier serves entries to a new cache instance."""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "responses.sqlite3")
+            cache = ResponseCache(disk_path=path)
+            cache.put("key", self.result)
+            cache.close()
+
+            reopened = ResponseCache(disk_path=path)
+            self.assertEqual(reopened.get("key"), self.result)
+            reopened.close()
+
+            disabled = ResponseCache(ttl=0, disk_path=path)
+            self.assertIsNone(disabled.get("key"))
+            disabled.close()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+from app.utils.resume_sections import (
+    ResumeSections, SectionSpan, extract_resume_sections, index_resume_sections, section_preview
+)
+
+RESUME = "Jane Doe\n  jane@example.com \n\nSKILLS:\nPython\n\n  SQL  \nEXPERIENCE\nAcme\nSkills\nGo\nEDUCATION\n"
+
+class TestResumeSections(unittest.TestCase):
+    """Test cases for the span-based section index."""
+
+    def test_spans_point_into_text(self):
+        """Test that each span covers the raw lines of its section."""
+        sections = index_resume_sections(RESUME)
+
+        self.assertEqual([span.name for span in sections.spans], ["header", "skills", "experience", "skills"])
+        first_skills = sections.spans[1]
+        self.assertEqual(RESUME[first_skills.start:first_skills.end], "Python\n\n  SQL  ")
+        self.assertIsInstance(first_skills, SectionSpan)
+
+    def test_mapping_matches_dict(self):
+        """Test that the index behaves like the dictionary callers used to get."""
+        sections = index_resume_sections(RESUME)
+        expected = {"header": "Jane Doe\njane@example.com", "skills": "Go", "experience": "Acme"}
+
+        self.assertIsInstance(sections, ResumeSections)
+        self.assertEqual(sections, expected)
+        self.assertEqual(list(sections.items()), list(expected.items()))
+        self.assertEqual(extract_resume_sections(RESUME), expected)
+        self.assertEqual(sections.to_dict(), expected)
+        self.assertNotIn("education", sections)
+        self.assertIsNone(sections.get("projects"))
+
+    def test_lazy_views(self):
+        """Test that views materialize content only on request."""
+        view = index_resume_sections(RESUME).view("header")
+
+        self.assertEqual(view.head(4), "Jane")
+        self.assertEqual(view.head(9), "Jane Doe\n")
+        self.assertEqual(view.head(1000), "Jane Doe\njane@example.com")
+        self.assertEqual(str(view), "Jane Doe\njane@example.com")
+
+    def test_section_preview(self):
+        """Test that previews truncate identically for views and plain dictionaries."""
+        sections = index_resume_sections(RESUME)
+        for limit in (0, 4, 8, 23, 24, 200):
+            with self.subTest(limit=limit):
+                self.assertEqual(section_preview(sections, "header", limit),
+                                 section_preview(sections.to_dict(), "header", limit))
+        self.assertEqual(section_preview(sections, "header", 4), "Jane...")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+import io
+import os
+import tempfile
+from app.utils.extraction_cache import ExtractionCache
+from app.utils.parse_resume import extract_resume_cached, extract_resume_text
+from app.utils.resume_source import BufferReader, open_resume_source, resume_buffer
+from tests.helpers import docx_bytes
+
+class TestResumeSource(unittest.TestCase):
+    """Test cases for zero-copy resume inputs."""
+
+    def setUp(self):
+        self.data = docx_bytes("Jane Doe", "SKILLS", "Python")
+
+    def test_buffer_reader(self):
+        """Test that the reader behaves like a seekable binary file."""
+        reader = BufferReader(b"0123456789")
+        self.assertEqual(reader.read(3), b"012")
+        self.assertEqual(reader.seek(-2, io.SEEK_END), 8)
+        self.assertEqual(reader.read(), b"89")
+        self.assertEqual(reader.read(5), b"")
+        reader.seek(1)
+        chunk = bytearray(4)
+        self.assertEqual(reader.readinto(chunk), 4)
+        self.assertEqual(bytes(chunk), b"1234")
+        with self.assertRaises(ValueError):
+            reader.seek(-1)
+
+    def test_path_is_memory_mapped(self):
+        """Test that paths are read through a mapping that is closed afterwards."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "resume.docx")
+            with open(path, "wb") as handle:
+                handle.write(self.data)
+
+            with resume_buffer(path) as view:
+                self.assertEqual(view.nbytes, len(self.data))
+                self.assertEqual(view[:4].tobytes(), self.data[:4])
+
+            self.assertEqual(extract_resume_text(path), "Jane Doe\nSKILLS\nPython")
+            text, sections = extract_resume_cached(path, cache=ExtractionCache())
+            self.assertEqual(sections["skills"], "Python")
+
+    def test_memoryview_and_bytes(self):
+        """Test that bytes-like sources need a file name and are read in place."""
+        for source in (self.data, memoryview(self.data), bytearray(self.data)):
+            self.assertEqual(extract_resume_text(source, "resume.docx"), "Jane Doe\nSKILLS\nPython")
+        with self.assertRaises(ValueError):
+            extract_resume_text(self.data)
+
+    def test_upload_is_not_consumed(self):
+        """Test that an upload keeps its position and no buffer export is leaked."""
+        upload = io.BytesIO(self.data)
+        upload.seek(5)
+        self.assertEqual(extract_resume_text(upload, "resume.docx"), "Jane Doe\nSKILLS\nPython")
+        self.assertEqual(upload.tell(), 5)
+
+        with open_resume_source(upload) as stream:
+            self.assertEqual(stream.read(2), self.data[:2])
+        # Resizing raises BufferError while a view of the buffer is still exported
+        upload.write(b"x" * len(self.data))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,18 @@
 import unittest
-from app.nlp.skill_extractor import extract_skills
+import io
+import re
+import os
+import subprocess
+import sys
+from contextlib import redirect_stdout
+from types import SimpleNamespace
+from unittest.mock import patch
+from app.nlp import skill_extractor
+from app.nlp.skill_extractor import SkillExtractor, SpacySkillPipeline, extract_skills, lower_text
+from app.utils.resume_sections import index_resume_sections
+
+# Cold import of the skill extractor must stay under this many seconds
+IMPORT_TIME_BUDGET = 0.5
 
 class TestSkillExtractor(unittest.TestCase):
     """Test cases for skill extraction functionality."""
@@ -81,5 +94,279 @@ class TestSkillExtractor(unittest.TestCase):
         self.assertIn("teamwork", soft_skills)
         self.assertIn("problem solving", soft_skills)
 
+    def test_cold_import_is_fast_and_lazy(self):
+        """Test that importing the module stays under budget and loads no NLP libraries."""
+        code = (
+            "import sys, time\n"
+            "started = time.perf_counter()\n"
+            "import app.nlp.skill_extractor\n"
+            "elapsed = time.perf_counter() - started\n"
+            "print(elapsed, 'spacy' in sys.modules, 'nltk' in sys.modules)\n"
+        )
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=repo_root, capture_output=True, text=True, check=True
+        ).stdout
+        elapsed, spacy_loaded, nltk_loaded = output.split()
+        
+        self.assertLess(float(elapsed), IMPORT_TIME_BUDGET)
+        self.assertEqual(spacy_loaded, "False")
+        self.assertEqual(nltk_loaded, "False")
+    
+    def test_missing_resources_reported_once(self):
+        """Test that missing NLTK data and spaCy model are reported once and never downloaded."""
+        if not skill_extractor.NLP_LIBRARIES_AVAILABLE:
+            self.skipTest("NLTK and spaCy are not installed")
+        import nltk
+        import spacy.cli
+        import spacy.util
+        
+        output = io.StringIO()
+        with patch.object(skill_extractor, "_reported_warnings", set()), \
+                patch.object(skill_extractor, "_nltk_loaded", False), patch.object(skill_extractor, "_nltk_tools", None), \
+                patch.object(skill_extractor, "_spacy_loaded", False), patch.object(skill_extractor, "_spacy_model", None), \
+                patch("nltk.data.find", side_effect=LookupError("punkt")) as find, \
+                patch("spacy.util.is_package", return_value=False), \
+                patch.object(nltk, "download") as nltk_download, patch.object(spacy.cli, "download") as spacy_download, \
+                redirect_stdout(output):
+            for _ in range(2):
+                self.assertIsNone(skill_extractor._get_nltk_tools())
+                self.assertIsNone(skill_extractor.load_nlp_model())
+            self.assertIn("python", SkillExtractor().extract("Python developer")["technical_skills"])
+        
+        find.assert_called()
+        nltk_download.assert_not_called()
+        spacy_download.assert_not_called()
+        self.assertEqual(output.getvalue().count("Warning: NLTK data (punkt/stopwords) not installed"), 1)
+        self.assertEqual(output.getvalue().count(f"Warning: spaCy model '{skill_extractor.SPACY_MODEL_NAME}' is not installed"), 1)
+    
+    def test_nlp_path_matches_token_runs(self):
+        """Test that the NLP path finds multi-word skills across filtered tokens."""
+        tools = (str.split, {"and", "of"})
+        with patch.object(skill_extractor, "_get_nltk_tools", return_value=tools):
+            tech_skills, soft_skills = skill_extractor.extract_skills_with_nlp(
+                "Machine Learning and Data Science with time management of teams"
+            )
+        
+        self.assertEqual(tech_skills, {"machine learning", "data science", "time management"})
+        self.assertEqual(soft_skills, {"time management", "management"})
+
+class FakeToken:
+    """Just enough of a spaCy token for the pipeline."""
+    
+    def __init__(self, text, idx):
+        self.text = text
+        self.lower_ = text.lower()
+        self.idx = idx
+        self.is_stop = self.lower_ in {"the", "and", "with", "of", "our"}
+    
+    def __len__(self):
+        return len(self.text)
+
+class FakeSpan:
+    """Just enough of a spaCy span for the pipeline."""
+    
+    def __init__(self, doc, start, end, label="", pos="PROPN"):
+        self.start = start
+        self.end = end
+        self.end_char = doc[end - 1].idx + len(doc[end - 1])
+        self.label_ = label
+        self.root = SimpleNamespace(pos_=pos)
+
+class FakeDoc:
+    """Word tokens with the given phrases as entities and noun chunks."""
+    
+    def __init__(self, text, entities, chunks):
+        self.text = text
+        self.tokens = [FakeToken(match.group(), match.start()) for match in re.finditer(r"\w+|[^\w\s]", text)]
+        self.ents = [self._span(phrase, label=label) for phrase, label in entities if phrase in text]
+        self.noun_chunks = [self._span(phrase) for phrase in chunks if phrase in text]
+    
+    def _span(self, phrase, label=""):
+        start = text_index = self.text.index(phrase)
+        first = next(i for i, token in enumerate(self.tokens) if token.idx == start)
+        last = next(i for i, token in enumerate(self.tokens) if token.idx + len(token) == text_index + len(phrase))
+        return FakeSpan(self, first, last + 1, label)
+    
+    def __getitem__(self, index):
+        return self.tokens[index]
+    
+    def has_annotation(self, attribute):
+        return attribute == "DEP"
+    
+    def __iter__(self):
+        return iter(self.tokens)
+
+class FakeLanguage:
+    """Stand-in for a loaded spaCy pipeline that records how it is called."""
+    
+    pipe_names = ["tok2vec", "tagger", "parser", "attribute_ruler", "ner", "textcat"]
+    
+    def __init__(self, entities=(), chunks=()):
+        self.entities = entities
+        self.chunks = chunks
+        self.calls = []
+    
+    def pipe(self, texts, batch_size, n_process, disable):
+        self.calls.append((batch_size, n_process, disable))
+        for text in texts:
+            yield FakeDoc(text, self.entities, self.chunks)
+
+class TestSpacySkillPipeline(unittest.TestCase):
+    """Test cases for batched spaCy skill extraction."""
+    
+    def test_candidates_feed_the_matcher(self):
+        """Test that tokens, entities and chunks all reach the skill matcher."""
+        nlp = FakeLanguage(entities=[("Airbyte Cloud", "ORG"), ("Docker", "PRODUCT"), ("London", "GPE")],
+                           chunks=["The Kubernetes", "our Snowflake"])
+        pipeline = SpacySkillPipeline(SkillExtractor(use_nlp=False), batch_size=16, n_process=2, nlp=nlp)
+        texts = (text for text in ["Machine of learning with Airbyte Cloud and Docker in London.\n"
+                                   "The Kubernetes cluster and our Snowflake warehouse.", "Python"])
+        results = list(pipeline.extract_many(texts))
+        
+        self.assertEqual(nlp.calls, [(16, 2, ["textcat"])])
+        self.assertEqual(results[0]["technical_skills"], ["docker", "kubernetes", "machine learning"])
+        self.assertEqual(results[0]["skill_candidates"], ["airbyte cloud", "snowflake"])
+        self.assertEqual(results[1]["technical_skills"], ["python"])
+        
+        detailed = next(pipeline.extract_many(["Machine of learning"], detailed=True))
+        self.assertEqual(detailed["skill_details"]["machine learning"]["offsets"], [(0, 19)])
+    
+    def test_disabled_pipes_and_fallback(self):
+        """Test that entity-only runs disable the parser and that no model means plain extraction."""
+        pipeline = SpacySkillPipeline(SkillExtractor(use_nlp=False), noun_chunks=False, nlp=FakeLanguage())
+        self.assertEqual(pipeline.disabled_pipes, ["tagger", "parser", "attribute_ruler", "textcat"])
+        
+        extractor = SkillExtractor(use_nlp=False)
+        with patch.object(skill_extractor, "load_nlp_model", return_value=None):
+            pipeline = SpacySkillPipeline(extractor)
+        text = "Python and Docker"
+        self.assertEqual(list(pipeline.extract_many([text])), [dict(extractor.extract(text), skill_candidates=[])])
+    
+    def test_sections_per_text(self):
+        """Test that detailed runs place each text's skills in that text's sections."""
+        texts = ["SKILLS\nPython\nEXPERIENCE\nDocker", "EXPERIENCE\nPython"]
+        sections = [index_resume_sections(text) for text in texts]
+        for nlp in (FakeLanguage(), None):
+            with self.subTest(model=nlp is not None), patch.object(skill_extractor, "load_nlp_model", return_value=None):
+                pipeline = SpacySkillPipeline(SkillExtractor(use_nlp=False), nlp=nlp)
+                first, second = pipeline.extract_many(iter(texts), detailed=True, sections=iter(sections))
+                self.assertEqual(first["skill_details"]["python"]["sections"], ["skills"])
+                self.assertEqual(first["skill_details"]["docker"]["sections"], ["experience"])
+                self.assertEqual(second["skill_details"]["python"]["sections"], ["experience"])
+    
+    def test_blank_spacy_pipeline(self):
+        """Test the pipeline on a real spaCy pipeline without a trained model."""
+        try:
+            import spacy
+        except ImportError:
+            self.skipTest("spaCy is not installed")
+        nlp = spacy.blank("en")
+        nlp.add_pipe("entity_ruler").add_patterns([
+            {"label": "ORG", "pattern": "Airbyte Cloud"},
+            {"label": "PRODUCT", "pattern": "Docker"},
+            {"label": "GPE", "pattern": "London"}
+        ])
+        pipeline = SpacySkillPipeline(SkillExtractor(use_nlp=False), nlp=nlp)
+        self.assertEqual(pipeline.disabled_pipes, [])
+        
+        result = next(pipeline.extract_many(["Machine of learning with Airbyte Cloud and Docker in London."], detailed=True))
+        self.assertEqual(result["technical_skills"], ["docker", "machine learning"])
+        self.assertEqual(result["skill_candidates"], ["airbyte cloud"])
+        self.assertEqual(result["skill_details"]["docker"]["offsets"], [(43, 49)])
+
+class TestSkillExtractorObject(unittest.TestCase):
+    """Test cases for the reusable SkillExtractor."""
+    
+    def test_shared_instance_matches_wrapper(self):
+        """Test that extract_skills and the shared extractor agree."""
+        text = "Skills: Python, Go; experience with Kubernetes. Strong leadership and time management."
+        self.assertEqual(skill_extractor.SKILL_EXTRACTOR.extract(text), extract_skills(text))
+        self.assertEqual(skill_extractor.SKILL_EXTRACTOR.extract_many([text, ""]),
+                         [extract_skills(text), {"technical_skills": [], "soft_skills": []}])
+    
+    def test_custom_skills(self):
+        """Test an extractor built over its own skill sets."""
+        extractor = SkillExtractor(tech_skills={"rust", "embedded systems"}, soft_skills={"mentoring"}, use_nlp=False)
+        result = extractor.extract("Embedded Systems in Rust and Python; mentoring juniors")
+        
+        self.assertEqual(result, {"technical_skills": ["embedded systems", "rust"], "soft_skills": ["mentoring"]})
+    
+    def test_use_nlp_false_skips_tokenizer(self):
+        """Test that use_nlp=False never loads NLTK."""
+        with patch.object(skill_extractor, "_get_nltk_tools") as get_nltk_tools:
+            SkillExtractor(use_nlp=False).extract("machine the learning")
+            get_nltk_tools.assert_not_called()
+    
+    def test_detailed_counts_offsets_and_sections(self):
+        """Test that detailed mode reports where each skill occurs."""
+        text = ("Summary\nPython developer who likes Python.\n"
+                "Skills\nLanguages: Rust, Go\nLeadership\n")
+        sections = index_resume_sections(text)
+        result = SkillExtractor(use_nlp=False).extract(text, detailed=True, sections=sections)
+        details = result["skill_details"]
+        
+        self.assertEqual(set(details), set(result["technical_skills"]) | set(result["soft_skills"]))
+        self.assertEqual(details["python"]["count"], 2)
+        self.assertEqual(details["python"]["sections"], ["summary", "summary"])
+        for name, detail in details.items():
+            for start, end in detail["offsets"]:
+                self.assertEqual(text[start:end].lower(), name)
+        self.assertEqual(details["rust"]["sections"], ["skills"])
+        self.assertEqual(details["go"]["offsets"], [(text.index("Go"), text.index("Go") + 2)])
+        self.assertEqual(details["leadership"]["sections"], ["skills"])
+        
+        # Spans work as well as the index, and offsets outside every section have none
+        plain = extract_skills("Python\nSkills\nPython", detailed=True, sections=[("skills", 14, 20)])
+        self.assertEqual(plain["skill_details"]["python"]["sections"], [None, "skills"])
+        self.assertNotIn("skill_details", extract_skills(text))
+    
+    def test_detailed_offsets_from_tokens(self):
+        """Test that token matches map back to character offsets."""
+        extractor = SkillExtractor()
+        text = "Machine  of learning and Python"
+        with patch.object(skill_extractor, "_get_nltk_tools", return_value=(str.split, {"and", "of"})):
+            details = extractor.extract(text, detailed=True)["skill_details"]
+        
+        self.assertEqual(details["machine learning"], {"count": 1, "offsets": [(0, 20)], "sections": [None]})
+        self.assertEqual(details["python"]["offsets"], [(25, 31)])
+    
+    def test_token_spans_counted_once(self):
+        """Test that an occurrence found by both the tokens and the text is counted once."""
+        text = "Machine learning, machine of learning and Python"
+        tokenize = lambda value: value.replace(",", " ,").split()
+        with patch.object(skill_extractor, "_get_nltk_tools", return_value=(tokenize, {"and", "of"})):
+            extractor = SkillExtractor()
+            details = extractor.extract(text, detailed=True)["skill_details"]
+            counts = extractor.count_skills(text)
+        
+        self.assertEqual(details["machine learning"]["offsets"], [(0, 16), (18, 37)])
+        self.assertEqual(counts, {name: detail["count"] for name, detail in details.items()})
+        
+        # A token span overlapping a text span of the same skill is the same occurrence
+        occurrences = {"machine learning": {(5, 21)}}
+        SkillExtractor.merge_token_occurrences({"machine learning": {(0, 21), (30, 49)}, "go": {(50, 52)}}, occurrences)
+        self.assertEqual(occurrences, {"machine learning": {(5, 21), (30, 49)}, "go": {(50, 52)}})
+    
+    def test_offsets_index_original_text(self):
+        """Test that characters whose lowercase form is longer do not shift offsets."""
+        text = "İzmir İstanbul\nSkills\nPython and Docker"
+        sections = index_resume_sections(text)
+        details = SkillExtractor(use_nlp=False).extract(text, detailed=True, sections=sections)["skill_details"]
+        
+        for name in ("python", "docker"):
+            start, end = details[name]["offsets"][0]
+            self.assertEqual(text[start:end].lower(), name)
+            self.assertEqual(details[name]["sections"], ["skills"])
+    
+    def test_dotted_capital_i_lowercases_to_i(self):
+        """Test that "İ" lowercases to a plain "i" next to and inside skills."""
+        self.assertEqual(lower_text("aİ İstanbul"), "ai istanbul")
+        extractor = SkillExtractor(use_nlp=False)
+        text = "Built aİ tools. Skills: PYTHON"
+        self.assertIn("ai", extractor.extract(text)["technical_skills"])
+        details = extractor.extract(text, detailed=True)["skill_details"]
+        self.assertEqual([text[start:end] for start, end in details["ai"]["offsets"]], ["aİ"])
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,84 @@
+import unittest
+import re
+from app.nlp.skill_matcher import SkillMatcher, TokenTrie
+from app.nlp.skill_extractor import COMMON_TECH_SKILLS, BUSINESS_SKILLS
+
+class TestSkillMatcher(unittest.TestCase):
+    """Test cases for the Aho-Corasick skill matcher."""
+
+    def test_empty_inputs(self):
+        """Test matching with no keywords or no text."""
+        self.assertEqual(SkillMatcher([]).find("python and java"), set())
+        self.assertEqual(SkillMatcher(["python"]).find(""), set())
+
+    def test_word_boundaries(self):
+        """Test that keywords only match on whole words."""
+        matcher = SkillMatcher(["go", "java", "javascript", "machine learning"])
+
+        self.assertEqual(matcher.find("good knowledge of javascript"), {"javascript"})
+        self.assertEqual(matcher.find("java, go and machine learning"), {"java", "go", "machine learning"})
+        self.assertEqual(matcher.find("machine learningx"), set())
+
+    def test_overlapping_keywords(self):
+        """Test that overlapping keywords are all reported with their offsets."""
+        matcher = SkillMatcher(["project management", "management", "time management"])
+        matches = list(matcher.iter_matches("time management and project management"))
+
+        self.assertIn((0, 15, "time management"), matches)
+        self.assertIn((5, 15, "management"), matches)
+        self.assertIn((20, 38, "project management"), matches)
+        self.assertIn((28, 38, "management"), matches)
+
+    def test_parity_with_regex_search(self):
+        """Test that results match one re.search per skill, including punctuated skills."""
+        skills = sorted(COMMON_TECH_SKILLS | BUSINESS_SKILLS)
+        matcher = SkillMatcher(skills)
+        texts = [
+            "built apis in c++, c# and asp.net; deployed node.js on aws with ci/cd",
+            "objective-c and c developer. r, go, sql server, .net core, next.js",
+            "leadership, project management and problem solving in scrum teams_agile",
+            "c++x c#1 x.net node.jsx ai-driven data science/big data",
+        ]
+
+        for text in texts:
+            expected = {skill for skill in skills if re.search(r'\b' + re.escape(skill) + r'\b', text)}
+            self.assertEqual(matcher.find(text), expected, text)
+
+class TestTokenTrie(unittest.TestCase):
+    """Test cases for the token-level skill trie."""
+
+    def test_parity_with_ngram_lookup(self):
+        """Test that results match looking up every 1- to 3-gram of the tokens."""
+        skills = COMMON_TECH_SKILLS | BUSINESS_SKILLS
+        trie = TokenTrie(sorted(skills))
+        tokens = ("senior python developer machine learning data science big data project management "
+                  "time management sql server google cloud computer vision deep learning c r go").split()
+
+        ngrams = set(tokens)
+        ngrams.update(" ".join(tokens[i:i + 2]) for i in range(len(tokens) - 1))
+        ngrams.update(" ".join(tokens[i:i + 3]) for i in range(len(tokens) - 2))
+        self.assertEqual(trie.find(tokens), ngrams & skills)
+
+    def test_long_and_overlapping_keywords(self):
+        """Test that keywords longer than three tokens and overlapping keywords are found."""
+        trie = TokenTrie(["natural language processing", "amazon web services lambda functions",
+                          "language", "web services"])
+        tokens = "built amazon web services lambda functions for natural language processing".split()
+
+        self.assertEqual(list(trie.iter_matches(tokens)), [
+            (1, 6, "amazon web services lambda functions"),
+            (2, 4, "web services"),
+            (7, 10, "natural language processing"),
+            (8, 9, "language"),
+        ])
+        self.assertEqual(trie.find(["amazon", "web", "services"]), {"web services"})
+        self.assertEqual(len(trie), 4)
+        self.assertEqual(trie.max_tokens, 5)
+
+    def test_empty_inputs(self):
+        """Test matching with no keywords or no tokens."""
+        self.assertEqual(TokenTrie([]).find(["python"]), set())
+        self.assertEqual(TokenTrie(["python", ""]).find([]), set())
+
+if __name__ == "__main__":
+    unittest.main()
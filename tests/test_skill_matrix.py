@@ -0,0 +1,60 @@
+import unittest
+import os
+import tempfile
+from app.nlp.skill_extractor import SkillExtractor
+from app.nlp.skill_matrix import SCIPY_AVAILABLE, SkillMatrix, build_skill_matrix
+from app.nlp.skill_taxonomy import SOFT, TECHNICAL, SkillIndex
+
+class TestSkillMatrix(unittest.TestCase):
+    """Test cases for sparse resume-by-skill matrices."""
+
+    def setUp(self):
+        self.extractor = SkillExtractor(tech_skills={"python", "docker", "machine learning"},
+                                        soft_skills={"leadership"}, use_nlp=False)
+        self.texts = ["Python, Docker and more Python", "", "Leadership in machine learning with python"]
+
+    def test_counts_and_stable_ids(self):
+        """Test that counts land in the column of each skill's id."""
+        matrix = build_skill_matrix(iter(self.texts), self.extractor)
+
+        self.assertEqual(matrix.skills, ["docker", "leadership", "machine learning", "python"])
+        self.assertEqual(matrix.shape, (3, 4))
+        self.assertEqual(matrix.nnz, 5)
+        self.assertEqual(matrix.toarray().tolist(), [[1, 0, 0, 2], [0, 0, 0, 0], [0, 1, 1, 1]])
+        self.assertEqual(self.extractor.count_skills(self.texts[0]), {"python": 2, "docker": 1})
+
+    def test_taxonomy_ids(self):
+        """Test that a taxonomy's skill ids are the columns and aliases count toward them."""
+        index = SkillIndex.from_entries([("kubernetes", TECHNICAL, ["k8s"]), ("mentoring", SOFT, [])])
+        extractor = SkillExtractor(taxonomy=index, use_nlp=False)
+        matrix = build_skill_matrix(["k8s and Kubernetes, mentoring"], extractor)
+
+        self.assertEqual(matrix.skills, ["kubernetes", "mentoring"])
+        self.assertEqual(matrix.toarray().tolist(), [[2, 1]])
+
+    def test_save_and_load(self):
+        """Test the .npz round trip, including an empty matrix."""
+        with tempfile.TemporaryDirectory() as directory:
+            for texts in (self.texts, []):
+                path = os.path.join(directory, "skills.npz")
+                build_skill_matrix(texts, self.extractor).save(path)
+                loaded = SkillMatrix.load(path)
+                expected = build_skill_matrix(texts, self.extractor)
+
+                self.assertEqual(loaded.shape, expected.shape)
+                self.assertEqual(loaded.skills, expected.skills)
+                self.assertEqual(loaded.toarray().tolist(), expected.toarray().tolist())
+
+    @unittest.skipUnless(SCIPY_AVAILABLE, "SciPy is not installed")
+    def test_csr(self):
+        """Test conversion to a SciPy CSR matrix and reading saved files with SciPy."""
+        from scipy.sparse import load_npz
+        matrix = build_skill_matrix(self.texts, self.extractor)
+        self.assertEqual(matrix.tocsr().toarray().tolist(), matrix.toarray().tolist())
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "skills.npz")
+            matrix.save(path)
+            self.assertEqual(load_npz(path).toarray().tolist(), matrix.toarray().tolist())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+import io
+import os
+import tempfile
+from contextlib import redirect_stdout, redirect_stderr
+from unittest.mock import patch
+from app.nlp.skill_extractor import BUSINESS_SKILLS, COMMON_TECH_SKILLS, SkillExtractor
+from app.nlp.skill_matcher import SkillMatcher
+from app.nlp.skill_taxonomy import (
+    SOFT, TAXONOMY_ENV_VAR, TECHNICAL, SkillIndex, compile_taxonomy, default_skill_index, main,
+    taxonomy_from_sets
+)
+
+TAXONOMY_CSV = """skill,category,aliases
+Kubernetes,technical,k8s|Kube
+postgresql,technical,postgres|psql
+amazon web services,technical,aws
+stakeholder management,soft,
+leadership,technical|soft,
+golang,technical,go|postgres
+"""
+
+class TestSkillTaxonomy(unittest.TestCase):
+    """Test cases for compiled skill taxonomies."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.source = os.path.join(self.directory.name, "skills.csv")
+        self.index_path = os.path.join(self.directory.name, "skills.idx")
+        with open(self.source, "w", encoding="utf-8") as file:
+            file.write(TAXONOMY_CSV)
+        compile_taxonomy(self.source, self.index_path)
+        self.index = SkillIndex.open(self.index_path)
+
+    def tearDown(self):
+        self.index.close()
+        self.directory.cleanup()
+
+    def test_aliases_resolve_to_canonical_names(self):
+        """Test lookups of names and aliases in the memory-mapped index."""
+        self.assertEqual(len(self.index), 6)
+        self.assertEqual(self.index.canonical("K8s"), "kubernetes")
+        self.assertEqual(self.index.canonical("postgres"), "postgresql")
+        self.assertEqual(self.index.canonical("  Amazon   Web Services "), "amazon web services")
+        self.assertEqual(self.index.canonical("go"), "golang")
+        # Partial names are only stored to end walks early
+        self.assertIsNone(self.index.canonical("amazon web"))
+        self.assertIsNone(self.index.canonical("java"))
+        self.assertEqual(self.index.skill_flags(self.index.lookup("leadership")), TECHNICAL | SOFT)
+        self.assertEqual(self.index.skill_flags(self.index.lookup("stakeholder management")), SOFT)
+
+    def test_text_and_token_matches(self):
+        """Test matching names and aliases in text and in token sequences."""
+        text = "deployed on k8s and amazon web services with postgres."
+        names = [(text[start:end], self.index.skill_name(skill_id))
+                 for start, end, skill_id in self.index.iter_text_matches(text)]
+        self.assertEqual(names, [("k8s", "kubernetes"), ("amazon web services", "amazon web services"),
+                                 ("postgres", "postgresql")])
+
+        tokens = text.rstrip(".").split()
+        matches = list(self.index.iter_token_matches(tokens))
+        self.assertEqual([(start, end) for start, end, _ in matches], [(2, 3), (4, 7), (8, 9)])
+
+    def test_parity_with_skill_matcher(self):
+        """Test that the built-in skills give the same matches as the Aho-Corasick matcher."""
+        index = SkillIndex.from_entries(taxonomy_from_sets(COMMON_TECH_SKILLS, BUSINESS_SKILLS))
+        matcher = SkillMatcher(sorted(COMMON_TECH_SKILLS | BUSINESS_SKILLS))
+        texts = [
+            "built apis in c++, c# and asp.net; deployed node.js on aws with ci/cd",
+            "objective-c and c developer. r, go, sql server, .net core, next.js",
+            "c++x c#1 x.net node.jsx ai-driven data science/big data machine learning",
+        ]
+        for text in texts:
+            expected = sorted((start, end, index.lookup(keyword)) for start, end, keyword in matcher.iter_matches(text))
+            self.assertEqual(sorted(index.iter_text_matches(text)), expected, text)
+
+    def test_extractor_returns_canonical_names(self):
+        """Test that skill extraction with a taxonomy reports canonical names."""
+        extractor = SkillExtractor(taxonomy=self.index, use_nlp=False)
+        result = extractor.extract("Ran K8s and Postgres. Strong leadership and stakeholder management.\n"
+                                   "Skills: psql, Go")
+
+        self.assertEqual(result["technical_skills"], ["golang", "kubernetes", "leadership", "postgresql"])
+        self.assertEqual(result["soft_skills"], ["leadership", "stakeholder management"])
+
+    def test_invalid_inputs(self):
+        """Test that bad categories and files that are not indexes are rejected."""
+        with open(self.source, "w", encoding="utf-8") as file:
+            file.write("skill,category,aliases\npython,language,\n")
+        with self.assertRaises(ValueError):
+            compile_taxonomy(self.source, self.index_path)
+        with self.assertRaises(ValueError):
+            SkillIndex(b"not an index at all, just some bytes")
+
+    def test_default_index_from_environment(self):
+        """Test that RESUME_SKILL_TAXONOMY selects the index and a bad path falls back."""
+        with patch.dict(os.environ, {TAXONOMY_ENV_VAR: self.index_path}):
+            index = default_skill_index()
+            self.assertEqual(index.canonical("kube"), "kubernetes")
+            index.close()
+        with patch.dict(os.environ, {TAXONOMY_ENV_VAR: self.source}), redirect_stdout(io.StringIO()) as output:
+            self.assertIsNone(default_skill_index())
+        self.assertIn("Warning:", output.getvalue())
+        with patch.dict(os.environ, {TAXONOMY_ENV_VAR: ""}):
+            self.assertIsNone(default_skill_index())
+
+    def test_command_line(self):
+        """Test compiling a taxonomy from the command line."""
+        index_path = os.path.join(self.directory.name, "cli.idx")
+        with redirect_stderr(io.StringIO()):
+            self.assertEqual(main([self.source, index_path]), 0)
+        index = SkillIndex.open(index_path)
+        self.assertEqual(index.canonical("psql"), "postgresql")
+        index.close()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import unittest
+import io
+import time
+import threading
+import zipfile
+from unittest.mock import patch
+from app.utils.extraction_cache import ExtractionCache
+from app.utils import upload_guard
+from app.utils.parse_resume import extract_resume_cached, extract_resume_text
+from app.utils.upload_guard import (
+    UploadRejectedError, check_resume_upload, extract_resume_text_guarded, run_with_timeout, sniff_resume_type
+)
+from tests.helpers import docx_bytes, pdf_bytes
+
+def slow_echo(value, seconds):
+    """Return value after sleeping; stands in for a slow but legitimate extraction."""
+    time.sleep(seconds)
+    return value
+
+def make_zip(members):
+    """Build a zip archive from a {name: bytes} mapping."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+class TestUploadGuard(unittest.TestCase):
+    """Test cases for guarded resume extraction."""
+
+    def setUp(self):
+        self.pdf = pdf_bytes(["Page one text", "Page two text", "Page three text"])
+        self.docx = docx_bytes("Jane Doe", "SKILLS", "Python")
+
+    def test_sniff_resume_type(self):
+        """Test magic-byte detection."""
+        self.assertEqual(sniff_resume_type(self.pdf[:1024]), "pdf")
+        self.assertEqual(sniff_resume_type(self.docx[:1024]), "docx")
+        self.assertIsNone(sniff_resume_type(b"\xd0\xcf\x11\xe0 legacy .doc"))
+
+    def test_rejects_before_parsing(self):
+        """Test that size, type and archive checks reject bad uploads."""
+        rejected = [
+            (self.pdf, "resume.pdf", {"max_bytes": 100}),
+            (self.pdf, "resume.docx", {}),
+            (self.docx, "resume.pdf", {}),
+            (b"", "resume.pdf", {}),
+            (self.pdf, "resume.txt", {}),
+            (make_zip({"hello.txt": b"hi"}), "resume.docx", {}),
+            (make_zip({"word/document.xml": b"\0" * (2 * 1024 * 1024)}), "resume.docx", {}),
+            (self.docx, "resume.docx", {"max_docx_bytes": 1024}),
+        ]
+        for data, filename, limits in rejected:
+            with self.subTest(filename=filename, limits=limits):
+                with self.assertRaises(UploadRejectedError):
+                    check_resume_upload(io.BytesIO(data), filename, **limits)
+
+        self.assertEqual(check_resume_upload(io.BytesIO(self.pdf), "resume.pdf"), "pdf")
+        self.assertEqual(check_resume_upload(io.BytesIO(self.docx), "resume.docx"), "docx")
+
+    def test_guarded_extraction_matches_plain(self):
+        """Test that guarded extraction returns the same text from a subprocess."""
+        for data, filename in ((self.pdf, "resume.pdf"), (self.docx, "resume.docx")):
+            with self.subTest(filename=filename):
+                expected = extract_resume_text(io.BytesIO(data), filename)
+                self.assertEqual(extract_resume_text_guarded(io.BytesIO(data), filename, timeout=30), expected)
+
+        text, sections = extract_resume_cached(io.BytesIO(self.docx), "resume.docx", cache=ExtractionCache(), guarded=True)
+        self.assertEqual(sections["skills"], "Python")
+
+    def test_cached_extraction_checks_once(self):
+        """Test that guarded cached extraction validates each upload a single time."""
+        with patch("app.utils.parse_resume.check_resume_upload", wraps=check_resume_upload) as outer, \
+                patch.object(upload_guard, "check_resume_upload", wraps=check_resume_upload) as inner:
+            for data, filename in ((self.pdf, "resume.pdf"), (self.docx, "resume.docx")):
+                extract_resume_cached(io.BytesIO(data), filename, cache=ExtractionCache(), guarded=True)
+        self.assertEqual(outer.call_count, 2)
+        inner.assert_not_called()
+
+    def test_page_limit(self):
+        """Test that PDFs over the page limit are rejected."""
+        with self.assertRaises(UploadRejectedError):
+            extract_resume_text_guarded(io.BytesIO(self.pdf), "resume.pdf", page_limit=2, timeout=30)
+        with self.assertRaises(UploadRejectedError):
+            extract_resume_text_guarded(io.BytesIO(self.pdf), "resume.pdf", page_limit=2, timeout=None)
+
+    def test_timeout_kills_extraction(self):
+        """Test that a slow extraction is abandoned after the timeout."""
+        started = time.perf_counter()
+        with self.assertRaises(UploadRejectedError):
+            run_with_timeout(time.sleep, (30,), timeout=0.5)
+        self.assertLess(time.perf_counter() - started, 10)
+
+        with self.assertRaises(ZeroDivisionError):
+            run_with_timeout(divmod, (1, 0), timeout=10)
+
+    def test_timeout_spares_concurrent_uploads(self):
+        """Test that killing one overrunning upload leaves uploads running beside it untouched."""
+        results = {}
+
+        def run(name, func, *args):
+            try:
+                results[name] = func(*args)
+            except Exception as e:
+                results[name] = e
+
+        threads = [
+            threading.Thread(target=run, args=("slow", run_with_timeout, slow_echo, ("done", 1.5), 30)),
+            threading.Thread(target=run, args=("pdf", extract_resume_text_guarded, io.BytesIO(self.pdf), "resume.pdf")),
+            threading.Thread(target=run, args=("hostile", run_with_timeout, time.sleep, (30,), 0.2)),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results["slow"], "done")
+        self.assertEqual(results["pdf"], extract_resume_text(io.BytesIO(self.pdf), "resume.pdf"))
+        self.assertIsInstance(results["hostile"], UploadRejectedError)
+        self.assertIn("took longer than 0.2 seconds", str(results["hostile"]))
+
+if __name__ == "__main__":
+    unittest.main()